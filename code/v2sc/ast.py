@@ -12,20 +12,85 @@ from __future__ import print_function
 import sys
 import re
 
+def walk(node, pre=None, post=None):
+    """
+    Iterative depth-first traversal of the subtree under node.
+    pre(node) is called before the children of node and may return False to
+    skip them, post(node) is called after all of them. The depth of the tree
+    is not bounded by the Python recursion limit.
+    """
+    stack = [ (node, False) ]
+    while stack:
+        node, done = stack.pop()
+        if done:
+            post(node)
+            continue
+        if pre is not None and pre(node) is False:
+            continue
+        if post is not None:
+            stack.append( (node, True) )
+        children = node.children()
+        if children:
+            stack.extend([ (c, False) for c in reversed(children) ])
+
+def invalidate_hashes():
+    """
+    Drop every cached structural hash. Call it after modifying a node that
+    has been hashed, e.g. before hashing the edited tree again.
+    """
+    Node.mutations += 1
+
+_fields = {}
+def fields(cls):
+    """ names of the slots of a node class, including lineno but not the cached hash """
+    names = _fields.get(cls)
+    if names is None:
+        names = []
+        for c in reversed(cls.__mro__):
+            for name in c.__dict__.get('__slots__', ()):
+                if name != 'hash_cache':
+                    names.append(name)
+        names = tuple(names)
+        _fields[cls] = names
+    return names
+
 class Node(object):
     '''Abstact class for every element in parser'''
-    
+    # every subclass declares the fields set by its __init__ as __slots__
+    __slots__ = ('lineno', 'hash_cache')
+
+    # structural hashes are cached on the nodes as (mutations, hash), valid
+    # until the next invalidate_hashes(). Assignments are not watched, so a
+    # node must not be modified while its hash is in use.
+    mutations = 0
+
     def children(self):
         pass
-    
+
+    def __getstate__(self):
+        # cached hashes depend on the string hashing of this process
+        return dict([ (name, getattr(self, name)) for name in fields(self.__class__)
+                      if hasattr(self, name) ])
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def show(self, buf=sys.stdout, offset=0, attrnames=False, showlineno=True):
         indent = 2
+        stack = [ (self, offset) ]
+        while stack:
+            node, offset = stack.pop()
+            node.show_node(buf, offset, attrnames, showlineno)
+            stack.extend([ (c, offset + indent) for c in reversed(node.children()) ])
+
+    def show_node(self, buf=sys.stdout, offset=0, attrnames=False, showlineno=True):
         lead = ' ' * offset
         buf.write(lead + self.__class__.__name__ + ': ')
         if self.attr_names:
             if attrnames:
                 nvlist = [(n, getattr(self,n)) for n in self.attr_names]
-                attrstr = ', '.join('%s=%s' & nv for nv in nvlist)
+                attrstr = ', '.join('%s=%s' % nv for nv in nvlist)
             else:
                 vlist = [getattr(self,n) for n in self.attr_names]
                 attrstr = ', '.join('%s' % v for v in vlist)
@@ -33,29 +98,44 @@ class Node(object):
         if showlineno:
             buf.write(' (at %s)' % self.lineno)
         buf.write('\n')
-        for c in self.children():
-            c.show(buf, offset + indent, attrnames, showlineno)
             
     def __eq__(self, other):
-        if type(self) != type(other): return False
-        self_attrs = tuple( [ getattr(self, a) for a in self.attr_names ] )
-        other_attrs = tuple( [ getattr(other, a) for a in other.attr_names ] )
-        if self_attrs != other_attrs: return False
-        other_children = other.children()
-        for i, c in enumerate(self.children()):
-            if c != other_children[i]: return False
+        stack = [ (self, other) ]
+        while stack:
+            a, b = stack.pop()
+            if a is b: continue
+            if type(a) != type(b): return False
+            a_attrs = tuple( [ getattr(a, n) for n in a.attr_names ] )
+            b_attrs = tuple( [ getattr(b, n) for n in b.attr_names ] )
+            if a_attrs != b_attrs: return False
+            a_children = a.children()
+            b_children = b.children()
+            if len(a_children) != len(b_children): return False
+            stack.extend(zip(a_children, b_children))
         return True
     
     def __ne__(self, other):
         return not self.__eq__(other)
     
     def __hash__(self):
-        s = hash(tuple([getattr(self, a) for a in self.attr_names]))
-        c = hash(self.children())
-        return hash((s, c))
+        mutations = Node.mutations
+        cache = getattr(self, 'hash_cache', None)
+        if cache is not None and cache[0] == mutations:
+            return cache[1]
+        def pre(node):
+            # subtrees hashed since the last invalidation are not visited again
+            cache = getattr(node, 'hash_cache', None)
+            return cache is None or cache[0] != mutations
+        def post(node):
+            s = hash(tuple([getattr(node, a) for a in node.attr_names]))
+            c = hash(tuple([child.hash_cache[1] for child in node.children()]))
+            node.hash_cache = (mutations, hash((s, c)))
+        walk(self, pre, post)
+        return self.hash_cache[1]
 
 ################################################################################
 class Source(Node):
+    __slots__ = ('name', 'description')
     attr_names = ('name',)
     def __init__(self, name, description, lineno=0):
         self.lineno = lineno
@@ -67,6 +147,7 @@ class Source(Node):
         return tuple(nodelist)
 
 class Description(Node):
+    __slots__ = ('definitions',)
     attr_names = ()
     def __init__(self, definitions, lineno=0):
         self.lineno = lineno
@@ -77,6 +158,7 @@ class Description(Node):
         return tuple(nodelist)
 
 class ModuleDef(Node):
+    __slots__ = ('name', 'paramlist', 'portlist', 'items', 'default_nettype', 'end_lineno')
     attr_names = ('name',)
     def __init__(self, name, paramlist, portlist, items, default_nettype='wire', lineno=0):
         self.lineno = lineno
@@ -93,6 +175,7 @@ class ModuleDef(Node):
         return tuple(nodelist)
 
 class Paramlist(Node):
+    __slots__ = ('params',)
     attr_names = ()
     def __init__(self, params, lineno=0):
         self.lineno = lineno
@@ -103,6 +186,7 @@ class Paramlist(Node):
         return tuple(nodelist)
 
 class Portlist(Node):
+    __slots__ = ('ports',)
     attr_names = ()
     def __init__(self, ports, lineno=0):
         self.lineno = lineno
@@ -113,6 +197,7 @@ class Portlist(Node):
         return tuple(nodelist)
 
 class Port(Node):
+    __slots__ = ('name', 'width', 'type')
     attr_names = ('name','type',)
     def __init__(self, name, width, type, lineno=0):
         self.lineno = lineno
@@ -125,6 +210,7 @@ class Port(Node):
         return tuple(nodelist)
 
 class Width(Node):
+    __slots__ = ('msb', 'lsb')
     attr_names = ()
     def __init__(self, msb, lsb, lineno=0):
         self.lineno = lineno
@@ -135,9 +221,10 @@ class Width(Node):
         if self.msb: nodelist.append(self.msb)
         if self.lsb: nodelist.append(self.lsb)
         return tuple(nodelist)
-class Length(Width): pass
+class Length(Width): __slots__ = ()
 
 class Identifier(Node):
+    __slots__ = ('name', 'scope')
     attr_names = ('name',)
     def __init__(self, name, scope=None, lineno=0):
         self.lineno = lineno
@@ -153,6 +240,7 @@ class Identifier(Node):
         return self.scope.__repr__() + '.' + self.name
 
 class Value(Node):
+    __slots__ = ('value',)
     attr_names = ()
     def __init__(self, value, lineno=0):
         self.lineno = lineno
@@ -163,6 +251,7 @@ class Value(Node):
         return tuple(nodelist)
 
 class Constant(Value):
+    __slots__ = ()
     attr_names = ('value',)
     def __init__(self, value, lineno=0):
         self.lineno = lineno
@@ -173,11 +262,12 @@ class Constant(Value):
     def __repr__(self):
         return str(self.value)
 
-class IntConst(Constant): pass
-class FloatConst(Constant): pass
-class StringConst(Constant): pass
+class IntConst(Constant): __slots__ = ()
+class FloatConst(Constant): __slots__ = ()
+class StringConst(Constant): __slots__ = ()
 
 class Variable(Value):
+    __slots__ = ('name', 'width', 'signed')
     attr_names = ('name', 'signed')
     def __init__(self, name, width=None, signed=False, lineno=0):
         self.lineno = lineno
@@ -189,13 +279,14 @@ class Variable(Value):
         if self.width: nodelist.append(self.width)
         return tuple(nodelist)
 
-class Input(Variable): pass
-class Output(Variable): pass
-class Inout(Variable): pass
-class Tri(Variable): pass
-class Wire(Variable): pass
-class Reg(Variable): pass
+class Input(Variable): __slots__ = ()
+class Output(Variable): __slots__ = ()
+class Inout(Variable): __slots__ = ()
+class Tri(Variable): __slots__ = ()
+class Wire(Variable): __slots__ = ()
+class Reg(Variable): __slots__ = ()
 class WireArray(Variable):
+    __slots__ = ('length',)
     attr_names = ('name', 'signed')
     def __init__(self, name, width, length, signed=False, lineno=0):
         self.lineno = lineno
@@ -209,6 +300,7 @@ class WireArray(Variable):
         if self.length: nodelist.append(self.length)
         return tuple(nodelist)
 class RegArray(Variable):
+    __slots__ = ('length',)
     attr_names = ('name', 'signed')
     def __init__(self, name, width, length, signed=False, lineno=0):
         self.lineno = lineno
@@ -221,11 +313,12 @@ class RegArray(Variable):
         if self.width: nodelist.append(self.width)
         if self.length: nodelist.append(self.length)
         return tuple(nodelist)
-class Integer(Variable): pass
-class Real(Variable): pass
-class Genvar(Variable): pass
+class Integer(Variable): __slots__ = ()
+class Real(Variable): __slots__ = ()
+class Genvar(Variable): __slots__ = ()
 
 class Ioport(Node):
+    __slots__ = ('first', 'second')
     attr_names = ()
     def __init__(self, first, second=None, lineno=0):
         self.lineno = lineno
@@ -238,6 +331,7 @@ class Ioport(Node):
         return tuple(nodelist)
 
 class Parameter(Node):
+    __slots__ = ('name', 'value', 'width', 'signed')
     attr_names = ('name', 'signed')
     def __init__(self, name, value, width=None, signed=False, lineno=0):
         self.lineno = lineno
@@ -250,10 +344,11 @@ class Parameter(Node):
         if self.value: nodelist.append(self.value)
         if self.width: nodelist.append(self.width)
         return tuple(nodelist)
-class Localparam(Parameter): pass
-class Supply(Parameter) : pass
+class Localparam(Parameter): __slots__ = ()
+class Supply(Parameter): __slots__ = ()
 
 class Decl(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -264,6 +359,7 @@ class Decl(Node):
         return tuple(nodelist)
 
 class Concat(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -272,9 +368,10 @@ class Concat(Node):
         nodelist = []
         if self.list: nodelist.extend(self.list)
         return tuple(nodelist)
-class LConcat(Concat): pass
+class LConcat(Concat): __slots__ = ()
 
 class Repeat(Node):
+    __slots__ = ('value', 'times')
     attr_names = ()
     def __init__(self, value, times, lineno=0):
         self.lineno = lineno
@@ -287,6 +384,7 @@ class Repeat(Node):
         return tuple(nodelist)
 
 class Partselect(Node):
+    __slots__ = ('var', 'msb', 'lsb')
     attr_names = ()
     def __init__(self, var, msb, lsb, lineno=0):
         self.lineno = lineno
@@ -301,6 +399,7 @@ class Partselect(Node):
         return tuple(nodelist)
 
 class Pointer(Node):
+    __slots__ = ('var', 'ptr')
     attr_names = ()
     def __init__(self, var, ptr, lineno=0):
         self.lineno = lineno
@@ -313,6 +412,7 @@ class Pointer(Node):
         return tuple(nodelist)
 
 class Lvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
     def __init__(self, var, lineno=0):
         self.lineno = lineno
@@ -323,6 +423,7 @@ class Lvalue(Node):
         return tuple(nodelist)
 
 class Rvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
     def __init__(self, var, lineno=0):
         self.lineno = lineno
@@ -334,6 +435,7 @@ class Rvalue(Node):
 
 ################################################################################
 class Operator(Node):
+    __slots__ = ('left', 'right')
     attr_names = ()
     def __init__(self, left, right, lineno=0):
         self.lineno = lineno
@@ -351,6 +453,7 @@ class Operator(Node):
         return ret
 
 class UnaryOperator(Operator):
+    __slots__ = ()
     attr_names = ()
     def __init__(self, right, lineno=0):
         self.lineno = lineno
@@ -362,60 +465,61 @@ class UnaryOperator(Operator):
 
 ################################################################################
 # Level 1 (Highest Priority)
-class Uplus(UnaryOperator): pass
-class Uminus(UnaryOperator): pass
-class Ulnot(UnaryOperator): pass
-class Unot(UnaryOperator): pass
-class Uand(UnaryOperator): pass
-class Unand(UnaryOperator): pass
-class Uor(UnaryOperator): pass
-class Unor(UnaryOperator): pass
-class Uxor(UnaryOperator): pass
-class Uxnor(UnaryOperator): pass
+class Uplus(UnaryOperator): __slots__ = ()
+class Uminus(UnaryOperator): __slots__ = ()
+class Ulnot(UnaryOperator): __slots__ = ()
+class Unot(UnaryOperator): __slots__ = ()
+class Uand(UnaryOperator): __slots__ = ()
+class Unand(UnaryOperator): __slots__ = ()
+class Uor(UnaryOperator): __slots__ = ()
+class Unor(UnaryOperator): __slots__ = ()
+class Uxor(UnaryOperator): __slots__ = ()
+class Uxnor(UnaryOperator): __slots__ = ()
 ################################################################################
 # Level 2
-class Power(Operator): pass
-class Times(Operator): pass
-class Divide(Operator): pass
-class Mod(Operator): pass
+class Power(Operator): __slots__ = ()
+class Times(Operator): __slots__ = ()
+class Divide(Operator): __slots__ = ()
+class Mod(Operator): __slots__ = ()
 ################################################################################
 # Level 3
-class Plus(Operator): pass
-class Minus(Operator): pass
+class Plus(Operator): __slots__ = ()
+class Minus(Operator): __slots__ = ()
 ################################################################################
 # Level 4
-class Sll(Operator): pass
-class Srl(Operator): pass
-class Sra(Operator): pass
+class Sll(Operator): __slots__ = ()
+class Srl(Operator): __slots__ = ()
+class Sra(Operator): __slots__ = ()
 ################################################################################
 # Level 5
-class LessThan(Operator): pass
-class GreaterThan(Operator): pass
-class LessEq(Operator): pass
-class GreaterEq(Operator): pass
+class LessThan(Operator): __slots__ = ()
+class GreaterThan(Operator): __slots__ = ()
+class LessEq(Operator): __slots__ = ()
+class GreaterEq(Operator): __slots__ = ()
 ################################################################################
 # Level 6
-class Eq(Operator): pass
-class NotEq(Operator): pass
-class Eql(Operator): pass # ===
-class NotEql(Operator): pass # !==
+class Eq(Operator): __slots__ = ()
+class NotEq(Operator): __slots__ = ()
+class Eql(Operator): __slots__ = () # ===
+class NotEql(Operator): __slots__ = () # !==
 ################################################################################
 # Level 7
-class And(Operator): pass
-class Xor(Operator): pass
-class Xnor(Operator): pass
+class And(Operator): __slots__ = ()
+class Xor(Operator): __slots__ = ()
+class Xnor(Operator): __slots__ = ()
 ################################################################################
 # Level 8
-class Or(Operator): pass
+class Or(Operator): __slots__ = ()
 ################################################################################
 # Level 9
-class Land(Operator): pass
+class Land(Operator): __slots__ = ()
 ################################################################################
 # Level 10
-class Lor(Operator): pass
+class Lor(Operator): __slots__ = ()
 ################################################################################
 # Level 11
 class Cond(Operator):
+    __slots__ = ('cond', 'true_value', 'false_value')
     attr_names = ()
     def __init__(self, cond, true_value, false_value, lineno=0):
         self.lineno = lineno
@@ -431,6 +535,7 @@ class Cond(Operator):
 
 ################################################################################
 class Assign(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay')
     attr_names = ()
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
         self.lineno = lineno
@@ -447,6 +552,7 @@ class Assign(Node):
         return tuple(nodelist)
 
 class Always(Node):
+    __slots__ = ('sens_list', 'statement')
     attr_names = ()
     def __init__(self, sens_list, statement, lineno=0):
         self.lineno = lineno
@@ -459,6 +565,7 @@ class Always(Node):
         return tuple(nodelist)
 
 class SensList(Node):
+    __slots__ = ('list',)
     attr_names = ()
     def __init__(self, list, lineno=0):
         self.lineno = lineno
@@ -469,6 +576,7 @@ class SensList(Node):
         return tuple(nodelist)
 
 class Sens(Node):
+    __slots__ = ('sig', 'type')
     attr_names = ('type',)
     def __init__(self, sig, type='posedge', lineno=0):
         self.lineno = lineno
@@ -480,6 +588,7 @@ class Sens(Node):
         return tuple(nodelist)
 
 class Substitution(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay')
     attr_names = ()
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
         self.lineno = lineno
@@ -494,10 +603,11 @@ class Substitution(Node):
         if self.ldelay: nodelist.append(self.ldelay)
         if self.rdelay: nodelist.append(self.rdelay)
         return tuple(nodelist)
-class BlockingSubstitution(Substitution): pass
-class NonblockingSubstitution(Substitution): pass
+class BlockingSubstitution(Substitution): __slots__ = ()
+class NonblockingSubstitution(Substitution): __slots__ = ()
 
 class IfStatement(Node):
+    __slots__ = ('cond', 'true_statement', 'false_statement')
     attr_names = ()
     def __init__(self, cond, true_statement, false_statement, lineno=0):
         self.lineno = lineno
@@ -512,6 +622,7 @@ class IfStatement(Node):
         return tuple(nodelist)
 
 class ForStatement(Node):
+    __slots__ = ('pre', 'cond', 'post', 'statement')
     attr_names = ()
     def __init__(self, pre, cond, post, statement, lineno=0):
         self.lineno = lineno
@@ -528,6 +639,7 @@ class ForStatement(Node):
         return tuple(nodelist)
 
 class WhileStatement(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -540,6 +652,7 @@ class WhileStatement(Node):
         return tuple(nodelist)
 
 class CaseStatement(Node):
+    __slots__ = ('comp', 'caselist')
     attr_names = ()
     def __init__(self, comp, caselist, lineno=0):
         self.lineno = lineno
@@ -551,9 +664,10 @@ class CaseStatement(Node):
         if self.caselist: nodelist.extend(self.caselist)
         return tuple(nodelist)
 
-class CasexStatement(CaseStatement): pass
+class CasexStatement(CaseStatement): __slots__ = ()
 
 class Case(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -566,6 +680,7 @@ class Case(Node):
         return tuple(nodelist)
 
 class Block(Node):
+    __slots__ = ('statements', 'scope')
     attr_names = ('scope',)
     def __init__(self, statements, scope=None, lineno=0):
         self.lineno = lineno
@@ -577,6 +692,7 @@ class Block(Node):
         return tuple(nodelist)
 
 class Initial(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
@@ -587,6 +703,7 @@ class Initial(Node):
         return tuple(nodelist)
 
 class EventStatement(Node):
+    __slots__ = ('senslist',)
     attr_names = ()
     def __init__(self, senslist, lineno=0):
         self.lineno = lineno
@@ -597,6 +714,7 @@ class EventStatement(Node):
         return tuple(nodelist)
 
 class WaitStatement(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
     def __init__(self, cond, statement, lineno=0):
         self.lineno = lineno
@@ -609,6 +727,7 @@ class WaitStatement(Node):
         return tuple(nodelist)
 
 class ForeverStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
@@ -619,6 +738,7 @@ class ForeverStatement(Node):
         return tuple(nodelist)
 
 class DelayStatement(Node):
+    __slots__ = ('delay',)
     attr_names = ()
     def __init__(self, delay, lineno=0):
         self.lineno = lineno
@@ -629,6 +749,7 @@ class DelayStatement(Node):
         return tuple(nodelist)
 
 class InstanceList(Node):
+    __slots__ = ('module', 'parameterlist', 'instances')
     attr_names = ('module',)
     def __init__(self, module, parameterlist, instances, lineno=0):
         self.lineno = lineno
@@ -642,6 +763,7 @@ class InstanceList(Node):
         return tuple(nodelist)
 
 class Instance(Node):
+    __slots__ = ('module', 'name', 'portlist', 'parameterlist', 'array')
     attr_names = ('name', 'module')
     def __init__(self, module, name, portlist, parameterlist, array=None, lineno=0):
         self.lineno = lineno
@@ -658,6 +780,7 @@ class Instance(Node):
         return tuple(nodelist)
 
 class ParamArg(Node):
+    __slots__ = ('paramname', 'argname')
     attr_names = ('paramname',)
     def __init__(self, paramname, argname, lineno=0):
         self.lineno = lineno
@@ -669,6 +792,7 @@ class ParamArg(Node):
         return tuple(nodelist)
 
 class PortArg(Node):
+    __slots__ = ('portname', 'argname')
     attr_names = ('portname',)
     def __init__(self, portname, argname, lineno=0):
         self.lineno = lineno
@@ -680,6 +804,7 @@ class PortArg(Node):
         return tuple(nodelist)
 
 class Function(Node):
+    __slots__ = ('name', 'retwidth', 'statement')
     attr_names = ('name',)
     def __init__(self, name, retwidth, statement, lineno=0):
         self.lineno = lineno
@@ -695,6 +820,7 @@ class Function(Node):
         return self.name.__repr__()
 
 class FunctionCall(Node):
+    __slots__ = ('name', 'args')
     attr_names = ()
     def __init__(self, name, args, lineno=0):
         self.lineno = lineno
@@ -709,6 +835,7 @@ class FunctionCall(Node):
         return self.name.__repr__()
 
 class Task(Node):
+    __slots__ = ('name', 'statement')
     attr_names = ('name',)
     def __init__(self, name, statement, lineno=0):
         self.lineno = lineno
@@ -720,6 +847,7 @@ class Task(Node):
         return tuple(nodelist)
 
 class TaskCall(Node):
+    __slots__ = ('name', 'args')
     attr_names = ()
     def __init__(self, name, args, lineno=0):
         self.lineno = lineno
@@ -732,6 +860,7 @@ class TaskCall(Node):
         return tuple(nodelist)
 
 class GenerateStatement(Node):
+    __slots__ = ('items',)
     attr_names = ()
     def __init__(self, items, lineno=0):
         self.lineno = lineno
@@ -742,6 +871,7 @@ class GenerateStatement(Node):
         return tuple(nodelist)
 
 class SystemCall(Node):
+    __slots__ = ('syscall', 'args')
     attr_names = ('syscall',)
     def __init__(self, syscall, args, lineno=0):
         self.lineno = lineno
@@ -763,6 +893,7 @@ class SystemCall(Node):
         return ''.join(ret)
 
 class IdentifierScopeLabel(Node):
+    __slots__ = ('name', 'loop')
     attr_names = ('name', 'loop')
     def __init__(self, name, loop=None, lineno=0):
         self.lineno = lineno
@@ -773,6 +904,7 @@ class IdentifierScopeLabel(Node):
         return tuple(nodelist)
 
 class IdentifierScope(Node):
+    __slots__ = ('labellist',)
     attr_names = ()
     def __init__(self, labellist, lineno=0):
         self.lineno = lineno
@@ -783,6 +915,7 @@ class IdentifierScope(Node):
         return tuple(nodelist)
 
 class Pragma(Node):
+    __slots__ = ('entry',)
     attr_names = ()
     def __init__(self, entry, lineno=0):
         self.lineno = lineno
@@ -793,6 +926,7 @@ class Pragma(Node):
         return tuple(nodelist)
 
 class PragmaEntry(Node):
+    __slots__ = ('name', 'value')
     attr_names = ('name', )
     def __init__(self, name, value=None, lineno=0):
         self.lineno = lineno
@@ -804,6 +938,7 @@ class PragmaEntry(Node):
         return tuple(nodelist)
 
 class Disable(Node):
+    __slots__ = ('dest',)
     attr_names = ('dest',)
     def __init__(self, dest, lineno=0):
         self.lineno = lineno
@@ -813,6 +948,7 @@ class Disable(Node):
         return tuple(nodelist)
 
 class ParallelBlock(Node):
+    __slots__ = ('statements', 'scope')
     attr_names = ('scope',)
     def __init__(self, statements, scope=None, lineno=0):
         self.lineno = lineno
@@ -824,6 +960,7 @@ class ParallelBlock(Node):
         return tuple(nodelist)
 
 class SingleStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
     def __init__(self, statement, lineno=0):
         self.lineno = lineno
@@ -0,0 +1,67 @@
+#-------------------------------------------------------------------------------
+# benchmark_indent.py
+#
+# Indentation cost on a synthetic deeply nested if/else chain:
+# per-level textwrap.indent vs deferred single-pass indentation
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import textwrap
+import functools
+import timeit
+from optparse import OptionParser
+
+# the next line can be removed after installation
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyverilog.vparser.ast import *
+from v2sc import ASTCodeGenerator
+
+def nested_ifelse(depth):
+    statement = NonblockingSubstitution(Lvalue(Identifier('x')), Rvalue(IntConst(str(depth))))
+    for i in reversed(range(depth)):
+        cond = Eq(Identifier('s'), IntConst(str(i)))
+        true_statement = NonblockingSubstitution(Lvalue(Identifier('x')), Rvalue(IntConst(str(i))))
+        statement = Block([ IfStatement(cond, true_statement, statement) ])
+    senslist = SensList([ Sens(Identifier('CLK'), 'posedge') ])
+    items = [ Decl([ Input('CLK'), Input('s', Width(IntConst('31'), IntConst('0'))) ]),
+              Decl([ Reg('x', Width(IntConst('31'), IntConst('0'))) ]),
+              Always(senslist, statement) ]
+    portlist = Portlist([ Port('CLK', None, None), Port('s', None, None) ])
+    moduledef = ModuleDef('deep', None, portlist, items)
+    return Source('deep', Description([ moduledef ]))
+
+def main():
+    USAGE = "Usage: python benchmark_indent.py [-d depth] [-n repeat]"
+
+    optparser = OptionParser(usage=USAGE)
+    optparser.add_option("-d","--depth",dest="depth",type="int",
+                         default=200,help="Nesting depth of the if/else chain")
+    optparser.add_option("-n","--repeat",dest="repeat",type="int",
+                         default=5,help="Number of repetitions")
+    (options, args) = optparser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), options.depth * 20))
+    ast = nested_ifelse(options.depth)
+
+    codegen = ASTCodeGenerator()
+    legacy = ASTCodeGenerator()
+    legacy.indent = functools.partial(textwrap.indent, prefix=legacy.indentprefix)
+
+    rslt = codegen.visit(ast)
+    if rslt != legacy.visit(ast):
+        raise ValueError("deferred indentation differs from textwrap.indent")
+
+    before = min(timeit.repeat(lambda: legacy.visit(ast), number=options.repeat, repeat=3))
+    after = min(timeit.repeat(lambda: codegen.visit(ast), number=options.repeat, repeat=3))
+
+    print('depth            : %d' % options.depth)
+    print('output           : %d bytes, %d lines' % (len(rslt), rslt.count('\n') + 1))
+    print('per-level indent : %.3f ms' % (before / options.repeat * 1e3))
+    print('deferred indent  : %.3f ms' % (after / options.repeat * 1e3))
+    print('speedup          : %.1fx' % (before / after))
+
+if __name__ == '__main__':
+    main()
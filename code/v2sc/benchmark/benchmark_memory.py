@@ -0,0 +1,125 @@
+#-------------------------------------------------------------------------------
+# benchmark_memory.py
+#
+# Memory footprint of the AST on a synthetic flat netlist:
+# slotted node classes vs the same classes with a per-instance __dict__,
+# and the array-backed columnar store
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import gc
+import functools
+import resource
+import tracemalloc
+from optparse import OptionParser
+
+# the next line can be removed after installation
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyverilog.vparser.ast as ast
+from array import array
+from columnar import ColumnarAST, NodeRef, NodeSequence, LIST
+
+NETLIST_CLASSES = ('Source', 'Description', 'ModuleDef', 'InstanceList',
+                   'Instance', 'PortArg', 'Identifier')
+
+def dict_classes():
+    """ the netlist classes as they were before __slots__, sharing the same __init__ """
+    classes = {}
+    for name in NETLIST_CLASSES:
+        cls = getattr(ast, name)
+        classes[name] = type(name, (object,), { '__init__' : cls.__init__ })
+    return classes
+
+def slot_classes():
+    return dict([ (name, getattr(ast, name)) for name in NETLIST_CLASSES ])
+
+def iter_names(instances, ports):
+    for i in range(instances):
+        yield 'u%d' % i, [ ('P%d' % p, 'n%d_%d' % (i, p)) for p in range(ports) ]
+
+def netlist_names(instances, ports):
+    return list(iter_names(instances, ports))
+
+def netlist(c, names):
+    """ one module with instances of a cell, each port tied to its own net """
+    items = []
+    for name, ports in names:
+        portlist = [ c['PortArg'](port, c['Identifier'](net)) for port, net in ports ]
+        instance = c['Instance']('cell', name, portlist, ())
+        items.append(c['InstanceList']('cell', (), [ instance ]))
+    moduledef = c['ModuleDef']('top', None, None, items)
+    return c['Source']('top', c['Description']([ moduledef ]))
+
+def columnar_netlist(names):
+    """ the same netlist added to a columnar store one instance at a time """
+    store = ColumnarAST()
+    items = array('I')
+    for name, ports in names:
+        portlist = [ ast.PortArg(port, ast.Identifier(net)) for port, net in ports ]
+        instance = ast.Instance('cell', name, portlist, ())
+        items.append(store.extend(ast.InstanceList('cell', (), [ instance ])))
+    moduledef = store.add(ast.ModuleDef, 'top', None, None, NodeSequence(store, items, LIST))
+    description = store.add(ast.Description, [ NodeRef(moduledef) ])
+    store.add(ast.Source, 'top', NodeRef(description))
+    return store
+
+def count_nodes(instances, ports):
+    return 3 + instances * (2 + 2 * ports)
+
+def bytes_per_node(build, instances, ports):
+    """ memory allocated per node, the names being allocated beforehand """
+    names = netlist_names(instances, ports)
+    gc.collect()
+    tracemalloc.start()
+    tree = build(names)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return float(size) / count_nodes(instances, ports)
+
+def peak_rss():
+    """ peak resident set size of this process in MB """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return rss / 1024.0 / 1024.0
+    return rss / 1024.0
+
+def main():
+    USAGE = "Usage: python benchmark_memory.py [-n instances] [-p ports] [--dict|--columnar]"
+
+    optparser = OptionParser(usage=USAGE)
+    optparser.add_option("-n","--instances",dest="instances",type="int",
+                         default=1000000,help="Number of instances in the netlist")
+    optparser.add_option("-p","--ports",dest="ports",type="int",
+                         default=2,help="Number of ports of each instance")
+    optparser.add_option("-s","--sample",dest="sample",type="int",
+                         default=10000,help="Number of instances measured for bytes per node")
+    optparser.add_option("--dict",action="store_const",dest="layout",const="__dict__",
+                         default="__slots__",help="Build the full netlist with __dict__ nodes")
+    optparser.add_option("--columnar",action="store_const",dest="layout",const="columnar",
+                         help="Build the full netlist in a columnar store")
+    (options, args) = optparser.parse_args()
+
+    builders = {
+        '__dict__' : functools.partial(netlist, dict_classes()),
+        '__slots__' : functools.partial(netlist, slot_classes()),
+        'columnar' : columnar_netlist,
+        }
+    sizes = dict([ (layout, bytes_per_node(build, options.sample, options.ports))
+                   for layout, build in builders.items() ])
+
+    baseline = peak_rss()
+    tree = builders[options.layout](iter_names(options.instances, options.ports))
+    nodes = count_nodes(options.instances, options.ports)
+
+    print('nodes            : %d (%d instances, %d ports)' % (nodes, options.instances, options.ports))
+    for layout in ('__dict__', '__slots__', 'columnar'):
+        print('%-16s : %.1f bytes/node (%.1f%% of __dict__)' % (
+            layout, sizes[layout], sizes[layout] / sizes['__dict__'] * 100))
+    print('peak RSS (%s) : %.1f MB (%.1f MB before the netlist)' % (
+        options.layout, peak_rss(), baseline))
+
+if __name__ == '__main__':
+    main()
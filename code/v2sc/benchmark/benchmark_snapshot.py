@@ -0,0 +1,65 @@
+#-------------------------------------------------------------------------------
+# benchmark_snapshot.py
+#
+# Time to get the AST of a design: parsing the source vs loading a snapshot
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import glob
+import tempfile
+import timeit
+from optparse import OptionParser
+
+# the next line can be removed after installation
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsetables import VerilogParser
+import snapshot
+
+DEFAULT_FILES = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + '/verilogcode/*.v'
+
+def main():
+    USAGE = "Usage: python benchmark_snapshot.py [-n repeat] [file ...]"
+
+    optparser = OptionParser(usage=USAGE)
+    optparser.add_option("-n","--repeat",dest="repeat",type="int",
+                         default=5,help="Number of repetitions")
+    (options, args) = optparser.parse_args()
+
+    filelist = args if args else sorted(glob.glob(DEFAULT_FILES))
+    # the preprocessor is left out, it runs the same way in both cases
+    parser = VerilogParser()
+    designs = []
+    for f in filelist:
+        text = open(f).read()
+        try:
+            ast = parser.parse(text)
+        except Exception:
+            continue
+        filename = os.path.join(tempfile.mkdtemp(), os.path.basename(f) + '.snapshot')
+        snapshot.save(ast, filename)
+        if snapshot.load(filename)[0] != ast:
+            raise ValueError("snapshot of %s differs from the parsed AST" % f)
+        designs.append( (text, filename) )
+
+    def parse_all():
+        for text, filename in designs:
+            parser.parse(text)
+    def load_all(lazy):
+        for text, filename in designs:
+            snapshot.load(filename, lazy)
+
+    parse = min(timeit.repeat(parse_all, number=options.repeat, repeat=3))
+    lazy = min(timeit.repeat(lambda: load_all(True), number=options.repeat, repeat=3))
+    full = min(timeit.repeat(lambda: load_all(False), number=options.repeat, repeat=3))
+
+    size = sum([ os.path.getsize(filename) for text, filename in designs ])
+    print('designs          : %d, %d bytes of snapshots' % (len(designs), size))
+    print('parse            : %.3f ms' % (parse / options.repeat * 1e3))
+    print('load, lazy       : %.3f ms (%.1f%% of parse)' % (lazy / options.repeat * 1e3, lazy / parse * 100))
+    print('load, full tree  : %.3f ms (%.1f%% of parse)' % (full / options.repeat * 1e3, full / parse * 100))
+
+if __name__ == '__main__':
+    main()
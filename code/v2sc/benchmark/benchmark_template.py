@@ -0,0 +1,85 @@
+#-------------------------------------------------------------------------------
+# benchmark_template.py
+#
+# Per-node template lookup overhead: loader lookup vs precompiled table
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import glob
+import timeit
+from optparse import OptionParser
+
+# the next line can be removed after installation
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsetables import VerilogCodeParser
+from pyverilog.vparser.ast import walk
+from v2sc import ASTCodeGenerator, getfilename
+
+DEFAULT_FILES = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + '/verilogcode/*.v'
+
+def collect_nodes(node, nodes):
+    walk(node, pre=nodes.append)
+    return nodes
+
+def main():
+    USAGE = "Usage: python benchmark_template.py [-n repeat] [file ...]"
+
+    optparser = OptionParser(usage=USAGE)
+    optparser.add_option("-n","--repeat",dest="repeat",type="int",
+                         default=20,help="Number of repetitions")
+    optparser.add_option("-I","--include",dest="include",action="append",
+                         default=[],help="Include path")
+    optparser.add_option("-D",dest="define",action="append",
+                         default=[],help="Macro Definition")
+    (options, args) = optparser.parse_args()
+
+    filelist = args if args else sorted(glob.glob(DEFAULT_FILES))
+
+    codegen = ASTCodeGenerator()
+    nodes = []
+    asts = []
+    for f in filelist:
+        codeparser = VerilogCodeParser([f],
+                                       preprocess_include=options.include,
+                                       preprocess_define=options.define)
+        try:
+            ast = codeparser.parse()
+        except Exception as e:
+            print('skip %s: %s' % (f, e))
+            continue
+        asts.append(ast)
+        collect_nodes(ast, nodes)
+    nodes = [ node for node in nodes if (node.__class__, '') in codegen.templates ]
+
+    def loader_lookup():
+        for node in nodes:
+            codegen.env.get_template(getfilename(node))
+
+    def table_lookup():
+        for node in nodes:
+            codegen.get_template(node)
+
+    def convert():
+        for ast in asts:
+            try:
+                codegen.visit(ast)
+            except Exception:
+                pass
+
+    count = len(nodes) * options.repeat
+    before = min(timeit.repeat(loader_lookup, number=options.repeat, repeat=3))
+    after = min(timeit.repeat(table_lookup, number=options.repeat, repeat=3))
+    total = min(timeit.repeat(convert, number=1, repeat=3))
+
+    print('files            : %d' % len(asts))
+    print('templated nodes  : %d' % len(nodes))
+    print('loader lookup    : %.3f us/node' % (before / count * 1e6))
+    print('table lookup     : %.3f us/node' % (after / count * 1e6))
+    print('speedup          : %.1fx' % (before / after))
+    print('full conversion  : %.3f ms' % (total * 1e3))
+
+if __name__ == '__main__':
+    main()
@@ -12,13 +12,15 @@ import sys
 import os
 import math
 import re
-import functools
-from jinja2 import Environment, FileSystemLoader
 
 from pyverilog.vparser.ast import *
 from pyverilog.utils.op2mark import op2mark
 from pyverilog.utils.op2mark import op2order
 
+from templatecache import create_environment
+from indentation import indent_block, resolve_indent
+from dispatch import dispatch
+
 DEFAULT_TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__)) + '/template/'
 
 #-------------------------------------------------------------------------------
@@ -37,10 +39,10 @@ except:
         return ''.join(ret[:-1])
 
 def indent_multiline_assign(text):
+    if '\n' not in text:
+        return text
     ret = []
     texts = text.split('\n')
-    if len(texts) <= 1:
-        return text
     try:
         p = texts[0].index('=')
     except:
@@ -51,19 +53,78 @@ def indent_multiline_assign(text):
     return ''.join(ret)
         
 #-------------------------------------------------------------------------------
+class VisitFailure(object):
+    def __init__(self, error):
+        self.error = error
+
 class ConvertVisitor(object):
+    visit_table = dispatch('visit_table', 'visit_', default='generic_visit')
+    visit_cache = None
+    visit_depth = 0
+    max_visit_depth = 100 # deeper subtrees are visited by visit_tree
     def visit(self, node):
-        method = 'visit_' + node.__class__.__name__
-        visitor = getattr(self, method, self.generic_visit)
-        return visitor(node)
+        cache = self.visit_cache
+        if cache is not None:
+            rslt = cache.pop(id(node), None)
+            if rslt is None:
+                rslt = self.visit_table[node.__class__](self, node)
+            elif isinstance(rslt, VisitFailure):
+                raise rslt.error
+            return rslt
+        if self.visit_depth >= self.max_visit_depth:
+            return self.visit_tree(node)
+        self.visit_depth += 1
+        try:
+            rslt = self.visit_table[node.__class__](self, node)
+        finally:
+            self.visit_depth -= 1
+        if self.visit_depth == 0:
+            # the blocks are indented once the outermost node is rendered
+            rslt = resolve_indent(rslt, self.indentprefix)
+        return rslt
+    def visit_tree(self, node, visit=None):
+        """
+        Visit the subtree bottom-up with an explicit stack, so that each
+        visitor finds the results of its children already computed and the
+        recursion depth does not grow with the depth of the tree.
+        """
+        self.visit_cache = {}
+        try:
+            walk(node, post=self.prepare)
+            return (visit or self.visit)(node)
+        finally:
+            self.visit_cache = None
+    def prepare(self, node):
+        try:
+            self.visit_cache[id(node)] = self.visit_table[node.__class__](self, node)
+        except Exception as e:
+            # raised again only if a parent really uses this node
+            self.visit_cache[id(node)] = VisitFailure(e)
     def generic_visit(self, node):
         ret = []
         for c in node.children():
             ret.append(self.visit(c))
         return ''.join(ret)
 
-def getfilename(node):
-    return node.__class__.__name__.lower() + '.txt'
+def getfilename(node, suffix=''):
+    return node.__class__.__name__.lower() + suffix + '.txt'
+
+def nodeclasses(cls=Node):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for c in nodeclasses(subclass):
+            yield c
+
+def load_templates(env, template_dir=DEFAULT_TEMPLATE_DIR, suffixes=('',)):
+    """ compile every template file once, indexed by (node class, suffix) """
+    filenames = set(os.listdir(template_dir))
+    templates = {}
+    for cls in nodeclasses():
+        for suffix in suffixes:
+            filename = cls.__name__.lower() + suffix + '.txt'
+            if filename in filenames:
+                templates[(cls, suffix)] = env.get_template(filename)
+    return templates
 
 def escape(s):
     if s.startswith('\\'):
@@ -79,22 +140,31 @@ def del_space(s):
     return s.replace(' ', '')
 
 class ASTCodeGenerator(ConvertVisitor):
-    def __init__(self, indentsize=2):
-        self.env = Environment(loader=FileSystemLoader(DEFAULT_TEMPLATE_DIR))
-        self.indent = functools.partial(indent, prefix=' '*indentsize)
+    def __init__(self, indentsize=2, cache_dir=None, use_cache=True):
+        self.env = create_environment(DEFAULT_TEMPLATE_DIR, cache_dir, use_cache)
+        self.templates = load_templates(self.env)
+        self.indent = indent_block
+        self.indentprefix = ' '*indentsize
+
+    def get_template(self, node, suffix=''):
+        key = (node.__class__, suffix)
+        template = self.templates.get(key)
+        if template is None:
+            template = self.env.get_template(getfilename(node, suffix))
+            self.templates[key] = template
+        return template
 
     def visit_Source(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'description' : self.visit(node.description),
             }
         rslt = template.render(template_dict)
+        rslt = resolve_indent(rslt, self.indentprefix)
         return rslt
 
     def visit_Description(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'definitions':[self.visit(definition) for definition in node.definitions],
             }
@@ -102,8 +172,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ModuleDef(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         paramlist = self.indent(self.visit(node.paramlist)) if node.paramlist is not None else ''
         portlist = self.indent(self.visit(node.portlist)) if node.portlist is not None else ''
         template_dict = {
@@ -113,11 +182,11 @@ class ASTCodeGenerator(ConvertVisitor):
             'items' : [ self.indent(self.visit(item)) for item in node.items ] if node.items else (),
             }
         rslt = template.render(template_dict)
+        rslt = resolve_indent(rslt, self.indentprefix)
         return rslt
         
     def visit_Paramlist(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         params = [ self.visit(param).replace(';','') for param in node.params ]
         template_dict = {
             'params' : params,
@@ -127,8 +196,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Portlist(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         ports = [ self.visit(port) for port in node.ports ]
         template_dict = {
             'ports' : ports,
@@ -138,8 +206,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Port(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -147,8 +214,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Width(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'msb' : del_space(del_paren(self.visit(node.msb))),
             'lsb' : del_space(del_paren(self.visit(node.lsb))),
@@ -157,8 +223,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Length(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'msb' : del_space(del_paren(self.visit(node.msb))),
             'lsb' : del_space(del_paren(self.visit(node.lsb))),
@@ -167,8 +232,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Identifier(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'scope' : '' if node.scope is None else self.visit(node.scope),
@@ -177,8 +241,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Value(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -186,8 +249,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Constant(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -195,8 +257,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IntConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -204,8 +265,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_FloatConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -213,8 +273,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_StringConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -222,8 +281,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Variable(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -233,8 +291,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Input(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -244,8 +301,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Output(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -255,8 +311,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Inout(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -266,8 +321,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Tri(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -277,8 +331,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Wire(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -288,8 +341,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Reg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -299,8 +351,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_WireArray(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -311,8 +362,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_RegArray(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'width' : '' if node.width is None else self.visit(node.width),
@@ -323,8 +373,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Integer(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'signed' : node.signed,
@@ -333,8 +382,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Real(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -342,8 +390,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Genvar(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -351,8 +398,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Ioport(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'first' : node.first.__class__.__name__.lower(),
             'second' : '' if node.second is None else node.second.__class__.__name__.lower(),
@@ -363,8 +409,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Parameter(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         value = self.visit(node.value)
         template_dict = {
             'name' : escape(node.name),
@@ -376,8 +421,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Localparam(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         value = self.visit(node.value)
         template_dict = {
             'name' : escape(node.name),
@@ -389,8 +433,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Decl(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'items' : [ self.visit(item) for item in node.list ],
             }
@@ -398,8 +441,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Concat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         items = [ del_paren(self.visit(item)) for item in node.list ]
         template_dict = {
             'items' : items,
@@ -409,8 +451,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_LConcat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         items = [ del_paren(self.visit(item)) for item in node.list ]
         template_dict = {
             'items' : items,
@@ -420,8 +461,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Repeat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : del_paren(self.visit(node.value)),
             'times' : del_paren(self.visit(node.times)),
@@ -430,8 +470,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Partselect(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'var' : self.visit(node.var),
             'msb' : del_space(del_paren(self.visit(node.msb))),
@@ -441,8 +480,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Pointer(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'var' : self.visit(node.var),
             'ptr' : del_paren(self.visit(node.ptr)),
@@ -451,8 +489,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Lvalue(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'var' : del_paren(self.visit(node.var)),
             }
@@ -460,8 +497,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Rvalue(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'var' : del_paren(self.visit(node.var)),
             }
@@ -469,8 +505,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Operator(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         order = op2order(node.__class__.__name__)
         lorder = op2order(node.left.__class__.__name__)
         rorder = op2order(node.right.__class__.__name__)
@@ -495,8 +530,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_UnaryOperator(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         right = self.visit(node.right)
         template_dict = {
             'right' : right,
@@ -605,8 +639,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return self.visit_Operator(node)
 
     def visit_Cond(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         true_value = del_paren(self.visit(node.true_value))
         false_value = del_paren(self.visit(node.false_value))
         if isinstance(node.false_value, Cond):
@@ -620,8 +653,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Assign(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'left' : self.visit(node.left),
             'right' : self.visit(node.right),
@@ -631,8 +663,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Always(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'sens_list' : self.visit(node.sens_list),
             'statement' : self.visit(node.statement),
@@ -641,8 +672,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_SensList(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         items = [ self.visit(item) for item in node.list ]
         template_dict = {
             'items' : items,
@@ -652,8 +682,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Sens(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'sig' : '*' if node.type == 'all' else self.visit(node.sig),
             'type' : node.type if node.type == 'posedge' or node.type == 'negedge' else ''
@@ -662,8 +691,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Substitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'left' : self.visit(node.left),
             'right' : self.visit(node.right),
@@ -675,8 +703,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_BlockingSubstitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'left' : self.visit(node.left),
             'right' : self.visit(node.right),
@@ -688,8 +715,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_NonblockingSubstitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'left' : self.visit(node.left),
             'right' : self.visit(node.right),
@@ -701,8 +727,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IfStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         true_statement = '' if node.true_statement is None else self.visit(node.true_statement)
         false_statement = '' if node.false_statement is None else self.visit(node.false_statement)
         template_dict = {
@@ -714,8 +739,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_ForStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'pre' : '' if node.pre is None else del_space(self.visit(node.pre)),
             'cond' : '' if node.cond is None else del_space(del_paren(self.visit(node.cond))),
@@ -726,8 +750,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_WhileStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'cond' : '' if node.cond is None else del_paren(self.visit(node.cond)),
             'statement' : '' if node.statement is None else self.visit(node.statement),
@@ -736,8 +759,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_CaseStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'comp' : del_paren(self.visit(node.comp)),
             'caselist' : [ self.indent(self.visit(case)) for case in node.caselist ],
@@ -746,8 +768,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_CasexStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'comp' : del_paren(self.visit(node.comp)),
             'caselist' : [ self.indent(self.visit(case)) for case in node.caselist ],
@@ -756,8 +777,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Case(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         condlist = [ 'default' ] if node.cond is None else [ del_paren(self.visit(c)) for c in node.cond ]
         cond = []
         for c in condlist:
@@ -771,8 +791,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Block(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'scope' : '' if node.scope is None else escape(node.scope),
             'statements' : [ self.indent(self.visit(statement)) for statement in node.statements ],
@@ -781,8 +800,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Initial(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'statement' : self.visit(node.statement),
             }
@@ -790,8 +808,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_EventStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'senslist': del_paren(self.visit(node.senslist)),
             }
@@ -799,8 +816,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_WaitStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'cond': del_paren(self.visit(node.cond)),
             'statement' : self.visit(node.statement) if node.statement else '',
@@ -809,8 +825,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ForeverStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'statement' : self.visit(node.statement),
             }
@@ -818,8 +833,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_DelayStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'delay' : self.visit(node.delay),
             }
@@ -827,8 +841,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_InstanceList(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         parameterlist = [ self.indent(self.visit(param)) for param in node.parameterlist ]
         instances = [ self.visit(instance) for instance in node.instances ]
         template_dict = {
@@ -842,8 +855,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Instance(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         array = '' if node.array is None else self.visit(node.array)
         portlist = [ self.indent(self.visit(port)) for port in node.portlist ]
         template_dict = {
@@ -856,8 +868,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ParamArg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'paramname' : '' if node.paramname is None else escape(node.paramname),
             'argname' : '' if node.argname is None else del_paren(self.visit(node.argname)),
@@ -866,8 +877,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_PortArg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'portname' : '' if node.portname is None else escape(node.portname),
             'argname' : '' if node.argname is None else del_paren(self.visit(node.argname)),
@@ -876,8 +886,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
         
     def visit_Function(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         statement = [ self.indent(self.visit(s)) for s in node.statement ]
         template_dict = {
             'name' : escape(node.name),
@@ -888,8 +897,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_FunctionCall(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         args = [ self.visit(arg) for arg in node.args ]
         template_dict = {
             'name' : self.visit(node.name),
@@ -900,8 +908,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Task(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         statement = [ self.indent(self.visit(s)) for s in node.statement ]
         template_dict = {
             'name' : escape(node.name),
@@ -911,8 +918,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     #def visit_TaskCall(self, node):
-    #    filename = getfilename(node)
-    #    template = self.env.get_template(filename)
+    #    template = self.get_template(node)
     #    args = [ self.visit(arg) for arg in node.args ]
     #    template_dict = {
     #        'name' : self.visit(node.name),
@@ -923,8 +929,7 @@ class ASTCodeGenerator(ConvertVisitor):
     #    return rslt
 
     def visit_GenerateStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'items' : [ self.visit(item) for item in node.items ]
             }
@@ -932,8 +937,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_SystemCall(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         args = [ self.visit(arg) for arg in node.args ]
         template_dict = {
             'syscall' : escape(node.syscall),
@@ -944,8 +948,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IdentifierScopeLabel(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'loop' : '' if node.loop is None else self.visit(node.loop),
@@ -954,8 +957,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IdentifierScope(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         scopes = [ self.visit(scope) for scope in node.labellist ]
         template_dict = {
             'scopes' : scopes,
@@ -964,8 +966,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Pragma(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'entry' : self.visit(node.entry),
             }
@@ -973,8 +974,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_PragmaEntry(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'value' : '' if node.value is None else self.visit(node.value),
@@ -983,8 +983,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Disable(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.dest),
             }        
@@ -992,8 +991,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ParallelBlock(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'scope' : '' if node.scope is None else escape(node.scope),
             'statements' : [ self.indent(self.visit(statement)) for statement in node.statements ],
@@ -1002,8 +1000,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_SingleStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'statement' : self.visit(node.statement),
             }
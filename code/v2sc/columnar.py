@@ -0,0 +1,341 @@
+#-------------------------------------------------------------------------------
+# columnar.py
+#
+# Array-backed AST store for netlist-scale designs
+#
+# Nodes are kept in typed arrays in post order, so the children of a node
+# always precede it and the subtree of node i is the range first[i] .. i.
+# Names and other strings are kept as UTF-8 in a single string table.
+# Real ast nodes are only materialized on demand: a node is built together
+# with its single children, while its list fields become NodeSequences
+# materializing each element when it is first accessed, so the visitors run
+# on them unchanged.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+from array import array
+
+import pyverilog.vparser.ast as ast
+from pyverilog.vparser.ast import Node, fields
+
+# value tags
+NONE, NODE, STR, INT, BOOL, TUPLE, LIST, OBJECT = range(8)
+
+# integers out of the range of the values array are kept as objects
+INT_MIN = -(1 << 31)
+INT_MAX = (1 << 31) - 1
+
+def node_classes():
+    """ every node class of ast.py, in a stable order """
+    classes = [ cls for cls in vars(ast).values()
+                if isinstance(cls, type) and issubclass(cls, Node) ]
+    return tuple(sorted(classes, key=lambda cls: cls.__name__))
+
+NODE_CLASSES = node_classes()
+CLASS_INDEX = dict([ (cls, i) for i, cls in enumerate(NODE_CLASSES) ])
+# fields of each class stored in tags/values, lineno has its own array
+CLASS_FIELDS = tuple([ fields(cls)[1:] for cls in NODE_CLASSES ])
+
+STATE = ('kinds', 'linenos', 'first', 'offsets', 'tags', 'values', 'seqs',
+         'seq_items', 'strings', 'string_offsets', 'objects')
+
+class NodeRef(object):
+    """ reference to a node already stored, usable as a field value when adding nodes """
+    __slots__ = ('index',)
+    def __init__(self, index):
+        self.index = index
+
+class NodeSequence(object):
+    """
+    Read-only sequence of stored nodes. Each element is materialized on first
+    access and kept, so the same index always gives the same object. A
+    NodeSequence over an array of indices is also the cheapest way to pass
+    a long node list to ColumnarAST.add.
+    """
+    __slots__ = ('store', 'indices', 'nodes', 'tag')
+    def __init__(self, store, indices, tag=TUPLE):
+        self.store = store
+        self.indices = indices
+        self.nodes = [ None ] * len(indices)
+        self.tag = tag
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple([ self[j] for j in range(*i.indices(len(self.indices))) ])
+        node = self.nodes[i]
+        if node is None:
+            node = self.store.node(self.indices[i])
+            self.nodes[i] = node
+        return node
+
+    def __iter__(self):
+        for i in range(len(self.indices)):
+            yield self[i]
+
+    def __bool__(self):
+        return len(self.indices) > 0
+    __nonzero__ = __bool__
+
+    def __reduce__(self):
+        return (list if self.tag == LIST else tuple, (list(self),))
+
+    def __repr__(self):
+        return 'NodeSequence(%d nodes)' % len(self.indices)
+
+class ColumnarAST(object):
+    """
+    AST held in typed arrays:
+      kinds   class of each node, an index into NODE_CLASSES
+      linenos line number of each node
+      first   first node of the subtree of each node
+      offsets start of the fields of each node in tags/values, in the
+              order of ast.fields() without lineno
+      tags    kind of each field value, values its payload: a node index,
+              a string table index, an integer, or an index into seqs
+      seqs    start of each node list in seq_items, with a final sentinel
+      strings UTF-8 text of the strings, delimited by string_offsets
+      objects any other field value, kept as it is
+    """
+    def __init__(self):
+        self.kinds = array('H')
+        self.linenos = array('i')
+        self.first = array('I')
+        self.offsets = array('I')
+        self.tags = array('B')
+        self.values = array('i')
+        self.seqs = array('I', [ 0 ])
+        self.seq_items = array('I')
+        self.strings = bytearray()
+        self.string_offsets = array('I', [ 0 ])
+        self.objects = []
+        self.class_index = CLASS_INDEX
+        self.class_fields = CLASS_FIELDS
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getstate__(self):
+        # the class tables are module constants, and a mapped file stays behind
+        return dict([ (name, getattr(self, name)) for name in STATE ])
+
+    def __setstate__(self, state):
+        self.__init__()
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_node(cls, node):
+        store = cls()
+        store.extend(node)
+        return store
+
+    def shift_lines(self, offset):
+        """ move the nodes with a line number offset lines down """
+        self.linenos = array('i', [ lineno + offset if lineno else 0 for lineno in self.linenos ])
+
+    def root(self):
+        """ the node stored last, materialized """
+        return self.node(len(self.kinds) - 1)
+
+    def add(self, nodeclass, *args, **kwargs):
+        """ store a node built from nodeclass(*args, **kwargs), node fields given as NodeRef """
+        return self.extend(nodeclass(*args, **kwargs))
+
+    def extend(self, node):
+        """ store the subtree under node and return the index of node """
+        indices = {}
+        stack = [ (node, False) ]
+        while stack:
+            n, done = stack.pop()
+            if done:
+                indices[id(n)] = self.append(n, indices)
+            elif id(n) not in indices: # a shared subtree is stored once
+                stack.append( (n, True) )
+                stack.extend([ (c, False) for c in reversed(self.subnodes(n)) ])
+        return indices[id(node)]
+
+    def subnodes(self, node):
+        """
+        nodes held by the fields of node, which are not always its children()
+        (the loop of an IdentifierScopeLabel), except those already stored
+        """
+        ret = []
+        for name in self.class_fields[self.class_index[node.__class__]]:
+            value = getattr(node, name, None)
+            if isinstance(value, Node):
+                ret.append(value)
+            elif isinstance(value, NodeSequence) and value.store is self:
+                continue
+            elif isinstance(value, (tuple, list, NodeSequence)):
+                ret.extend([ item for item in value if isinstance(item, Node) ])
+        return ret
+
+    def append(self, node, indices):
+        kind = self.class_index[node.__class__]
+        encoded = [ self.encode(getattr(node, name, None), indices)
+                    for name in self.class_fields[kind] ]
+        index = len(self.kinds)
+        first = index
+        for tag, value in encoded:
+            if tag == NODE:
+                first = min(first, self.first[value])
+            elif tag == TUPLE or tag == LIST:
+                items = self.seq_items[self.seqs[value]:self.seqs[value + 1]]
+                if items:
+                    first = min(first, min([ self.first[i] for i in items ]))
+        self.kinds.append(kind)
+        self.linenos.append(getattr(node, 'lineno', 0) or 0)
+        self.first.append(first)
+        self.offsets.append(len(self.tags))
+        for tag, value in encoded:
+            self.tags.append(tag)
+            self.values.append(value)
+        return index
+
+    def encode(self, value, indices):
+        if value is None:
+            return NONE, 0
+        if isinstance(value, Node):
+            return NODE, indices[id(value)]
+        if isinstance(value, NodeRef):
+            return NODE, value.index
+        if isinstance(value, str):
+            return STR, self.intern(value)
+        if isinstance(value, bool):
+            return BOOL, int(value)
+        if isinstance(value, int) and INT_MIN <= value <= INT_MAX:
+            return INT, value
+        if isinstance(value, NodeSequence) and value.store is self:
+            return self.sequence(value.indices, value.tag)
+        if isinstance(value, (tuple, list, NodeSequence)):
+            items = []
+            for item in value:
+                if isinstance(item, Node):
+                    items.append(indices[id(item)])
+                elif isinstance(item, NodeRef):
+                    items.append(item.index)
+                else:
+                    break
+            else:
+                tag = value.tag if isinstance(value, NodeSequence) else (
+                    LIST if isinstance(value, list) else TUPLE)
+                return self.sequence(items, tag)
+        self.objects.append(value)
+        return OBJECT, len(self.objects) - 1
+
+    def sequence(self, items, tag):
+        self.seq_items.extend(items)
+        self.seqs.append(len(self.seq_items))
+        return tag, len(self.seqs) - 2
+
+    def intern(self, s):
+        # names are mostly unique in a netlist, appending them is cheaper
+        # than merging equal ones through a dict
+        self.strings.extend(s.encode('utf-8'))
+        self.string_offsets.append(len(self.strings))
+        return len(self.string_offsets) - 2
+
+    def string(self, i):
+        return bytes(self.strings[self.string_offsets[i]:self.string_offsets[i + 1]]).decode('utf-8')
+
+    def decode(self, tag, value, nodes, lazy=True):
+        if tag == NODE:
+            return nodes[value]
+        if tag == STR:
+            return self.string(value)
+        if tag == INT:
+            return value
+        if tag == BOOL:
+            return bool(value)
+        if tag == TUPLE or tag == LIST:
+            items = self.seq_items[self.seqs[value]:self.seqs[value + 1]]
+            if lazy:
+                return NodeSequence(self, items, tag)
+            items = [ nodes[i] for i in items ]
+            return items if tag == LIST else tuple(items)
+        if tag == OBJECT:
+            return self.objects[value]
+        return None
+
+    def node(self, index):
+        """
+        Materialize node index as a real ast node. Its single children are
+        built with it, bottom-up; list fields are NodeSequences.
+        """
+        needed = []
+        stack = [ index ]
+        while stack:
+            i = stack.pop()
+            needed.append(i)
+            offset = self.offsets[i]
+            for k in range(len(self.class_fields[self.kinds[i]])):
+                if self.tags[offset + k] == NODE:
+                    stack.append(self.values[offset + k])
+        nodes = {}
+        for i in sorted(set(needed)):
+            nodes[i] = self.materialize(i, nodes)
+        return nodes[index]
+
+    def tree(self, index=None):
+        """
+        Materialize the whole subtree under index (the root by default) with
+        plain tuples and lists, in a single pass over the arrays.
+        """
+        if index is None:
+            index = len(self.kinds) - 1
+        nodes = {}
+        for i in range(self.first[index], index + 1):
+            nodes[i] = self.materialize(i, nodes, False)
+        return nodes[index]
+
+    def materialize(self, i, nodes, lazy=True):
+        kind = self.kinds[i]
+        node = object.__new__(NODE_CLASSES[kind])
+        setattr_ = object.__setattr__
+        setattr_(node, 'lineno', self.linenos[i])
+        offset = self.offsets[i]
+        tags = self.tags
+        values = self.values
+        for name in self.class_fields[kind]:
+            tag = tags[offset]
+            value = values[offset]
+            offset += 1
+            if tag == NONE:
+                setattr_(node, name, None)
+            elif tag == NODE:
+                setattr_(node, name, nodes[value])
+            else:
+                setattr_(node, name, self.decode(tag, value, nodes, lazy))
+        return node
+
+    def children(self, index):
+        """ indices of the child nodes of index, in field order """
+        ret = []
+        offset = self.offsets[index]
+        for k in range(len(self.class_fields[self.kinds[index]])):
+            tag = self.tags[offset + k]
+            value = self.values[offset + k]
+            if tag == NODE:
+                ret.append(value)
+            elif tag == TUPLE or tag == LIST:
+                ret.extend(self.seq_items[self.seqs[value]:self.seqs[value + 1]])
+        return ret
+
+    def subtree(self, index):
+        """ range of the indices of the subtree under index, exact unless subtrees are shared """
+        return range(self.first[index], index + 1)
+
+    def count(self, nodeclass, index=None):
+        """ number of nodes of nodeclass (not of its subclasses), in the subtree under index """
+        kind = self.class_index[nodeclass]
+        kinds = self.kinds if index is None else self.kinds[self.first[index]:index + 1]
+        return sum([ 1 for k in kinds if k == kind ])
+
+    def nbytes(self):
+        """ memory used by the arrays and the string table """
+        arrays = (self.kinds, self.linenos, self.first, self.offsets, self.tags,
+                  self.values, self.seqs, self.seq_items, self.string_offsets)
+        return sum([ a.itemsize * len(a) for a in arrays ]) + len(self.strings)
@@ -0,0 +1,147 @@
+#-------------------------------------------------------------------------------
+# daemon.py
+#
+# Conversion server on a local Unix socket
+#
+# The server is started once with everything loaded: the modules, the
+# parser tables and the compiled templates. Each request is the command
+# line of a v2sc run and its working directory; it is handled in a process
+# forked from the server, so it starts warm, requests from a parallel build
+# run side by side, and nothing a request does (changing directory, failing,
+# exiting) reaches the server. Parsed designs stay warm through the parse
+# cache, whose snapshots are mapped from the page cache.
+#
+# This module only depends on the standard library, so that the client
+# importing it starts fast.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import io
+import json
+import socket
+import signal
+import struct
+import traceback
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+DEFAULT_SOCKET = os.environ.get('V2SC_SOCKET',
+                                os.path.join(os.environ.get('V2SC_CACHE_DIR',
+                                                            os.path.join(os.path.expanduser('~'), '.cache', 'v2sc')),
+                                             'daemon.sock'))
+
+_length = struct.Struct('>I')
+
+def send_message(sock, message):
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_length.pack(len(data)) + data)
+
+def recv_exactly(sock, size):
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise EOFError('connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def recv_message(sock):
+    size = _length.unpack(recv_exactly(sock, _length.size))[0]
+    return json.loads(recv_exactly(sock, size).decode('utf-8'))
+
+def run(main, args, cwd):
+    """ (exit status, stdout, stderr) of main() run with the command line args in cwd """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    sys.stdout, sys.stderr = stdout, stderr
+    status = 0
+    try:
+        os.chdir(cwd)
+        main(args)
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            print(e.code, file=stderr)
+            status = 1
+    except Exception:
+        traceback.print_exc(file=stderr)
+        status = 1
+    finally:
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    return status, stdout.getvalue(), stderr.getvalue()
+
+class ConversionHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        # the forked request is not the server, a SIGTERM simply ends it
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            request = recv_message(self.request)
+        except EOFError:
+            return # a connection only checking whether the daemon is up
+        status, stdout, stderr = run(self.server.main, request['args'], request['cwd'])
+        send_message(self.request, { 'status' : status, 'stdout' : stdout, 'stderr' : stderr })
+
+class ConversionServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def __init__(self, path, main):
+        self.main = main
+        socketserver.UnixStreamServer.__init__(self, path, ConversionHandler)
+
+def is_running(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except (IOError, OSError):
+        return False
+    finally:
+        sock.close()
+    return True
+
+def serve(main, path=DEFAULT_SOCKET, warmup=None):
+    """
+    Serve main(args) on the Unix socket path until interrupted. warmup is
+    called once before, to load what the requests will share.
+    """
+    if os.path.exists(path):
+        if is_running(path):
+            raise IOError('a daemon is already listening on ' + path)
+        os.remove(path) # left by a daemon that did not exit cleanly
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if warmup is not None:
+        warmup()
+    # only the owner may connect
+    umask = os.umask(0o077)
+    try:
+        server = ConversionServer(path, main)
+    finally:
+        os.umask(umask)
+    print('v2sc daemon listening on ' + path, file=sys.stderr)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+
+def request(args, path=DEFAULT_SOCKET, cwd=None):
+    """ (exit status, stdout, stderr) of the conversion of args by the daemon on path """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        send_message(sock, { 'args' : list(args), 'cwd' : cwd or os.getcwd() })
+        reply = recv_message(sock)
+    finally:
+        sock.close()
+    return reply['status'], reply['stdout'], reply['stderr']
@@ -0,0 +1,49 @@
+#-------------------------------------------------------------------------------
+# dispatch.py
+#
+# Per-class dispatch tables for the AST visitors
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+
+class DispatchTable(dict):
+    """
+    Map from node class to the handler of a visitor class.
+    Handlers are looked up by name on the first node of each class and
+    then cached, so dispatch is a single dict lookup.
+    """
+    def __init__(self, visitorclass, prefix, suffix, default):
+        dict.__init__(self)
+        self.visitorclass = visitorclass
+        self.prefix = prefix
+        self.suffix = suffix
+        self.default = default
+
+    def __missing__(self, nodeclass):
+        method = self.prefix + nodeclass.__name__ + self.suffix
+        handler = getattr(self.visitorclass, method, None)
+        if handler is None:
+            handler = getattr(self.visitorclass, self.default)
+        self[nodeclass] = handler
+        return handler
+
+class dispatch(object):
+    """
+    Descriptor giving each visitor class (and each subclass, so overrides
+    are honored) its own DispatchTable. Call the handler as table[cls](self, node).
+    """
+    def __init__(self, name, prefix, suffix='', default='visit_default'):
+        self.name = name
+        self.prefix = prefix
+        self.suffix = suffix
+        self.default = default
+        self.tables = {}
+
+    def __get__(self, obj, cls):
+        table = self.tables.get(cls)
+        if table is None:
+            table = DispatchTable(cls, self.prefix, self.suffix, self.default)
+            self.tables[cls] = table
+        if obj is not None:
+            obj.__dict__[self.name] = table
+        return table
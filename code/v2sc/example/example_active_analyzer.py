@@ -13,6 +13,7 @@ import pyverilog.controlflow.splitter as splitter
 from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
 from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
 from pyverilog.controlflow.active_analyzer import VerilogActiveConditionAnalyzer
+from snapshot import use_snapshot
 
 def main():
     INFO = "Active condition analyzer"
@@ -32,6 +33,10 @@ def main():
                          default="TOP",help="Top module, Default=TOP")
     optparser.add_option("-s","--search",dest="searchtarget",action="append",
                          default=[],help="Search Target Signal")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -41,10 +46,11 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule)
+    use_snapshot(analyzer, options.snapshot, options.save_snapshot)
     analyzer.generate()
 
     directives = analyzer.get_directives()
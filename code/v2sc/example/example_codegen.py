@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pyverilog.utils.version
 from pyverilog.vparser.parser import VerilogCodeParser
 from pyverilog.ast_code_generator.codegen import ASTCodeGenerator
+from snapshot import use_snapshot
 
 def main():
     INFO = "Code converter from AST"
@@ -29,6 +30,10 @@ def main():
                          default=[],help="Include path")
     optparser.add_option("-D",dest="define",action="append",
                          default=[],help="Macro Definition")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -38,12 +43,13 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     codeparser = VerilogCodeParser(filelist,
                                    preprocess_include=options.include,
                                    preprocess_define=options.define)
+    use_snapshot(codeparser, options.snapshot, options.save_snapshot)
 
     ast = codeparser.parse()
     directives = codeparser.get_directives()
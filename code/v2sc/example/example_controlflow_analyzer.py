@@ -12,6 +12,7 @@ import pyverilog.utils.util as util
 from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
 from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
 from pyverilog.controlflow.controlflow_analyzer import VerilogControlflowAnalyzer
+from snapshot import use_snapshot
 
 def main():
     INFO = "Control-flow analyzer for Verilog definitions"
@@ -41,6 +42,10 @@ def main():
                          default=[],help="Include path")
     optparser.add_option("-D",dest="define",action="append",
                          default=[],help="Macro Definition")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -50,12 +55,13 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule,
                                        preprocess_include=options.include,
                                        preprocess_define=options.define)
+    use_snapshot(analyzer, options.snapshot, options.save_snapshot)
     analyzer.generate()
 
     directives = analyzer.get_directives()
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pyverilog.utils.version
 from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+from snapshot import use_snapshot
 
 def main():
     INFO = "Verilog module signal/module dataflow analyzer"
@@ -34,6 +35,10 @@ def main():
                          default=False,help="No binding traversal, Default=False")
     optparser.add_option("--noreorder",action="store_true",dest="noreorder",
                          default=False,help="No reordering of binding dataflow, Default=False")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -43,7 +48,7 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule,
@@ -51,6 +56,7 @@ def main():
                                        nobind=options.nobind,
                                        preprocess_include=options.include,
                                        preprocess_define=options.define)
+    use_snapshot(analyzer, options.snapshot, options.save_snapshot)
     analyzer.generate()
 
     directives = analyzer.get_directives()
@@ -11,6 +11,7 @@ import pyverilog.utils.version
 from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
 from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
 from pyverilog.dataflow.dataflow_codegen import VerilogCodeGenerator
+from snapshot import use_snapshot
 
 def main():
     INFO = "Code generator from Verilog dataflow definitions"
@@ -48,6 +49,10 @@ def main():
                          default="posedge",help="Clock signal edge")
     optparser.add_option("--resetedge",dest="resetedge",
                          default="negedge",help="Reset signal edge")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -57,7 +62,7 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule,
@@ -65,6 +70,7 @@ def main():
                                        nobind=options.nobind,
                                        preprocess_include=options.include,
                                        preprocess_define=options.define)
+    use_snapshot(analyzer, options.snapshot, options.save_snapshot)
     analyzer.generate()
 
     directives = analyzer.get_directives()
@@ -12,6 +12,7 @@ import pyverilog.utils.util as util
 from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
 from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
 from pyverilog.dataflow.merge import VerilogDataflowMerge
+from snapshot import use_snapshot
 
 def main():
     INFO = "Dataflow merge module"
@@ -39,6 +40,10 @@ def main():
                          default=False,help="No reordering of binding dataflow, Default=False")
     optparser.add_option("-s","--search",dest="searchtarget",action="append",
                          default=[],help="Search Target Signal")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -48,7 +53,7 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
     analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule,
@@ -56,6 +61,7 @@ def main():
                                        nobind=options.nobind,
                                        preprocess_include=options.include,
                                        preprocess_define=options.define)
+    use_snapshot(analyzer, options.snapshot, options.save_snapshot)
     analyzer.generate()
 
     directives = analyzer.get_directives()
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pyverilog.utils.version
 from pyverilog.vparser.parser import parse
+import snapshot
 
 def main():
     INFO = "Verilog code parser"
@@ -28,6 +29,10 @@ def main():
                          default=[],help="Include path")
     optparser.add_option("-D",dest="define",action="append",
                          default=[],help="Macro Definition")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
     (options, args) = optparser.parse_args()
 
     filelist = args
@@ -37,12 +42,17 @@ def main():
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
-    ast, directives = parse(filelist,
-                            preprocess_include=options.include,
-                            preprocess_define=options.define)
+    if options.snapshot is not None:
+        ast, directives = snapshot.load(options.snapshot)
+    else:
+        ast, directives = parse(filelist,
+                                preprocess_include=options.include,
+                                preprocess_define=options.define)
+    if options.save_snapshot is not None:
+        snapshot.save(ast, options.save_snapshot, directives)
     
     ast.show()
     for lineno, directive in directives:
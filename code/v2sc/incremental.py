@@ -0,0 +1,145 @@
+#-------------------------------------------------------------------------------
+# incremental.py
+#
+# Module-granular incremental conversion
+#
+# The manifest records, for each module converted, a hash of its AST
+# together with what else its code depends on (the options, the modules
+# of the generator, the templates) and the code generated for it. On the
+# next run a module with the same hash gets its recorded code back instead
+# of being converted again. The code of a module depends on nothing outside
+# the module, so a change elsewhere does not invalidate it.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import json
+import hashlib
+import inspect
+import operator
+
+from pyverilog.vparser.ast import Node, fields
+from columnar import NodeSequence
+
+MANIFEST_VERSION = 1
+
+_getters = {}
+
+def field_getter(cls):
+    """ function giving the field values of a node of cls, last field first """
+    getter = _getters.get(cls)
+    if getter is None:
+        names = tuple(reversed(fields(cls)))
+        get = operator.attrgetter(*names)
+        getter = get if len(names) > 1 else (lambda node: (get(node),))
+        _getters[cls] = getter
+    return getter
+
+def digest(node):
+    """ hash of the structure of the subtree under node, line numbers included, stable across runs """
+    tokens = []
+    stack = [ node ]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Node):
+            cls = value.__class__
+            tokens.append(cls.__name__)
+            try:
+                stack.extend(field_getter(cls)(value))
+            except AttributeError: # a field left unset
+                stack.extend([ getattr(value, name, None) for name in reversed(fields(cls)) ])
+        elif isinstance(value, (tuple, list, NodeSequence)):
+            tokens.append('[%d' % len(value))
+            stack.extend(reversed(value))
+        else:
+            tokens.append(repr(value))
+    return hashlib.sha256('\n'.join(tokens).encode('utf-8')).hexdigest()
+
+def source_digest(cls):
+    """
+    hash of the modules next to the source files of cls and its base
+    classes: the generator imports its helpers from there
+    """
+    h = hashlib.sha256()
+    directories = []
+    for c in cls.__mro__:
+        try:
+            filename = inspect.getsourcefile(c)
+        except TypeError:
+            continue # builtin
+        if filename is None:
+            continue
+        directory = os.path.dirname(os.path.abspath(filename))
+        if directory not in directories:
+            directories.append(directory)
+    for directory in directories:
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.py') or name == 'parsetab.py':
+                continue # parsetab.py is written by yacc in the working directory
+            h.update(name.encode('utf-8'))
+            with open(os.path.join(directory, name), 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+def template_digest(env):
+    h = hashlib.sha256()
+    for name in sorted(env.loader.list_templates()):
+        if not name.endswith('.txt'):
+            continue # __init__.py and its bytecode
+        h.update(name.encode('utf-8'))
+        h.update(env.loader.get_source(env, name)[0].encode('utf-8'))
+    return h.hexdigest()
+
+class ModuleManifest(object):
+    """
+    Generated code of the modules of the last run, indexed by the hash of
+    each module combined with the signature of the generator. Only the
+    modules of the current run are kept when the manifest is saved.
+    """
+    def __init__(self, filename, signature):
+        self.filename = filename
+        self.signature = signature
+        self.previous = {}
+        self.current = []
+        self.reused = 0
+        self.regenerated = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.filename) as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+        if manifest.get('version') != MANIFEST_VERSION:
+            return
+        self.previous = dict([ (key, code) for name, key, code in manifest['modules'] ])
+
+    def key(self, node):
+        return hashlib.sha256((self.signature + digest(node)).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """ the code recorded for key, or None """
+        code = self.previous.get(key)
+        if code is None:
+            self.regenerated += 1
+        else:
+            self.reused += 1
+        return code
+
+    def put(self, name, key, code):
+        self.current.append( (name, key, code) )
+
+    def save(self):
+        manifest = {
+            'version' : MANIFEST_VERSION,
+            'signature' : self.signature,
+            'modules' : [ list(m) for m in self.current ],
+            }
+        tmpname = '%s.%d.tmp' % (self.filename, os.getpid())
+        with open(tmpname, 'w') as f:
+            json.dump(manifest, f)
+        os.rename(tmpname, self.filename)
+
+    def report(self):
+        return 'incremental: %d modules reused, %d regenerated' % (self.reused, self.regenerated)
@@ -0,0 +1,65 @@
+#-------------------------------------------------------------------------------
+# indentation.py
+#
+# Deferred block indentation for the code generators
+#
+# Instead of re-splitting a rendered block at every nesting level, indent_block
+# only brackets the text with two marker characters. resolve_indent expands
+# all markers of a finished module in a single pass, giving the same result as
+# applying textwrap.indent at every level.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import re
+
+INDENT_OPEN = '\x0e'
+INDENT_CLOSE = '\x0f'
+
+_tokenizer = re.compile('([\x0e\x0f\n])')
+
+def indent_block(text, prefix=None):
+    """ mark text to be indented; blank text is returned as it is, like textwrap.indent """
+    if not text or text.isspace():
+        return text
+    return INDENT_OPEN + text + INDENT_CLOSE
+
+def resolve_indent(text, prefix):
+    """ expand the markers left by indent_block, prefixing every non-blank line once per level """
+    if INDENT_OPEN not in text:
+        return text
+    ret = []
+    stack = [] # one [nonblank] flag per open block, for the current line
+    line = []
+    inserts = []
+
+    def flush():
+        for i in range(len(stack) - 1, 0, -1):
+            if stack[i][0]:
+                stack[i - 1][0] = True
+        for pos, scope in reversed(inserts):
+            if scope[0]:
+                line.insert(pos, prefix)
+        ret.extend(line)
+
+    for token in _tokenizer.split(text):
+        if token == '\n':
+            flush()
+            ret.append('\n')
+            del line[:]
+            for scope in stack:
+                scope[0] = False
+            inserts = [ (0, scope) for scope in stack ]
+        elif token == INDENT_OPEN:
+            scope = [False]
+            stack.append(scope)
+            inserts.append((len(line), scope))
+        elif token == INDENT_CLOSE:
+            scope = stack.pop()
+            if scope[0] and stack:
+                stack[-1][0] = True
+        elif token:
+            if stack and not stack[-1][0] and not token.isspace():
+                stack[-1][0] = True
+            line.append(token)
+    flush()
+    return ''.join(ret)
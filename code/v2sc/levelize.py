@@ -0,0 +1,171 @@
+#-------------------------------------------------------------------------------
+# levelize.py
+#
+# Levelized evaluation of the combinational logic of a module
+#
+# Each continuous assignment and combinational always block of a module
+# reads the nets computed by the others through sc_signals, so a chain of N
+# of them settles in N delta cycles. levelize() orders them by their data
+# dependencies instead, so that one method evaluates them all in a single
+# pass, and tells which internal nets they compute can then be held by
+# plain members: only the module outputs and the nets other processes or
+# instances depend on through the scheduler stay signals.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+
+import heapq
+
+from pyverilog.vparser.ast import *
+
+from signals import writes, reads, instance_signals
+
+def is_combinational(item):
+    """ whether a module item is combinational logic: an assign, or an always without edges """
+    if isinstance(item, Assign):
+        return True
+    if isinstance(item, Always) and item.sens_list is not None:
+        return all([ sens.type in ('level', 'all') for sens in item.sens_list.list ])
+    return False
+
+def is_wildcard(item):
+    """ whether a module item is an always @* """
+    if isinstance(item, Always) and item.sens_list is not None:
+        return any([ sens.type == 'all' for sens in item.sens_list.list ])
+    return False
+
+def has_wildcard(module):
+    """ whether module has an always @*, whose sensitivity is read off its statement """
+    return any([ is_wildcard(item) for item in module.items or () ])
+
+class Evaluation(object):
+    """ the combinational items of a module, in the order they are evaluated """
+    def __init__(self, items, sensitivity, members):
+        self.items = items
+        self.sensitivity = sensitivity # signals read but not computed by the items
+        self.members = members # internal nets computed by the items, held by plain members
+
+    def replace(self, moduleitems):
+        """ moduleitems with the combinational items replaced by this evaluation """
+        evaluated = set([ id(item) for item in self.items ])
+        ret = []
+        for item in moduleitems:
+            if id(item) not in evaluated:
+                ret.append(item)
+            elif not any([ r is self for r in ret ]):
+                ret.append(self) # in place of the first one
+        return ret
+
+def hierarchical(item):
+    """ whether item names a signal through a scope, which its reads do not account for """
+    found = []
+    def pre(node):
+        if found:
+            return False
+        if isinstance(node, Identifier) and node.scope is not None:
+            found.append(node)
+    walk(item, pre=pre)
+    return bool(found)
+
+def called(item, subprograms):
+    """ functions and tasks of subprograms item calls, directly or through one another """
+    ret = []
+    stack = [ item ]
+    while stack:
+        def pre(node):
+            if isinstance(node, (FunctionCall, TaskCall)):
+                sub = subprograms.get(node.name.name)
+                if sub is not None and not any([ s is sub for s in ret ]):
+                    ret.append(sub)
+                    stack.append(sub)
+        walk(stack.pop(), pre=pre)
+    return ret
+
+def levelize(module, signals):
+    """
+    Evaluation of the combinational items of module in dependency order, or
+    None when there are none or they form a loop. signals is the
+    SignalTable of the module.
+    """
+    moduleitems = module.items or ()
+    subprograms = dict([ (item.name, item) for item in moduleitems
+                         if isinstance(item, (Function, Task)) ])
+    # what an item reads and writes includes the signals of the module the
+    # bodies of what it calls use, not their arguments and results
+    def item_reads(item):
+        names = reads(item)
+        for sub in called(item, subprograms):
+            names.extend([ name for name in reads(sub) if name in signals ])
+        return names
+    def item_writes(item):
+        names = writes(item)
+        for sub in called(item, subprograms):
+            names.extend([ name for name in writes(sub) if name in signals ])
+        return names
+
+    items = [ item for item in moduleitems if is_combinational(item) and not hierarchical(item) ]
+    if not items:
+        return None
+    itemwrites = [ item_writes(item) for item in items ]
+    itemreads = [ item_reads(item) for item in items ]
+
+    writers = {}
+    for i, names in enumerate(itemwrites):
+        for name in names:
+            writers.setdefault(name, []).append(i)
+
+    # items reading a net come after every item writing it, ties keep the source order
+    successors = [ set() for item in items ]
+    indegree = [ 0 ] * len(items)
+    for i, names in enumerate(itemreads):
+        for name in set(names):
+            for w in writers.get(name, ()):
+                if w != i and i not in successors[w]:
+                    successors[w].add(i)
+                    indegree[i] += 1
+    order = []
+    ready = [ i for i in range(len(items)) if indegree[i] == 0 ]
+    heapq.heapify(ready)
+    while ready:
+        i = heapq.heappop(ready)
+        order.append(i)
+        for s in successors[i]:
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                heapq.heappush(ready, s)
+    if len(order) < len(items):
+        return None # a combinational loop, left to the scheduler
+
+    sensitivity = []
+    for i in order:
+        for name in itemreads[i]:
+            if name not in writers and name in signals and name not in sensitivity:
+                sensitivity.append(name)
+
+    # nets also written or read by any other item (a clocked process, a
+    # generate block, an instance), or by what it calls, stay signals: their
+    # readers outside the evaluation must see them change through the
+    # scheduler. Functions and tasks count where they are called.
+    evaluated = set([ id(item) for item in items ])
+    elsewhere = set()
+    for item in moduleitems:
+        if id(item) in evaluated or isinstance(item, (Decl, Function, Task)):
+            continue
+        elsewhere.update(item_writes(item))
+        elsewhere.update(item_reads(item))
+    connected = instance_signals(module)
+    members = set()
+    for name in writers:
+        signal = signals.get(name)
+        if (signal is not None and not signal.is_port() and
+            name not in elsewhere and name not in connected):
+            members.add(name)
+
+    # a net the items compute but keep as a signal only changes at the end of
+    # the delta cycle, so the items reading it are evaluated again then
+    for i in order:
+        for name in itemreads[i]:
+            if name in writers and name not in members and name in signals and name not in sensitivity:
+                sensitivity.append(name)
+
+    return Evaluation([ items[i] for i in order ], sensitivity, members)
@@ -0,0 +1,112 @@
+#-------------------------------------------------------------------------------
+# parallelparse.py
+#
+# Preprocessing and parsing of the input files in a pool of worker processes
+#
+# Each file is preprocessed and parsed on its own, with the same include
+# paths and defines, and the definitions are merged into one Source in the
+# order of the file list. The serial path preprocesses all the files as one
+# stream, so a macro defined in a file (or in a file it includes, an include
+# guard for instance) is seen by the files after it; when a file but the
+# last defines or undefines a macro, the files are parsed serially instead.
+# The line numbers of each file are moved past the lines of the files before
+# it in that stream, for the generated names to match the serial ones.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import re
+import shutil
+import tempfile
+import multiprocessing
+
+from pyverilog.vparser.ast import Source, Description
+
+from columnar import ColumnarAST
+from parsetables import VerilogCodeParser
+from parsecache import input_files
+
+macro_pattern = re.compile(r'^\s*`(define|undef|undefineall)\b', re.MULTILINE)
+
+def defines_macros(filename, include=()):
+    """ whether filename or a file it includes defines or undefines a macro """
+    for f in input_files([filename], include):
+        with open(f, 'rb') as fp:
+            if macro_pattern.search(fp.read().decode('utf-8', 'replace')):
+                return True
+    return False
+
+def can_split(filelist, include=()):
+    """ whether parsing the files one by one gives the same design as parsing them together """
+    return not any([ defines_macros(f, include) for f in filelist[:-1] ])
+
+def parse_serial(filelist, include=(), define=(), parsecache=None, cache_dir=None):
+    """ (ast, directives, preprocessed lines) of filelist preprocessed as one stream """
+    # the preprocessor output is a file, private to each run so that
+    # workers, daemon requests and parallel builds do not overwrite it
+    tmpdir = tempfile.mkdtemp(prefix='v2sc')
+    output = os.path.join(tmpdir, 'preprocess.output')
+    try:
+        if parsecache is not None:
+            return parsecache.parse(filelist, include, define, preprocess_output=output)
+        codeparser = VerilogCodeParser(filelist,
+                                       preprocess_output=output,
+                                       preprocess_include=include,
+                                       preprocess_define=define,
+                                       cache_dir=cache_dir)
+        ast = codeparser.parse()
+        return ast, codeparser.get_directives(), codeparser.get_lines()
+    finally:
+        shutil.rmtree(tmpdir, True)
+
+def parse_file(task):
+    """ worker: (ColumnarAST, directives, preprocessed lines) of a single file """
+    filename, include, define, parsecache, cache_dir = task
+    ast, directives, lines = parse_serial([filename], include, define, parsecache, cache_dir)
+    # flat arrays are much cheaper to send back than a pickled node tree
+    return ColumnarAST.from_node(ast), tuple(directives), lines
+
+def merge(results):
+    """
+    one Source holding the definitions of every (ColumnarAST, directives,
+    lines) result, in order, numbered as one stream
+    """
+    definitions = []
+    directives = []
+    lineno = None
+    offset = 0
+    for store, d, lines in results:
+        store.shift_lines(offset)
+        ast = store.tree()
+        if lineno is None:
+            lineno = ast.lineno
+        definitions.extend(ast.description.definitions)
+        directives.extend([ (line + offset, text) for line, text in d ])
+        offset += lines
+    description = Description(definitions=tuple(definitions), lineno=lineno)
+    return Source(name='', description=description, lineno=lineno), tuple(directives)
+
+def parse(filelist, jobs, preprocess_include=None, preprocess_define=None, parsecache=None,
+          cache_dir=None):
+    """
+    (ast, directives) of filelist, parsed by jobs worker processes, or
+    serially when the files cannot be parsed separately
+    """
+    include = list(preprocess_include or ())
+    define = list(preprocess_define or ())
+    if jobs <= 1 or len(filelist) <= 1 or not can_split(filelist, include):
+        if jobs > 1 and len(filelist) > 1:
+            print('macros are defined across files, parsing serially', file=sys.stderr)
+        ast, directives, lines = parse_serial(filelist, include, define, parsecache, cache_dir)
+        return ast, directives
+
+    tasks = [ (f, include, define, parsecache, cache_dir) for f in filelist ]
+    pool = multiprocessing.Pool(min(jobs, len(filelist)))
+    try:
+        # map keeps the order of the file list, whichever worker ends first
+        stores = pool.map(parse_file, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return merge(stores)
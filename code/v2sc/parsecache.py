@@ -0,0 +1,178 @@
+#-------------------------------------------------------------------------------
+# parsecache.py
+#
+# Content-addressed cache of parsed designs
+#
+# An entry is the snapshot of the AST of a parse, named after a hash of
+# everything the parse depends on: the contents of the input files and of
+# the files they include, transitively, the include paths, the defines and
+# the version of the parser. A changed input gives another key, so entries
+# are never stale and are only removed to keep the cache under its size
+# limit, least recently used first.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import re
+import hashlib
+
+import pyverilog.utils.version
+import pyverilog.vparser.parser
+
+import snapshot
+from parsetables import VerilogCodeParser
+from templatecache import get_cache_dir
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+include_pattern = re.compile(r'^\s*`include\s+"([^"]+)"', re.MULTILINE)
+
+def file_digest(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def parser_version():
+    """ pyverilog version, grammar and snapshot format the cached ASTs depend on """
+    h = hashlib.sha256()
+    h.update(pyverilog.utils.version.VERSION.encode('utf-8'))
+    h.update(file_digest(pyverilog.vparser.parser.__file__.replace('.pyc', '.py')).encode('utf-8'))
+    h.update(repr((snapshot.SNAPSHOT_VERSION, snapshot.SCHEMA)).encode('utf-8'))
+    return h.hexdigest()
+
+PARSER_VERSION = parser_version()
+
+def include_candidates(name, includer, include):
+    """ files an `include of name in includer may refer to """
+    if os.path.isabs(name):
+        return [ name ]
+    dirs = [ os.path.dirname(includer), os.getcwd() ] + list(include)
+    return [ os.path.join(d, name) for d in dirs ]
+
+def input_files(filelist, include=()):
+    """
+    The files of filelist and every file they include, transitively. The
+    search order of the preprocessor does not matter here: every existing
+    candidate of an `include is taken in.
+    """
+    ret = []
+    visited = set()
+    stack = list(reversed(filelist))
+    while stack:
+        filename = os.path.abspath(stack.pop())
+        if filename in visited:
+            continue
+        visited.add(filename)
+        ret.append(filename)
+        with open(filename, 'rb') as f:
+            text = f.read().decode('utf-8', 'replace')
+        for name in reversed(include_pattern.findall(text)):
+            stack.extend([ c for c in reversed(include_candidates(name, filename, include))
+                           if os.path.isfile(c) ])
+    return ret
+
+class ParseCache(object):
+    """
+    Snapshots of parsed designs in <cache_dir>/parse, at most max_size bytes
+    in total. The modification time of an entry is its last use, so that
+    eviction does not depend on the access times of the file system.
+    """
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        self.root = cache_dir
+        self.cache_dir = get_cache_dir(cache_dir, 'parse')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, filelist, include=(), define=()):
+        h = hashlib.sha256()
+        h.update(PARSER_VERSION.encode('utf-8'))
+        for filename in input_files(filelist, include):
+            h.update(('file %s %s\n' % (filename, file_digest(filename))).encode('utf-8'))
+        for path in include:
+            h.update(('include %s\n' % os.path.abspath(path)).encode('utf-8'))
+        for d in define:
+            h.update(('define %s\n' % d).encode('utf-8'))
+        return h.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key + '.snapshot')
+
+    def get(self, key):
+        """ (ast, directives, preprocessed lines) stored under key, or None """
+        if self.cache_dir is None:
+            return None
+        filename = self.path(key)
+        try:
+            store = snapshot.load_store(filename)
+            os.utime(filename, None)
+        except (IOError, OSError, snapshot.SnapshotError):
+            # missing, evicted by another process meanwhile, or unreadable
+            return None
+        if store.lines is None:
+            # saved without its line count, parsed again to record it
+            return None
+        return store.root(), store.directives, store.lines
+
+    def put(self, key, ast, directives, lines):
+        if self.cache_dir is None:
+            return
+        try:
+            snapshot.save(ast, self.path(key), directives, lines)
+        except (IOError, OSError):
+            return
+        self.evict()
+
+    def entries(self):
+        """ (last use, size, filename) of each entry, least recently used first """
+        ret = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.snapshot'):
+                continue
+            filename = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                continue
+            ret.append( (st.st_mtime, st.st_size, filename) )
+        return sorted(ret)
+
+    def evict(self):
+        entries = self.entries()
+        size = sum([ s for t, s, f in entries ])
+        for mtime, s, filename in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            size -= s
+
+    def parse(self, filelist, preprocess_include=None, preprocess_define=None,
+              preprocess_output='preprocess.output'):
+        """
+        (ast, directives, preprocessed lines) of filelist, as VerilogCodeParser
+        would give them
+        """
+        include = preprocess_include or ()
+        define = preprocess_define or ()
+        key = self.key(filelist, include, define) if self.cache_dir is not None else None
+        cached = self.get(key) if key is not None else None
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        codeparser = VerilogCodeParser(filelist,
+                                       preprocess_output=preprocess_output,
+                                       preprocess_include=preprocess_include,
+                                       preprocess_define=preprocess_define,
+                                       cache_dir=self.root)
+        ast = codeparser.parse()
+        directives = codeparser.get_directives()
+        lines = codeparser.get_lines()
+        if key is not None:
+            self.put(key, ast, directives, lines)
+        return ast, directives, lines
+
+    def report(self):
+        return 'parse cache: %d hits, %d misses' % (self.hits, self.misses)
@@ -1,412 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-_tabversion = '3.2'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'y\x8f\xe1`\xfc\xb1\xf9\x9b\xbdn\x8b\\o\x80Q\x8b'
-    
-_lr_action_items = {'DELAY':([10,11,12,46,66,67,68,72,75,79,80,85,88,89,90,92,93,97,99,100,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,233,235,308,309,310,311,312,313,323,324,329,330,331,332,333,334,335,337,338,340,348,353,357,378,383,402,417,429,434,435,439,443,444,445,446,465,467,472,476,483,485,490,491,493,494,496,514,515,516,517,519,520,536,538,540,541,542,543,544,545,546,547,548,554,556,557,560,562,569,571,597,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,651,655,656,657,658,683,685,686,688,689,690,691,693,694,714,715,716,717,718,719,729,],[16,-11,-10,-375,170,-37,-383,-35,-32,-40,-41,229,229,-38,-36,-33,245,-34,-39,245,-376,170,170,-218,-215,-210,170,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,170,-196,-31,229,-85,170,-234,-235,-247,-281,170,-232,-381,229,-382,-202,-199,-197,-206,-200,-201,-277,-89,229,-80,-70,-383,-92,-174,-173,-233,-246,-380,170,-231,229,229,-90,-91,-81,229,229,-71,-365,-366,-364,229,-363,229,-346,-347,-345,-93,-94,170,170,-241,-245,-242,-244,-237,170,-239,-243,-240,229,-260,-198,-189,-207,170,229,-362,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,170,-259,-249,-253,-254,-49,170,170,-266,-225,-223,-251,-267,170,170,170,229,-263,-256,-255,-248,-250,]),'COND':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,139,-121,-119,-124,-120,-128,-127,139,-376,-123,139,-334,-122,-126,-125,139,-154,-163,139,139,-146,-136,-152,139,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-175,-176,-161,139,139,139,-174,139,-166,139,139,-173,-356,139,139,139,139,139,139,139,139,139,139,139,139,-336,-335,139,139,139,139,139,-154,139,139,139,139,139,-170,-171,-172,-167,-168,-169,139,139,139,139,139,139,139,139,-158,-161,139,139,139,]),'MINUS':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[32,32,-178,-186,-160,-183,-162,-156,-158,32,-157,32,-179,32,-175,32,32,-182,-184,-180,32,-181,-375,-155,-187,32,32,-176,-185,-177,-159,32,-161,141,32,32,-121,32,-119,-124,-120,-128,-127,141,-376,-123,141,-334,-122,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-126,-125,-218,32,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,32,-230,32,32,141,-154,32,-163,32,32,32,141,141,141,141,141,141,141,-134,141,-129,141,141,-133,141,141,141,141,-131,-130,141,141,141,141,141,141,141,-132,-247,-281,32,-175,32,-176,-161,141,32,32,-232,32,-381,-382,32,-277,141,32,32,32,32,-229,-228,32,-227,32,32,32,141,32,32,32,32,-174,141,-166,141,141,32,32,32,-173,-356,32,32,-246,141,141,-380,141,-231,-383,-383,32,-258,-257,32,32,32,32,141,32,141,-383,32,141,32,141,-383,141,32,32,141,141,141,141,-336,32,-335,141,141,141,141,141,-154,32,-237,32,32,32,141,141,141,32,32,32,32,141,-226,141,32,32,32,32,32,32,32,32,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,32,141,-236,32,-249,-253,-254,141,141,141,141,141,141,141,-158,-161,141,32,32,-266,-269,-225,-223,-251,-267,141,-274,141,-271,-383,-263,-256,-255,-248,-250,32,]),'RPAREN':([19,22,25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,105,106,109,110,111,114,115,117,120,121,122,123,124,125,126,127,131,132,134,152,161,162,209,259,263,266,270,272,275,276,278,279,280,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,332,333,337,338,389,391,392,393,394,395,405,407,408,410,411,413,417,419,421,422,423,424,425,429,430,436,437,438,440,441,442,448,453,454,455,456,458,462,466,468,469,471,478,507,508,509,510,511,522,528,530,534,535,551,554,556,563,564,565,566,571,602,603,604,605,623,624,625,626,627,628,629,630,648,649,650,651,652,653,654,659,673,675,676,677,678,680,681,708,709,710,728,732,],[61,107,-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-43,255,-30,-29,260,-17,264,-121,-119,-124,-120,-128,-127,270,-376,-123,-334,-122,-383,297,-126,-125,-96,-46,-14,-21,-154,-163,-383,-383,430,-359,-358,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-202,-199,-200,-201,-302,-303,505,-305,-308,-306,-42,-48,-47,-28,-22,-23,-174,-166,-338,528,-339,-340,530,-173,-356,536,-252,537,538,539,-268,552,557,560,562,-195,-205,569,-95,-97,-118,572,579,-299,607,609,-297,-300,-44,-336,-335,-357,-153,645,-383,-260,-191,-192,-193,-190,-383,674,-304,676,-307,-45,-170,-171,-172,-337,-167,-168,-169,-261,693,-262,-259,-203,-204,-194,695,707,-158,-311,708,709,-296,-298,-309,-310,728,-301,-224,]),'POWER':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,143,-121,-119,-124,-120,-128,-127,143,-376,-123,143,-334,-122,-126,-125,143,-154,-163,143,143,143,143,143,143,143,143,143,-129,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,-175,-176,-161,143,143,143,-174,143,-166,143,143,-173,-356,143,143,143,143,143,143,143,143,143,143,143,143,-336,-335,143,143,143,143,143,-154,143,143,143,143,143,-170,-171,-172,-167,-168,-169,143,143,143,143,143,143,143,143,-158,-161,143,143,143,]),'CASEX':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,383,402,417,429,434,435,439,443,444,465,467,472,485,490,491,493,494,496,514,515,516,517,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,597,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,178,-383,-376,178,178,-218,-215,-210,178,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,178,-196,-85,178,-234,-235,-247,-281,178,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-383,-92,-174,-173,-233,-246,-380,178,-231,-90,-91,-81,-71,-365,-366,-364,178,-363,178,-346,-347,-345,-93,-94,178,178,-241,-245,-242,-244,-237,178,-239,-243,-240,-198,-189,-207,178,-362,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,178,-249,-253,-254,178,178,-266,-225,-223,-251,-267,178,178,178,-263,-256,-255,-248,-250,]),'PLUS':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[36,36,-178,-186,-160,-183,-162,-156,-158,36,-157,36,-179,36,-175,36,36,-182,-184,-180,36,-181,-375,-155,-187,36,36,-176,-185,-177,-159,36,-161,146,36,36,-121,36,-119,-124,-120,-128,-127,146,-376,-123,146,-334,-122,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-126,-125,-218,36,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,36,-230,36,36,146,-154,36,-163,36,36,36,146,146,146,146,146,146,146,-134,146,-129,146,146,-133,146,146,146,146,-131,-130,146,146,146,146,146,146,146,-132,-247,-281,36,-175,36,-176,-161,146,36,36,-232,36,-381,-382,36,-277,146,36,36,36,36,-229,-228,36,-227,36,36,36,146,36,36,36,36,-174,146,-166,146,146,36,36,36,-173,-356,36,36,-246,146,146,-380,146,-231,-383,-383,36,-258,-257,36,36,36,36,146,36,146,-383,36,146,36,146,-383,146,36,36,146,146,146,146,-336,36,-335,146,146,146,146,146,-154,36,-237,36,36,36,146,146,146,36,36,36,36,146,-226,146,36,36,36,36,36,36,36,36,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,36,146,-236,36,-249,-253,-254,146,146,146,146,146,146,146,-158,-161,146,36,36,-266,-269,-225,-223,-251,-267,146,-274,146,-271,-383,-263,-256,-255,-248,-250,36,]),'GT':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,149,-121,-119,-124,-120,-128,-127,149,-376,-123,149,-334,-122,-126,-125,149,-154,-163,149,149,149,-136,149,149,-135,-134,-141,-129,149,-139,-133,-138,149,-140,149,-131,-130,-142,149,149,149,149,-137,149,-132,-175,-176,-161,149,149,149,-174,149,-166,149,149,-173,-356,149,149,149,149,149,149,149,149,149,149,149,149,-336,-335,149,149,149,149,149,-154,149,149,149,149,149,-170,-171,-172,-167,-168,-169,149,149,149,149,149,149,149,149,-158,-161,149,149,149,]),'RBRACE':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,117,120,121,122,123,124,126,127,128,129,131,132,161,162,270,272,273,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,366,367,368,369,370,371,372,417,418,419,420,429,430,481,528,530,535,581,624,625,626,628,629,630,699,700,701,703,704,705,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-121,-119,-124,-120,-128,-127,-376,-123,272,-165,-334,-122,-126,-125,-154,-163,419,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-111,-113,-109,-112,-110,-106,481,-174,-164,-166,-165,-173,-356,-107,-336,-335,-153,-108,-170,-171,-172,-167,-168,-169,-100,-101,-102,-103,-104,-105,]),'MODULE':([0,1,6,7,8,13,61,253,297,],[4,-4,-6,4,-5,-3,-8,-9,-7,]),'GE':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,153,-121,-119,-124,-120,-128,-127,153,-376,-123,153,-334,-122,-126,-125,153,-154,-163,153,153,153,-136,153,153,-135,-134,-141,-129,153,-139,-133,-138,153,-140,153,-131,-130,-142,153,153,153,153,-137,153,-132,-175,-176,-161,153,153,153,-174,153,-166,153,153,-173,-356,153,153,153,153,153,153,153,153,153,153,153,153,-336,-335,153,153,153,153,153,-154,153,153,153,153,153,-170,-171,-172,-167,-168,-169,153,153,153,153,153,153,153,153,-158,-161,153,153,153,]),'EQL':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,155,-121,-119,-124,-120,-128,-127,155,-376,-123,155,-334,-122,-126,-125,155,-154,-163,155,155,-146,-136,155,155,-135,-134,-141,-129,-144,-139,-133,-138,155,-140,155,-131,-130,-142,155,-145,-143,155,-137,155,-132,-175,-176,-161,155,155,155,-174,155,-166,155,155,-173,-356,155,155,155,155,155,155,155,155,155,155,155,155,-336,-335,155,155,155,155,155,-154,155,155,155,155,155,-170,-171,-172,-167,-168,-169,155,155,155,155,155,155,155,155,-158,-161,155,155,155,]),'LBRACKET':([31,46,57,67,70,72,75,79,80,88,89,90,92,94,97,99,102,108,116,126,223,231,233,238,318,337,338,361,365,370,371,388,406,417,429,487,492,564,565,675,677,],[118,-375,133,-37,204,-35,-32,-40,-41,204,-38,-36,-33,204,-34,-39,204,204,204,-376,358,373,-31,381,133,460,461,477,479,373,358,204,204,-174,-173,381,204,479,477,118,133,]),'OUTPUT':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,97,97,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,97,-66,-40,-41,-63,-58,-60,-53,-67,97,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,97,97,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,97,-319,-321,-31,-51,97,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,97,-288,97,-289,-92,-25,97,-24,-246,-380,97,-231,-90,-91,-81,-77,-71,-365,-366,97,-364,97,-363,-282,97,97,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,97,-239,-243,-240,97,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,97,-328,-326,-341,-266,-225,-223,-251,-267,97,97,97,-99,-263,-256,-255,-248,-333,-332,-331,97,-323,-329,-330,-325,-250,97,-324,]),'OR':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[59,59,-178,-186,-160,-183,-162,-156,-158,59,-157,59,-179,59,-175,59,59,-182,-184,-180,59,-181,-375,-155,-187,59,59,-176,-185,-177,-159,59,-161,159,59,59,-121,59,-119,-124,-120,-128,-127,159,-376,-123,159,-334,-122,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-126,-125,-218,59,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,59,-230,59,59,159,-154,59,-163,59,59,59,159,159,-146,-136,159,159,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,159,-145,-143,-147,-137,-150,-132,-247,-281,59,-175,59,-176,-161,159,59,59,-232,59,-381,-382,59,-277,159,59,59,59,59,-229,-228,59,-227,59,59,59,159,59,59,59,59,-174,159,-166,159,159,59,59,59,-173,-356,59,59,-246,159,159,-380,159,-231,-383,-383,59,-258,-257,59,59,59,59,159,59,159,-383,59,159,59,159,-383,159,59,59,159,159,159,159,-336,59,-335,159,159,159,159,159,-154,59,-237,59,59,59,159,159,159,59,59,59,59,159,-226,159,59,59,59,59,59,59,59,59,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,59,159,-236,59,-249,-253,-254,159,159,159,159,159,159,159,-158,-161,159,59,59,-266,-269,-225,-223,-251,-267,159,-274,159,-271,-383,-263,-256,-255,-248,-250,59,]),'TRI':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,90,90,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,90,-66,-40,-41,-63,-58,-60,-53,-67,90,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,90,90,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,90,-319,-321,-31,-51,90,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,90,-288,90,-289,-92,-25,90,-24,-246,-380,90,-231,-90,-91,-81,-77,-71,-365,-366,90,-364,90,-363,-282,90,90,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,90,-239,-243,-240,90,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,90,-328,-326,-341,-266,-225,-223,-251,-267,90,90,90,-99,-263,-256,-255,-248,-333,-332,-331,90,-323,-329,-330,-325,-250,90,-324,]),'SIGNED_INTNUMBER_HEX':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[26,26,-178,-186,-183,26,26,-179,26,26,26,-182,-184,-180,26,-181,-375,26,26,-185,26,26,26,26,-376,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-218,26,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,26,-230,26,26,26,26,26,26,26,-247,-281,26,26,26,26,-232,26,-381,-382,26,-277,26,26,26,26,-229,-228,26,-227,26,26,26,26,26,26,26,26,26,26,26,26,-246,-380,-231,-383,-383,26,-258,-257,26,26,26,26,26,-383,26,26,-383,26,26,26,26,-237,26,26,26,26,26,26,26,-226,26,26,26,26,26,26,26,26,-280,-278,-279,-265,-264,-270,26,-236,26,-249,-253,-254,26,26,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,26,]),'INITIAL':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,66,-8,-56,-61,-59,-57,-54,-62,-65,66,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,66,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,66,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,66,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,66,-328,-326,-341,-266,-225,-223,-251,-267,66,66,66,-99,-263,-256,-255,-248,-333,-332,-331,66,-323,-329,-330,-325,-250,66,-324,]),'SIGNED_INTNUMBER_OCT':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[41,41,-178,-186,-183,41,41,-179,41,41,41,-182,-184,-180,41,-181,-375,41,41,-185,41,41,41,41,-376,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-218,41,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,41,-230,41,41,41,41,41,41,41,-247,-281,41,41,41,41,-232,41,-381,-382,41,-277,41,41,41,41,-229,-228,41,-227,41,41,41,41,41,41,41,41,41,41,41,41,-246,-380,-231,-383,-383,41,-258,-257,41,41,41,41,41,-383,41,41,-383,41,41,41,41,-237,41,41,41,41,41,41,41,-226,41,41,41,41,41,41,41,41,-280,-278,-279,-265,-264,-270,41,-236,41,-249,-253,-254,41,41,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,41,]),'GENVAR':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,69,-8,-56,-61,-59,-57,-54,-62,-65,69,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,69,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,69,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,69,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,69,-328,-326,-341,-266,-225,-223,-251,-267,69,69,69,-99,-263,-256,-255,-248,-333,-332,-331,69,-323,-329,-330,-325,-250,69,-324,]),'INOUT':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,72,72,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,72,-66,-40,-41,-63,-58,-60,-53,-67,72,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,72,72,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,72,-319,-321,-31,-51,72,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,72,-288,72,-289,-92,-25,72,-24,-246,-380,72,-231,-90,-91,-81,-77,-71,-365,-366,72,-364,72,-363,-282,72,72,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,72,-239,-243,-240,72,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,72,-328,-326,-341,-266,-225,-223,-251,-267,72,72,72,-99,-263,-256,-255,-248,-333,-332,-331,72,-323,-329,-330,-325,-250,72,-324,]),'BEGIN':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,383,402,417,429,434,435,439,443,444,465,467,472,485,490,491,493,494,496,514,515,516,517,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,572,597,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,695,698,714,716,717,718,719,729,],[-375,175,-383,-376,175,175,-218,-215,-210,175,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,175,-196,-85,175,-234,-235,-247,-281,175,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-383,-92,-174,-173,-233,-246,-380,175,-231,-90,-91,-81,-71,-365,-366,-364,175,-363,175,-346,-347,-345,-93,-94,175,175,-241,-245,-242,-244,-237,175,-239,-243,-240,-198,-189,-207,175,661,-362,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,175,-249,-253,-254,175,175,-266,-225,-223,-251,-267,175,175,661,661,175,-263,-256,-255,-248,-250,]),'INTNUMBER_DEC':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[35,35,-178,-186,-183,35,35,-179,35,35,35,-182,-184,-180,35,-181,-375,35,35,-185,35,35,35,35,-376,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-218,35,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,35,-230,35,35,35,35,35,35,35,-247,-281,35,35,35,35,-232,35,-381,-382,35,-277,35,35,35,35,-229,-228,35,-227,35,35,35,35,35,35,35,35,35,35,35,35,-246,-380,-231,-383,-383,35,-258,-257,35,35,35,35,35,-383,35,35,-383,35,35,35,35,-237,35,35,35,35,35,35,35,-226,35,35,35,35,35,35,35,35,-280,-278,-279,-265,-264,-270,35,-236,35,-249,-253,-254,35,35,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,35,]),'COLON':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,117,120,121,122,123,124,126,127,131,132,161,162,175,269,270,272,277,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,345,417,419,429,430,474,482,489,528,530,535,567,568,624,625,626,628,629,630,636,637,640,661,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-121,-119,-124,-120,-128,-127,-376,-123,-334,-122,-126,-125,322,414,-154,-163,426,-146,-136,-152,432,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,464,-174,-166,-173,-356,573,582,586,-336,-335,-153,426,414,-170,-171,-172,-167,-168,-169,683,685,-273,696,-272,]),'INTEGER':([20,21,61,62,64,65,70,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,102,103,104,116,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,409,435,439,443,444,465,467,472,484,485,490,491,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,83,-8,-56,-61,-59,207,-57,-54,-62,-65,83,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,252,-69,83,267,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,83,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,83,-288,83,-289,-92,-25,-24,-246,-380,83,-231,-90,-91,-81,-77,-71,-365,-366,-364,83,-363,-282,83,83,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,83,-239,-243,-240,83,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,83,-328,-326,-341,-266,-225,-223,-251,-267,83,83,83,-99,-263,-256,-255,-248,-333,-332,-331,83,-323,-329,-330,-325,-250,83,-324,]),'$end':([1,3,5,6,7,8,13,61,253,297,],[-4,-1,0,-6,-2,-5,-3,-8,-9,-7,]),'FUNCTION':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,94,-8,-56,-61,-59,-57,-54,-62,-65,94,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,94,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,94,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,94,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,94,-328,-326,-341,-266,-225,-223,-251,-267,94,94,94,-99,-263,-256,-255,-248,-333,-332,-331,94,-323,-329,-330,-325,-250,94,-324,]),'XNOR':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[38,38,-178,-186,-160,-183,-162,-156,-158,38,-157,38,-179,38,-175,38,38,-182,-184,-180,38,-181,-375,-155,-187,38,38,-176,-185,-177,-159,38,-161,148,38,38,-121,38,-119,-124,-120,-128,-127,148,-376,-123,148,-334,-122,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-126,-125,-218,38,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,38,-230,38,38,148,-154,38,-163,38,38,38,148,148,-146,-136,148,148,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,148,-145,-143,-147,-137,148,-132,-247,-281,38,-175,38,-176,-161,148,38,38,-232,38,-381,-382,38,-277,148,38,38,38,38,-229,-228,38,-227,38,38,38,148,38,38,38,38,-174,148,-166,148,148,38,38,38,-173,-356,38,38,-246,148,148,-380,148,-231,-383,-383,38,-258,-257,38,38,38,38,148,38,148,-383,38,148,38,148,-383,148,38,38,148,148,148,148,-336,38,-335,148,148,148,148,148,-154,38,-237,38,38,38,148,148,148,38,38,38,38,148,-226,148,38,38,38,38,38,38,38,38,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,38,148,-236,38,-249,-253,-254,148,148,148,148,148,148,148,-158,-161,148,38,38,-266,-269,-225,-223,-251,-267,148,-274,148,-271,-383,-263,-256,-255,-248,-250,38,]),'END':([61,62,64,65,71,74,76,78,81,82,84,87,96,98,103,169,172,174,175,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,215,217,297,308,310,311,312,313,323,324,329,331,340,341,342,344,348,351,357,378,379,385,400,402,434,435,439,443,444,465,467,472,484,485,498,518,519,520,540,541,542,543,544,545,546,547,548,576,599,612,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,697,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-8,-56,-61,-59,-57,-62,-65,-66,-63,-58,-60,-67,-68,-64,-69,-218,-215,-210,324,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,-319,-321,-7,-85,-234,-235,-247,-281,444,-232,-381,-382,-277,-222,-188,-312,-89,-318,-80,-70,-76,-288,-289,-92,-233,-246,-380,544,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-241,-245,-242,-244,-237,641,-239,-243,-240,-98,-360,-342,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,-383,-328,-326,-341,-266,-225,-223,-251,-267,724,-99,-263,-256,-255,-248,-333,-332,-331,-383,-323,-329,-330,-325,-250,733,-324,]),'DIVIDE':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,151,-121,-119,-124,-120,-128,-127,151,-376,-123,151,-334,-122,-126,-125,151,-154,-163,151,151,151,151,151,151,151,151,151,-129,151,151,151,151,151,151,151,-131,-130,151,151,151,151,151,151,151,-132,-175,-176,-161,151,151,151,-174,151,-166,151,151,-173,-356,151,151,151,151,151,151,151,151,151,151,151,151,-336,-335,151,151,151,151,151,-154,151,151,151,151,151,-170,-171,-172,-167,-168,-169,151,151,151,151,151,151,151,151,-158,-161,151,151,151,]),'FOR':([46,61,62,64,65,66,68,71,74,76,77,78,81,82,84,87,96,98,103,126,166,167,169,172,174,175,177,179,182,183,185,186,188,189,190,191,194,197,198,199,200,210,211,212,213,215,217,297,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,341,342,344,348,351,357,378,379,383,385,400,402,417,429,434,435,439,443,444,465,467,472,484,485,490,491,493,494,496,498,514,515,516,517,518,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,572,576,597,599,612,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,660,661,662,663,682,683,685,686,688,689,690,691,693,694,695,697,698,702,714,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-375,-8,-56,-61,-59,187,-383,-57,-62,-65,214,-66,-63,-58,-60,-67,-68,-64,-69,-376,187,187,-218,-215,-210,187,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,187,-196,-322,-320,-317,214,-319,-321,-7,-85,187,-234,-235,-247,-281,187,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-222,-188,-312,-89,-318,-80,-70,-76,-383,-288,-289,-92,-174,-173,-233,-246,-380,187,-231,-90,-91,-81,-77,-71,-365,-366,-364,187,-363,-282,187,-346,-347,-345,-283,-93,-94,187,187,-241,-245,-242,-244,-237,187,-239,-243,-240,-198,-189,-207,187,214,-98,-362,-360,-342,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,187,-249,-253,-254,-327,214,-328,-326,-341,187,187,-266,-225,-223,-251,-267,187,187,214,214,214,-99,187,-263,-256,-255,-248,-333,-332,-331,214,-323,-329,-330,-325,-250,214,-324,]),'ENDTASK':([169,172,174,177,179,182,183,186,189,190,191,194,197,198,312,313,324,329,331,340,435,439,444,495,544,588,590,591,592,593,594,595,596,598,631,632,633,634,635,641,655,656,657,686,688,689,690,691,716,717,718,719,729,],[-218,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,-247,-281,-232,-381,-382,-277,-246,-380,-231,599,-237,-372,-367,-370,-368,-361,-369,-371,-374,-373,-280,-278,-279,-265,-264,-236,-249,-253,-254,-266,-225,-223,-251,-267,-263,-256,-255,-248,-250,]),'ENDCASE':([169,172,174,177,179,182,183,186,189,190,191,194,197,198,312,313,324,329,331,340,435,439,444,544,631,632,633,634,635,638,639,641,646,655,656,657,686,687,688,689,690,691,711,713,716,717,718,719,729,],[-218,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,-247,-281,-232,-381,-382,-277,-246,-380,-231,-237,-280,-278,-279,-265,-264,-270,686,-236,691,-249,-253,-254,-266,-269,-225,-223,-251,-267,-274,-271,-263,-256,-255,-248,-250,]),'EQUALS':([14,46,126,208,222,223,224,225,228,231,238,325,360,374,417,429,481,553,692,699,700,701,703,704,705,],[18,-375,-376,350,-115,-106,-114,359,-116,-117,380,446,476,483,-174,-173,-107,446,715,-100,-101,-102,-103,-104,-105,]),'ELSE':([61,62,64,65,71,74,76,78,81,82,84,87,96,98,103,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,217,297,308,312,313,324,329,331,340,341,342,344,348,357,378,379,385,400,402,435,439,444,465,467,472,484,485,498,518,519,520,544,576,599,612,631,632,633,634,635,641,655,656,657,660,662,663,682,686,688,689,690,691,702,716,717,718,719,720,721,722,724,725,726,727,729,733,],[-8,-56,-61,-59,-57,-62,-65,-66,-63,-58,-60,-67,-68,-64,-69,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-321,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-80,-70,-76,-288,-289,-92,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,-98,-360,-342,-280,-278,-279,-265,-264,-236,694,-253,-254,-327,-328,698,-341,-266,-225,-223,714,-267,-99,-263,-256,-255,-248,-333,-332,-331,-323,-329,-330,-325,-250,-324,]),'TASK':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,91,-8,-56,-61,-59,-57,-54,-62,-65,91,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,91,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,91,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,91,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,91,-328,-326,-341,-266,-225,-223,-251,-267,91,91,91,-99,-263,-256,-255,-248,-333,-332,-331,91,-323,-329,-330,-325,-250,91,-324,]),'INPUT':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,92,92,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,92,-66,-40,-41,-63,-58,-60,-53,-67,92,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,92,92,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,92,-319,-321,-31,-51,92,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,92,-288,92,-289,-92,-25,92,-24,-246,-380,92,-231,-90,-91,-81,-77,-71,-365,-366,92,-364,92,-363,-282,92,92,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,92,-239,-243,-240,92,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,92,-328,-326,-341,-266,-225,-223,-251,-267,92,92,92,-99,-263,-256,-255,-248,-333,-332,-331,92,-323,-329,-330,-325,-250,92,-324,]),'EQ':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,156,-121,-119,-124,-120,-128,-127,156,-376,-123,156,-334,-122,-126,-125,156,-154,-163,156,156,-146,-136,156,156,-135,-134,-141,-129,-144,-139,-133,-138,156,-140,156,-131,-130,-142,156,-145,-143,156,-137,156,-132,-175,-176,-161,156,156,156,-174,156,-166,156,156,-173,-356,156,156,156,156,156,156,156,156,156,156,156,156,-336,-335,156,156,156,156,156,-154,156,156,156,156,156,-170,-171,-172,-167,-168,-169,156,156,156,156,156,156,156,156,-158,-161,156,156,156,]),'GENERATE':([20,21,61,62,64,65,71,73,74,76,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,254,257,297,308,312,313,324,329,331,340,341,342,344,348,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,576,599,612,631,632,633,634,635,641,655,656,657,682,686,688,689,690,691,702,716,717,718,719,729,],[-27,77,-8,-56,-61,-59,-57,-54,-62,-65,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,77,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-341,-266,-225,-223,-251,-267,-99,-263,-256,-255,-248,-250,]),'AND':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[49,49,-178,-186,-160,-183,-162,-156,-158,49,-157,49,-179,49,-175,49,49,-182,-184,-180,49,-181,-375,-155,-187,49,49,-176,-185,-177,-159,49,-161,157,49,49,-121,49,-119,-124,-120,-128,-127,157,-376,-123,157,-334,-122,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-126,-125,-218,49,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,49,-230,49,49,157,-154,49,-163,49,49,49,157,157,-146,-136,157,157,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,157,-145,-143,-147,-137,157,-132,-247,-281,49,-175,49,-176,-161,157,49,49,-232,49,-381,-382,49,-277,157,49,49,49,49,-229,-228,49,-227,49,49,49,157,49,49,49,49,-174,157,-166,157,157,49,49,49,-173,-356,49,49,-246,157,157,-380,157,-231,-383,-383,49,-258,-257,49,49,49,49,157,49,157,-383,49,157,49,157,-383,157,49,49,157,157,157,157,-336,49,-335,157,157,157,157,157,-154,49,-237,49,49,49,157,157,157,49,49,49,49,157,-226,157,49,49,49,49,49,49,49,49,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,49,157,-236,49,-249,-253,-254,157,157,157,157,157,157,157,-158,-161,157,49,49,-266,-269,-225,-223,-251,-267,157,-274,157,-271,-383,-263,-256,-255,-248,-250,49,]),'LBRACE':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,59,60,66,68,85,117,118,120,121,122,123,124,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,166,167,169,170,172,174,175,176,177,179,182,183,184,186,189,190,191,194,197,198,199,200,204,226,227,230,242,268,270,271,272,274,275,276,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,308,309,310,311,312,313,314,315,316,317,318,320,321,323,324,327,329,330,331,332,333,334,335,337,338,339,340,348,350,353,354,357,358,359,362,363,364,365,373,378,380,381,383,396,402,414,415,416,417,419,426,427,428,429,430,431,432,434,435,439,443,444,445,446,447,449,450,451,452,460,461,464,465,467,470,472,476,477,479,480,483,485,490,491,493,494,496,501,502,514,515,516,517,519,520,528,529,530,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,552,554,556,557,560,562,569,571,573,574,575,577,579,582,583,584,585,586,589,597,601,604,608,621,624,625,626,628,629,630,631,632,633,634,635,638,639,641,642,645,646,647,650,651,655,656,657,679,683,684,685,686,687,688,689,690,691,693,694,711,713,714,715,716,717,718,719,729,730,],[50,50,-178,-186,-160,-183,-162,-156,-158,50,-157,50,-179,50,-175,50,50,-182,-184,-180,50,-181,-375,-155,-187,50,50,-176,-185,-177,-159,50,-161,50,50,-383,-383,230,-121,50,-119,-124,-120,-128,-127,-376,-123,274,-334,-122,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-126,-125,-383,-383,-218,50,-215,-210,-383,230,-219,-212,-208,-220,-230,-211,-213,-214,-209,-217,-221,-216,-383,-196,50,230,-230,230,50,50,-154,50,-163,50,50,50,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-85,-383,-234,-235,-247,-281,50,-228,50,-229,-227,50,50,-383,-232,50,-381,-383,-382,-202,-199,-197,-206,-200,-201,50,-277,-89,50,-383,50,-80,50,50,-229,-228,50,-227,50,-70,50,50,-383,50,-92,50,50,50,-174,-166,50,50,50,-173,-356,50,50,-233,-246,-380,-383,-231,-383,-383,50,-258,230,-257,50,50,50,50,-90,-91,50,-81,-383,50,50,230,-383,-71,-365,-366,-364,-383,-363,50,50,-383,-346,-347,-345,-93,-94,-336,50,-335,-153,-383,-226,-383,50,-241,-245,-242,-244,-237,-383,-239,-243,-240,50,50,50,-383,-260,-198,-189,-207,-383,-383,50,50,50,50,-226,50,50,50,50,50,230,-362,50,50,50,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,50,-236,-238,-383,50,230,-230,-259,-249,-253,-254,50,-383,50,-383,-266,-269,-225,-223,-251,-267,-383,-383,-274,-271,-383,-383,-263,-256,-255,-248,-250,50,]),'INTNUMBER_HEX':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[52,52,-178,-186,-183,52,52,-179,52,52,52,-182,-184,-180,52,-181,-375,52,52,-185,52,52,52,52,-376,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-218,52,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,52,-230,52,52,52,52,52,52,52,-247,-281,52,52,52,52,-232,52,-381,-382,52,-277,52,52,52,52,-229,-228,52,-227,52,52,52,52,52,52,52,52,52,52,52,52,-246,-380,-231,-383,-383,52,-258,-257,52,52,52,52,52,-383,52,52,-383,52,52,52,52,-237,52,52,52,52,52,52,52,-226,52,52,52,52,52,52,52,52,-280,-278,-279,-265,-264,-270,52,-236,52,-249,-253,-254,52,52,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,52,]),'SIGNED':([20,21,22,54,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,99,99,130,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,99,-66,-40,-41,-63,-58,219,-60,-53,-67,99,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,99,99,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,99,-319,-321,-31,-51,99,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,99,-288,99,-289,-92,-25,99,-24,-246,-380,99,-231,-90,-91,-81,-77,-71,-365,-366,99,-364,99,-363,-282,99,99,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,99,-239,-243,-240,99,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,99,-328,-326,-341,-266,-225,-223,-251,-267,99,99,99,-99,-263,-256,-255,-248,-333,-332,-331,99,-323,-329,-330,-325,-250,99,-324,]),'DOLLER':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,66,68,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,166,167,169,170,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,204,227,242,268,271,274,275,276,308,309,310,311,312,313,314,316,320,321,323,324,327,329,331,332,333,334,335,337,338,339,340,348,350,354,357,358,359,362,363,364,365,373,378,380,381,396,402,414,415,416,417,426,427,428,429,431,432,434,435,439,443,444,445,446,447,449,451,452,460,461,464,465,467,470,472,476,477,479,483,485,501,502,519,520,529,536,538,539,540,541,542,543,544,545,546,547,548,549,550,552,557,560,562,569,573,574,575,577,579,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,641,642,645,646,655,656,657,679,683,684,685,686,687,688,689,690,691,693,694,711,713,714,715,716,717,718,719,729,730,],[54,54,-178,-186,-183,54,54,-179,54,54,54,-182,-184,-180,54,-181,-375,54,54,-185,54,54,54,54,-383,54,-376,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-218,54,-215,-210,54,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,54,-196,54,-230,54,54,54,54,54,54,-85,54,-234,-235,-247,-281,54,54,54,54,54,-232,54,-381,-382,-202,-199,-197,-206,-200,-201,54,-277,-89,54,54,-80,54,54,-229,-228,54,-227,54,-70,54,54,54,-92,54,54,54,-174,54,54,54,-173,54,54,-233,-246,-380,54,-231,-383,-383,54,-258,-257,54,54,54,54,-90,-91,54,-81,-383,54,54,-383,-71,54,54,-93,-94,54,54,54,54,-241,-245,-242,-244,-237,54,-239,-243,-240,54,54,54,-198,-189,-207,54,54,54,54,54,-226,54,54,54,54,54,54,54,54,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,54,-236,-238,54,54,-249,-253,-254,54,54,54,54,-266,-269,-225,-223,-251,-267,54,54,-274,-271,54,-383,-263,-256,-255,-248,-250,54,]),'LOCALPARAM':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,443,444,465,467,472,484,485,498,518,519,520,540,541,542,543,544,545,546,547,548,572,576,599,612,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,102,-8,-56,-61,-59,-57,-54,-62,-65,102,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,102,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,102,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,102,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-241,-245,-242,-244,-237,102,-239,-243,-240,102,-98,-360,-342,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,102,-328,-326,-341,-266,-225,-223,-251,-267,102,102,102,-99,-263,-256,-255,-248,-333,-332,-331,102,-323,-329,-330,-325,-250,102,-324,]),'LSHIFTA':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,158,-121,-119,-124,-120,-128,-127,158,-376,-123,158,-334,-122,-126,-125,158,-154,-163,158,158,158,-136,158,158,-135,-134,158,-129,158,158,-133,-138,158,158,158,-131,-130,158,158,158,158,158,-137,158,-132,-175,-176,-161,158,158,158,-174,158,-166,158,158,-173,-356,158,158,158,158,158,158,158,158,158,158,158,158,-336,-335,158,158,158,158,158,-154,158,158,158,158,158,-170,-171,-172,-167,-168,-169,158,158,158,158,158,158,158,158,-158,-161,158,158,158,]),'NOT':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[56,56,-178,-186,-183,56,56,-179,56,56,56,-182,-184,-180,56,-181,-375,56,56,-185,56,56,56,56,-376,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-218,56,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,56,-230,56,56,56,56,56,56,-247,-281,56,56,56,56,-232,56,-381,-382,56,-277,56,56,56,56,-229,-228,56,-227,56,56,56,56,56,56,56,56,56,56,56,56,-246,-380,-231,-383,-383,56,-258,-257,56,56,56,56,56,-383,56,56,-383,56,56,56,56,-237,56,56,56,56,56,56,56,-226,56,56,56,56,56,56,56,56,-280,-278,-279,-265,-264,-270,56,-236,56,-249,-253,-254,56,56,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,56,]),'NOR':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[60,60,-178,-186,-183,60,60,-179,60,60,60,-182,-184,-180,60,-181,-375,60,60,-185,60,60,60,60,-376,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-218,60,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,60,-230,60,60,60,60,60,60,-247,-281,60,60,60,60,-232,60,-381,-382,60,-277,60,60,60,60,-229,-228,60,-227,60,60,60,60,60,60,60,60,60,60,60,60,-246,-380,-231,-383,-383,60,-258,-257,60,60,60,60,60,-383,60,60,-383,60,60,60,60,-237,60,60,60,60,60,60,60,-226,60,60,60,60,60,60,60,60,-280,-278,-279,-265,-264,-270,60,-236,60,-249,-253,-254,60,60,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,60,]),'MOD':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,160,-121,-119,-124,-120,-128,-127,160,-376,-123,160,-334,-122,-126,-125,160,-154,-163,160,160,160,160,160,160,160,160,160,-129,160,160,160,160,160,160,160,-131,-130,160,160,160,160,160,160,160,-132,-175,-176,-161,160,160,160,-174,160,-166,160,160,-173,-356,160,160,160,160,160,160,160,160,160,160,160,160,-336,-335,160,160,160,160,160,-154,160,160,160,160,160,-170,-171,-172,-167,-168,-169,160,160,160,160,160,160,160,160,-158,-161,160,160,160,]),'REAL':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,443,444,465,467,472,484,485,498,518,519,520,540,541,542,543,544,545,546,547,548,572,576,599,612,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,63,-8,-56,-61,-59,-57,-54,-62,-65,63,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,63,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,63,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,63,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-241,-245,-242,-244,-237,63,-239,-243,-240,63,-98,-360,-342,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,63,-328,-326,-341,-266,-225,-223,-251,-267,63,63,63,-99,-263,-256,-255,-248,-333,-332,-331,63,-323,-329,-330,-325,-250,63,-324,]),'NEL':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,136,-121,-119,-124,-120,-128,-127,136,-376,-123,136,-334,-122,-126,-125,136,-154,-163,136,136,-146,-136,136,136,-135,-134,-141,-129,-144,-139,-133,-138,136,-140,136,-131,-130,-142,136,-145,-143,136,-137,136,-132,-175,-176,-161,136,136,136,-174,136,-166,136,136,-173,-356,136,136,136,136,136,136,136,136,136,136,136,136,-336,-335,136,136,136,136,136,-154,136,136,136,136,136,-170,-171,-172,-167,-168,-169,136,136,136,136,136,136,136,136,-158,-161,136,136,136,]),'RSHIFT':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,137,-121,-119,-124,-120,-128,-127,137,-376,-123,137,-334,-122,-126,-125,137,-154,-163,137,137,137,-136,137,137,-135,-134,137,-129,137,137,-133,-138,137,137,137,-131,-130,137,137,137,137,137,-137,137,-132,-175,-176,-161,137,137,137,-174,137,-166,137,137,-173,-356,137,137,137,137,137,137,137,137,137,137,137,137,-336,-335,137,137,137,137,137,-154,137,137,137,137,137,-170,-171,-172,-167,-168,-169,137,137,137,137,137,137,137,137,-158,-161,137,137,137,]),'DEFAULT':([169,172,174,177,179,182,183,186,189,190,191,194,197,198,312,313,324,329,331,340,435,439,444,539,544,552,631,632,633,634,635,638,639,641,646,655,656,657,686,687,688,689,690,691,711,713,716,717,718,719,729,],[-218,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,-247,-281,-232,-381,-382,-277,-246,-380,-231,636,-237,636,-280,-278,-279,-265,-264,-270,636,-236,636,-249,-253,-254,-266,-269,-225,-223,-251,-267,-274,-271,-263,-256,-255,-248,-250,]),'WHILE':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,383,402,417,429,434,435,439,443,444,465,467,472,485,490,491,493,494,496,514,515,516,517,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,597,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,171,-383,-376,171,171,-218,-215,-210,171,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,171,-196,-85,171,-234,-235,-247,-281,171,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-383,-92,-174,-173,-233,-246,-380,171,-231,-90,-91,-81,-71,-365,-366,-364,171,-363,171,-346,-347,-345,-93,-94,171,171,-241,-245,-242,-244,-237,171,-239,-243,-240,-198,-189,-207,171,-362,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,171,-249,-253,-254,171,171,-266,-225,-223,-251,-267,171,171,171,-263,-256,-255,-248,-250,]),'REG':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,67,67,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,67,-66,-40,-41,-63,-58,-60,-53,-67,67,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,67,67,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,67,-319,-321,-31,-51,67,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,67,-288,67,-289,-92,-25,67,-24,-246,-380,67,-231,-90,-91,-81,-77,-71,-365,-366,67,-364,67,-363,-282,67,67,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,67,-239,-243,-240,67,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,67,-328,-326,-341,-266,-225,-223,-251,-267,67,67,67,-99,-263,-256,-255,-248,-333,-332,-331,67,-323,-329,-330,-325,-250,67,-324,]),'DOT':([31,46,57,126,223,231,242,318,337,338,361,365,370,371,396,417,429,501,504,564,565,601,610,675,677,],[119,-375,135,-376,119,135,390,135,135,119,119,135,135,119,506,-174,-173,390,390,135,119,390,506,119,135,]),'CASE':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,383,402,417,429,434,435,439,443,444,465,467,472,485,490,491,493,494,496,514,515,516,517,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,597,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,173,-383,-376,173,173,-218,-215,-210,173,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,173,-196,-85,173,-234,-235,-247,-281,173,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-383,-92,-174,-173,-233,-246,-380,173,-231,-90,-91,-81,-71,-365,-366,-364,173,-363,173,-346,-347,-345,-93,-94,173,173,-241,-245,-242,-244,-237,173,-239,-243,-240,-198,-189,-207,173,-362,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,173,-249,-253,-254,173,173,-266,-225,-223,-251,-267,173,173,173,-263,-256,-255,-248,-250,]),'LAND':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,154,-121,-119,-124,-120,-128,-127,154,-376,-123,154,-334,-122,-126,-125,154,-154,-163,154,154,-146,-136,154,154,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-175,-176,-161,154,154,154,-174,154,-166,154,154,-173,-356,154,154,154,154,154,154,154,154,154,154,154,154,-336,-335,154,154,154,154,154,-154,154,154,154,154,154,-170,-171,-172,-167,-168,-169,154,154,154,154,154,154,154,154,-158,-161,154,154,154,]),'SEMICOLON':([10,11,12,15,17,25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,66,68,107,117,120,121,122,123,124,126,127,131,132,161,162,163,164,165,166,167,169,172,174,175,177,179,181,182,183,184,186,189,190,191,192,194,196,197,198,199,200,201,202,203,206,209,218,220,221,232,236,237,238,239,240,243,247,249,251,255,260,264,270,272,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,308,309,310,311,312,313,315,317,318,319,323,324,328,329,330,331,332,333,334,335,337,338,340,346,348,349,353,355,357,375,376,378,382,386,387,397,399,401,402,403,417,419,429,430,433,434,435,437,439,443,444,449,451,452,463,465,466,467,468,469,470,472,473,475,485,486,487,488,497,505,519,520,528,530,535,536,537,538,540,541,542,543,544,545,546,547,548,555,557,560,562,569,600,624,625,626,628,629,630,631,632,633,634,635,641,642,643,644,645,655,656,657,667,671,674,683,685,686,688,689,690,691,693,694,706,707,714,716,717,718,719,729,],[-383,-11,-10,20,-13,-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-383,-383,257,-121,-119,-124,-120,-128,-127,-376,-123,-334,-122,-126,-125,-87,308,-88,-383,-383,-218,-215,-210,-383,-219,-212,329,-208,-220,-196,-211,-213,-214,-209,331,-217,340,-221,-216,-383,-196,344,-314,-315,348,-96,-83,357,-84,-73,378,379,-74,383,385,-291,398,400,402,404,409,-12,-154,-163,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-85,-383,-234,-235,-247,-281,-175,-176,-161,439,-383,-232,-379,-381,449,-382,-202,-199,-197,-206,-200,-201,-277,465,-89,467,449,472,-80,484,485,-70,-75,498,-285,512,518,519,-92,520,-174,-166,-173,-356,-86,-233,-246,-252,-380,-383,-231,-258,-257,556,-313,-90,-95,-91,-97,-118,556,-81,-82,576,-71,-72,-74,-78,-290,-292,-93,-94,-336,-335,-153,631,-154,-383,-241,-245,-242,-244,-237,-383,-239,-243,-240,651,-198,-189,-207,-383,-284,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,688,689,-383,-249,-253,-254,702,-79,-286,-383,-383,-266,-225,-223,-251,-267,-383,-383,-50,-287,-383,-263,-256,-255,-248,-250,]),'NE':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,144,-121,-119,-124,-120,-128,-127,144,-376,-123,144,-334,-122,-126,-125,144,-154,-163,144,144,-146,-136,144,144,-135,-134,-141,-129,-144,-139,-133,-138,144,-140,144,-131,-130,-142,144,-145,-143,144,-137,144,-132,-175,-176,-161,144,144,144,-174,144,-166,144,144,-173,-356,144,144,144,144,144,144,144,144,144,144,144,144,-336,-335,144,144,144,144,144,-154,144,144,144,144,144,-170,-171,-172,-167,-168,-169,144,144,144,144,144,144,144,144,-158,-161,144,144,144,]),'ENDGENERATE':([61,62,64,65,71,74,76,77,78,81,82,84,87,96,98,103,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,297,308,312,313,324,329,331,340,341,342,344,348,351,357,378,379,385,400,402,435,439,444,465,467,472,484,485,498,518,519,520,544,576,599,612,631,632,633,634,635,641,655,656,657,660,662,663,682,686,688,689,690,691,702,716,717,718,719,720,721,722,724,725,726,727,729,733,],[-8,-56,-61,-59,-57,-62,-65,-383,-66,-63,-58,-60,-67,-68,-64,-69,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,352,-319,-321,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-80,-70,-76,-288,-289,-92,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,-328,-326,-341,-266,-225,-223,-251,-267,-99,-263,-256,-255,-248,-333,-332,-331,-323,-329,-330,-325,-250,-324,]),'DISABLE':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,402,417,429,434,435,439,443,444,465,467,472,485,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,180,-383,-376,180,180,-218,-215,-210,180,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,180,-196,-85,180,-234,-235,-247,-281,180,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-92,-174,-173,-233,-246,-380,180,-231,-90,-91,-81,-71,-93,-94,180,180,-241,-245,-242,-244,-237,180,-239,-243,-240,-198,-189,-207,180,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,180,-249,-253,-254,180,180,-266,-225,-223,-251,-267,180,180,180,-263,-256,-255,-248,-250,]),'SUPPLY0':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,79,79,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,79,-66,-40,-41,-63,-58,-60,-53,-67,79,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,79,79,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,79,-319,-321,-31,-51,79,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,79,-288,79,-289,-92,-25,79,-24,-246,-380,79,-231,-90,-91,-81,-77,-71,-365,-366,79,-364,79,-363,-282,79,79,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,79,-239,-243,-240,79,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,79,-328,-326,-341,-266,-225,-223,-251,-267,79,79,79,-99,-263,-256,-255,-248,-333,-332,-331,79,-323,-329,-330,-325,-250,79,-324,]),'SUPPLY1':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,80,80,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,80,-66,-40,-41,-63,-58,-60,-53,-67,80,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,80,80,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,80,-319,-321,-31,-51,80,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,80,-288,80,-289,-92,-25,80,-24,-246,-380,80,-231,-90,-91,-81,-77,-71,-365,-366,80,-364,80,-363,-282,80,80,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,80,-239,-243,-240,80,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,80,-328,-326,-341,-266,-225,-223,-251,-267,80,80,80,-99,-263,-256,-255,-248,-333,-332,-331,80,-323,-329,-330,-325,-250,80,-324,]),'SIGNED_INTNUMBER_BIN':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[40,40,-178,-186,-183,40,40,-179,40,40,40,-182,-184,-180,40,-181,-375,40,40,-185,40,40,40,40,-376,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-218,40,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,40,-230,40,40,40,40,40,40,40,-247,-281,40,40,40,40,-232,40,-381,-382,40,-277,40,40,40,40,-229,-228,40,-227,40,40,40,40,40,40,40,40,40,40,40,40,-246,-380,-231,-383,-383,40,-258,-257,40,40,40,40,40,-383,40,40,-383,40,40,40,40,-237,40,40,40,40,40,40,40,-226,40,40,40,40,40,40,40,40,-280,-278,-279,-265,-264,-270,40,-236,40,-249,-253,-254,40,40,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,40,]),'SIGNED_INTNUMBER_DEC':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[42,42,-178,-186,-183,42,42,-179,42,42,42,-182,-184,-180,42,-181,-375,42,42,-185,42,42,42,42,-376,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-218,42,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,42,-230,42,42,42,42,42,42,42,-247,-281,42,42,42,42,-232,42,-381,-382,42,-277,42,42,42,42,-229,-228,42,-227,42,42,42,42,42,42,42,42,42,42,42,42,-246,-380,-231,-383,-383,42,-258,-257,42,42,42,42,42,-383,42,42,-383,42,42,42,42,-237,42,42,42,42,42,42,42,-226,42,42,42,42,42,42,42,42,-280,-278,-279,-265,-264,-270,42,-236,42,-249,-253,-254,42,42,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,42,]),'MINUSCOLON':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,117,120,121,122,123,124,126,127,131,132,161,162,269,270,272,277,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,417,419,429,430,474,482,528,530,535,567,568,624,625,626,628,629,630,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-121,-119,-124,-120,-128,-127,-376,-123,-334,-122,-126,-125,416,-154,-163,428,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-174,-166,-173,-356,575,584,-336,-335,-153,428,416,-170,-171,-172,-167,-168,-169,]),'WAIT':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,402,417,429,434,435,439,443,444,465,467,472,485,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,168,-383,-376,168,168,-218,-215,-210,168,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,168,-196,-85,168,-234,-235,-247,-281,168,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-92,-174,-173,-233,-246,-380,168,-231,-90,-91,-81,-71,-93,-94,168,168,-241,-245,-242,-244,-237,168,-239,-243,-240,-198,-189,-207,168,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,168,-249,-253,-254,168,168,-266,-225,-223,-251,-267,168,168,168,-263,-256,-255,-248,-250,]),'JOIN':([166,169,172,174,177,179,182,183,186,189,190,191,194,197,198,309,310,311,312,313,324,329,331,340,434,435,439,444,544,631,632,633,634,635,641,655,656,657,686,688,689,690,691,716,717,718,719,729,],[312,-218,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,435,-234,-235,-247,-281,-232,-381,-382,-277,-233,-246,-380,-231,-237,-280,-278,-279,-265,-264,-236,-249,-253,-254,-266,-225,-223,-251,-267,-263,-256,-255,-248,-250,]),'ENDFUNCTION':([169,172,174,177,179,182,183,186,189,190,191,194,197,198,312,313,324,329,331,340,435,439,444,513,544,611,613,614,615,616,617,618,619,620,622,631,632,633,634,635,641,655,656,657,686,688,689,690,691,716,717,718,719,729,],[-218,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,-247,-281,-232,-381,-382,-277,-246,-380,-231,612,-237,682,-343,-353,-348,-351,-349,-350,-352,-355,-354,-280,-278,-279,-265,-264,-236,-249,-253,-254,-266,-225,-223,-251,-267,-263,-256,-255,-248,-250,]),'FOREVER':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,402,417,429,434,435,439,443,444,465,467,472,485,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,167,-383,-376,167,167,-218,-215,-210,167,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,167,-196,-85,167,-234,-235,-247,-281,167,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-92,-174,-173,-233,-246,-380,167,-231,-90,-91,-81,-71,-93,-94,167,167,-241,-245,-242,-244,-237,167,-239,-243,-240,-198,-189,-207,167,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,167,-249,-253,-254,167,167,-266,-225,-223,-251,-267,167,167,167,-263,-256,-255,-248,-250,]),'LNOT':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[24,24,-178,-186,-183,24,24,-179,24,24,24,-182,-184,-180,24,-181,-375,24,24,-185,24,24,24,24,-376,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-218,24,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,24,-230,24,24,24,24,24,24,-247,-281,24,24,24,24,-232,24,-381,-382,24,-277,24,24,24,24,-229,-228,24,-227,24,24,24,24,24,24,24,24,24,24,24,24,-246,-380,-231,-383,-383,24,-258,-257,24,24,24,24,24,-383,24,24,-383,24,24,24,24,-237,24,24,24,24,24,24,24,-226,24,24,24,24,24,24,24,24,-280,-278,-279,-265,-264,-270,24,-236,24,-249,-253,-254,24,24,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,24,]),'FLOATNUMBER':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[25,25,-178,-186,-183,25,25,-179,25,25,25,-182,-184,-180,25,-181,-375,25,25,-185,25,25,25,25,-376,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-218,25,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,25,-230,25,25,25,25,25,25,25,-247,-281,25,25,25,25,-232,25,-381,-382,25,-277,25,25,25,25,-229,-228,25,-227,25,25,25,25,25,25,25,25,25,25,25,25,-246,-380,-231,-383,-383,25,-258,-257,25,25,25,25,25,-383,25,25,-383,25,25,25,25,-237,25,25,25,25,25,25,25,-226,25,25,25,25,25,25,25,25,-280,-278,-279,-265,-264,-270,25,-236,25,-249,-253,-254,25,25,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,25,]),'INTNUMBER_OCT':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[28,28,-178,-186,-183,28,28,-179,28,28,28,-182,-184,-180,28,-181,-375,28,28,-185,28,28,28,28,-376,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-218,28,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,28,-230,28,28,28,28,28,28,28,-247,-281,28,28,28,28,-232,28,-381,-382,28,-277,28,28,28,28,-229,-228,28,-227,28,28,28,28,28,28,28,28,28,28,28,28,-246,-380,-231,-383,-383,28,-258,-257,28,28,28,28,28,-383,28,28,-383,28,28,28,28,-237,28,28,28,28,28,28,28,-226,28,28,28,28,28,28,28,28,-280,-278,-279,-265,-264,-270,28,-236,28,-249,-253,-254,28,28,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,28,]),'LOR':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,138,-121,-119,-124,-120,-128,-127,138,-376,-123,138,-334,-122,-126,-125,138,-154,-163,138,138,-146,-136,-152,138,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-175,-176,-161,138,138,138,-174,138,-166,138,138,-173,-356,138,138,138,138,138,138,138,138,138,138,138,138,-336,-335,138,138,138,138,138,-154,138,138,138,138,138,-170,-171,-172,-167,-168,-169,138,138,138,138,138,138,138,138,-158,-161,138,138,138,]),'FORK':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,402,417,429,434,435,439,443,444,465,467,472,485,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,166,-383,-376,166,166,-218,-215,-210,166,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,166,-196,-85,166,-234,-235,-247,-281,166,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-92,-174,-173,-233,-246,-380,166,-231,-90,-91,-81,-71,-93,-94,166,166,-241,-245,-242,-244,-237,166,-239,-243,-240,-198,-189,-207,166,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,166,-249,-253,-254,166,166,-266,-225,-223,-251,-267,166,166,166,-263,-256,-255,-248,-250,]),'LSHIFT':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,140,-121,-119,-124,-120,-128,-127,140,-376,-123,140,-334,-122,-126,-125,140,-154,-163,140,140,140,-136,140,140,-135,-134,140,-129,140,140,-133,-138,140,140,140,-131,-130,140,140,140,140,140,-137,140,-132,-175,-176,-161,140,140,140,-174,140,-166,140,140,-173,-356,140,140,140,140,140,140,140,140,140,140,140,140,-336,-335,140,140,140,140,140,-154,140,140,140,140,140,-170,-171,-172,-167,-168,-169,140,140,140,140,140,140,140,140,-158,-161,140,140,140,]),'PARAMETER':([20,21,23,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,112,113,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,262,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,412,435,439,443,444,465,467,472,484,485,498,518,519,520,523,524,540,541,542,543,544,545,546,547,548,572,576,599,612,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,70,116,-8,-56,-61,-59,-57,-54,-62,-65,70,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,70,116,-16,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,70,-319,-321,-51,-26,-15,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-18,-246,-380,70,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-19,-20,-241,-245,-242,-244,-237,70,-239,-243,-240,70,-98,-360,-342,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,70,-328,-326,-341,-266,-225,-223,-251,-267,70,70,70,-99,-263,-256,-255,-248,-333,-332,-331,70,-323,-329,-330,-325,-250,70,-324,]),'SENS_OR':([4,20,21,46,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,126,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,332,333,337,338,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,417,429,435,439,444,453,454,456,458,465,467,472,484,485,498,518,519,520,544,563,564,565,566,572,576,599,612,624,625,626,628,629,630,631,632,633,634,635,641,652,653,654,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[11,-27,100,-375,-8,-56,-61,-59,-57,-54,-62,-65,100,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,100,-376,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,100,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-202,-199,-200,-201,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-174,-173,-246,-380,-231,558,561,-195,-205,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,-191,-192,-193,-190,100,-98,-360,-342,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-203,-204,-194,-249,-253,-254,-327,100,-328,-326,-341,-266,-225,-223,-251,-267,100,100,100,-99,-263,-256,-255,-248,-333,-332,-331,100,-323,-329,-330,-325,-250,100,-324,]),'WIRE':([20,21,22,61,62,64,65,67,71,72,73,74,75,76,77,78,79,80,81,82,84,86,87,88,89,90,92,95,96,97,98,99,101,103,104,108,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,233,254,256,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,383,385,398,400,402,404,406,409,435,439,443,444,465,467,472,484,485,490,491,492,493,494,496,498,512,514,515,516,517,518,519,520,540,541,542,543,544,545,546,547,548,572,576,597,599,612,621,631,632,633,634,635,641,642,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,89,89,-8,-56,-61,-59,-37,-57,-35,-54,-62,-32,-65,89,-66,-40,-41,-63,-58,-60,-53,-67,89,-38,-36,-33,-55,-68,-34,-64,-39,-52,-69,89,89,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,89,-319,-321,-31,-51,89,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,89,-288,89,-289,-92,-25,89,-24,-246,-380,89,-231,-90,-91,-81,-77,-71,-365,-366,89,-364,89,-363,-282,89,89,-346,-347,-345,-283,-93,-94,-241,-245,-242,-244,-237,89,-239,-243,-240,89,-98,-362,-360,-342,-344,-280,-278,-279,-265,-264,-236,-238,-249,-253,-254,-327,89,-328,-326,-341,-266,-225,-223,-251,-267,89,89,89,-99,-263,-256,-255,-248,-333,-332,-331,89,-323,-329,-330,-325,-250,89,-324,]),'NAND':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[34,34,-178,-186,-183,34,34,-179,34,34,34,-182,-184,-180,34,-181,-375,34,34,-185,34,34,34,34,-376,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-218,34,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,34,-230,34,34,34,34,34,34,-247,-281,34,34,34,34,-232,34,-381,-382,34,-277,34,34,34,34,-229,-228,34,-227,34,34,34,34,34,34,34,34,34,34,34,34,-246,-380,-231,-383,-383,34,-258,-257,34,34,34,34,34,-383,34,34,-383,34,34,34,34,-237,34,34,34,34,34,34,34,-226,34,34,34,34,34,34,34,34,-280,-278,-279,-265,-264,-270,34,-236,34,-249,-253,-254,34,34,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,34,]),'LT':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,145,-121,-119,-124,-120,-128,-127,145,-376,-123,145,-334,-122,-126,-125,145,-154,-163,145,145,145,-136,145,145,-135,-134,-141,-129,145,-139,-133,-138,145,-140,145,-131,-130,-142,145,145,145,145,-137,145,-132,-175,-176,-161,145,145,145,-174,145,-166,145,145,-173,-356,145,145,145,145,145,145,145,145,145,145,145,145,-336,-335,145,145,145,145,145,-154,145,145,145,145,145,-170,-171,-172,-167,-168,-169,145,145,145,145,145,145,145,145,-158,-161,145,145,145,]),'COMMA':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,105,106,109,110,111,117,120,121,122,123,124,126,127,128,129,131,132,134,161,162,163,164,165,201,202,203,206,209,218,220,221,232,236,238,240,243,249,251,259,266,270,272,275,276,278,279,280,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,332,333,337,338,346,349,355,366,367,368,369,370,371,372,376,382,386,387,389,391,393,394,395,399,401,403,405,407,408,410,411,413,417,418,419,420,421,422,423,424,425,429,430,433,453,458,463,466,468,469,473,481,486,487,497,505,507,508,509,510,511,522,528,530,534,535,581,600,603,605,623,624,625,626,627,628,629,630,637,640,652,653,674,676,680,681,699,700,701,703,704,705,706,707,708,709,712,728,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-43,256,-30,-29,261,-121,-119,-124,-120,-128,-127,-376,-123,271,-165,-334,-122,-383,-126,-125,-87,307,-88,343,-314,-315,347,-96,-83,356,-84,-73,377,-74,384,-291,384,347,-46,412,-154,-163,-383,-383,431,-359,-358,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-202,-199,-200,-201,347,347,356,-111,-113,-109,-112,-110,-106,480,377,-75,499,-285,502,504,-305,-308,-306,499,347,347,-42,-48,-47,-28,523,524,-174,-164,-166,-165,-338,529,-339,-340,529,-173,-356,-86,559,-205,-313,-95,-97,-118,-82,-107,-72,-74,-290,-292,-299,608,610,-297,-300,-44,-336,-335,-357,-153,-108,-284,-304,-307,-45,-170,-171,-172,-337,-167,-168,-169,684,-273,-203,-204,-286,-311,-296,-298,-100,-101,-102,-103,-104,-105,-50,-287,-309,-310,-272,-301,]),'ENDMODULE':([20,21,61,62,64,65,71,73,74,76,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,254,257,297,308,312,313,324,329,331,340,341,342,344,348,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,576,599,612,631,632,633,634,635,641,655,656,657,682,686,688,689,690,691,702,716,717,718,719,729,],[-27,-383,-8,-56,-61,-59,-57,-54,-62,-65,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,253,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-341,-266,-225,-223,-251,-267,-99,-263,-256,-255,-248,-250,]),'ASSIGN':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,85,-8,-56,-61,-59,-57,-54,-62,-65,85,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,85,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,85,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,85,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,85,-328,-326,-341,-266,-225,-223,-251,-267,85,85,85,-99,-263,-256,-255,-248,-333,-332,-331,85,-323,-329,-330,-325,-250,85,-324,]),'RSHIFTA':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,147,-121,-119,-124,-120,-128,-127,147,-376,-123,147,-334,-122,-126,-125,147,-154,-163,147,147,147,-136,147,147,-135,-134,147,-129,147,147,-133,-138,147,147,147,-131,-130,147,147,147,147,147,-137,147,-132,-175,-176,-161,147,147,147,-174,147,-166,147,147,-173,-356,147,147,147,147,147,147,147,147,147,147,147,147,-336,-335,147,147,147,147,147,-154,147,147,147,147,147,-170,-171,-172,-167,-168,-169,147,147,147,147,147,147,147,147,-158,-161,147,147,147,]),'XOR':([18,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,47,48,49,50,51,52,53,55,56,57,58,59,60,117,118,120,121,122,123,124,125,126,127,129,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,269,270,271,272,274,275,276,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,312,313,314,315,316,317,318,319,320,321,324,327,329,331,339,340,345,350,354,358,359,362,363,364,365,373,380,381,395,396,414,415,416,417,418,419,420,424,426,427,428,429,430,431,432,435,437,438,439,442,444,445,446,447,449,451,452,460,461,464,469,470,474,476,477,478,479,482,483,489,501,502,511,525,526,527,528,529,530,531,532,533,534,535,537,539,544,549,550,552,567,568,570,573,574,575,577,578,579,580,582,583,584,585,586,601,604,608,624,625,626,628,629,630,631,632,633,634,635,638,639,640,641,646,655,656,657,664,665,666,668,669,670,672,675,677,678,679,684,686,687,688,689,690,691,710,711,712,713,715,716,717,718,719,729,730,],[39,39,-178,-186,-160,-183,-162,-156,-158,39,-157,39,-179,39,-175,39,39,-182,-184,-180,39,-181,-375,-155,-187,39,39,-176,-185,-177,-159,39,-161,150,39,39,-121,39,-119,-124,-120,-128,-127,150,-376,-123,150,-334,-122,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-126,-125,-218,39,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,39,-230,39,39,150,-154,39,-163,39,39,39,150,150,-146,-136,150,150,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,150,-145,-143,-147,-137,150,-132,-247,-281,39,-175,39,-176,-161,150,39,39,-232,39,-381,-382,39,-277,150,39,39,39,39,-229,-228,39,-227,39,39,39,150,39,39,39,39,-174,150,-166,150,150,39,39,39,-173,-356,39,39,-246,150,150,-380,150,-231,-383,-383,39,-258,-257,39,39,39,39,150,39,150,-383,39,150,39,150,-383,150,39,39,150,150,150,150,-336,39,-335,150,150,150,150,150,-154,39,-237,39,39,39,150,150,150,39,39,39,39,150,-226,150,39,39,39,39,39,39,39,39,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,39,150,-236,39,-249,-253,-254,150,150,150,150,150,150,150,-158,-161,150,39,39,-266,-269,-225,-223,-251,-267,150,-274,150,-271,-383,-263,-256,-255,-248,-250,39,]),'POSEDGE':([336,561,],[459,459,]),'PLUSCOLON':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,117,120,121,122,123,124,126,127,131,132,161,162,269,270,272,277,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,417,419,429,430,474,482,528,530,535,567,568,624,625,626,628,629,630,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-121,-119,-124,-120,-128,-127,-376,-123,-334,-122,-126,-125,415,-154,-163,427,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-174,-166,-173,-356,574,583,-336,-335,-153,427,415,-170,-171,-172,-167,-168,-169,]),'TIMES':([2,14,25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,193,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,336,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,710,712,],[9,19,-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,152,-121,-119,-124,-120,-128,-127,268,-376,-123,268,-334,-122,-126,-125,335,268,-154,-163,268,268,268,268,268,268,268,268,268,-129,268,268,268,268,268,268,268,-131,-130,268,268,268,268,268,268,268,-132,-175,-176,-161,268,455,268,268,-174,268,-166,268,268,-173,-356,268,268,268,268,268,268,268,268,268,268,268,268,-336,-335,268,268,268,268,268,-154,268,268,268,268,268,-170,-171,-172,-167,-168,-169,268,268,268,268,268,268,268,268,-158,-161,268,268,268,]),'LE':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,58,117,120,121,122,123,124,125,126,127,129,131,132,161,162,222,223,224,228,231,269,270,272,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,315,317,318,319,325,345,395,417,418,419,420,424,429,430,437,438,442,469,474,478,481,482,489,511,525,526,527,528,530,531,532,533,534,535,537,567,568,570,578,580,624,625,626,628,629,630,640,664,665,666,668,669,670,672,675,677,678,699,700,701,703,704,705,710,712,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,142,-121,-119,-124,-120,-128,-127,142,-376,-123,142,-334,-122,-126,-125,-115,-106,-114,-116,-117,142,-154,-163,142,142,142,-136,142,142,-135,-134,-141,-129,142,-139,-133,-138,142,-140,142,-131,-130,-142,142,142,142,142,-137,142,-132,-175,-176,-161,142,445,142,142,-174,142,-166,142,142,-173,-356,142,142,142,142,142,142,-107,142,142,142,142,142,142,-336,-335,142,142,142,142,142,-154,142,142,142,142,142,-170,-171,-172,-167,-168,-169,142,142,142,142,142,142,142,142,-158,-161,142,-100,-101,-102,-103,-104,-105,142,142,]),'AT':([46,66,68,126,166,167,169,172,174,175,177,179,182,183,186,189,190,191,194,197,198,199,200,308,309,310,311,312,313,323,324,329,331,332,333,334,335,337,338,340,348,357,378,402,417,429,434,435,439,443,444,465,467,472,485,519,520,536,538,540,541,542,543,544,545,546,547,548,557,560,562,569,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,683,685,686,688,689,690,691,693,694,714,716,717,718,719,729,],[-375,193,193,-376,193,193,-218,-215,-210,193,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,193,-196,-85,193,-234,-235,-247,-281,193,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-89,-80,-70,-92,-174,-173,-233,-246,-380,193,-231,-90,-91,-81,-71,-93,-94,193,193,-241,-245,-242,-244,-237,193,-239,-243,-240,-198,-189,-207,193,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,193,-249,-253,-254,193,193,-266,-225,-223,-251,-267,193,193,193,-263,-256,-255,-248,-250,]),'LPAREN':([0,1,6,7,8,10,11,12,13,15,16,17,18,20,21,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,57,59,60,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,93,95,96,98,100,101,103,104,118,126,130,131,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,168,169,170,171,172,173,174,177,178,179,182,183,185,186,187,188,189,190,191,193,194,195,197,198,204,210,211,212,213,214,215,216,217,227,229,242,245,253,254,257,264,268,271,274,275,276,297,308,312,313,314,316,318,320,321,324,326,327,329,331,339,340,341,342,344,348,350,351,352,354,357,358,359,362,363,364,365,373,378,379,380,381,384,385,388,396,400,402,404,409,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,465,467,470,472,476,477,479,483,484,485,498,500,501,502,503,518,519,520,529,539,544,549,550,552,572,573,574,575,576,577,579,582,583,584,585,586,599,601,604,606,608,612,631,632,633,634,635,638,639,641,646,655,656,657,658,660,661,662,663,677,679,682,684,686,687,688,689,690,691,695,697,698,702,711,713,715,716,717,718,719,720,721,722,723,724,725,726,727,729,730,731,733,],[2,-4,-6,2,-5,-383,-11,-10,-3,22,23,-13,43,-27,2,43,-178,-186,-183,43,43,-179,43,43,43,-182,-184,-180,43,-181,-375,43,43,-185,43,134,43,43,-8,-56,-61,-59,-57,-54,-62,-65,2,-66,-63,-58,-60,-53,-67,242,-55,-68,-64,242,-52,-69,2,43,-376,275,276,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,314,-218,316,320,-215,321,-210,-219,327,-212,-208,-220,-276,-211,330,-275,-213,-214,-209,336,-217,339,-221,-216,43,-322,-320,-317,2,353,-319,354,-321,-230,364,43,396,-9,-51,-26,-12,43,43,43,43,43,-7,-85,-247,-281,43,43,134,43,43,-232,447,43,-381,-382,43,-277,-222,-188,-312,-89,43,-318,-316,43,-80,43,43,-229,-228,43,-227,43,-70,-76,43,43,242,-288,501,43,-289,-92,-25,-24,43,43,43,43,43,43,43,43,-246,-380,-231,-383,-383,43,-258,-257,43,43,43,43,-90,-91,43,-81,-383,43,43,-383,-77,-71,-282,601,43,43,604,-283,-93,-94,43,43,-237,43,43,43,2,43,43,43,-98,43,-226,43,43,43,43,43,-360,43,43,679,43,-342,-280,-278,-279,-265,-264,-270,43,-236,43,-249,-253,-254,-49,-327,2,-328,-326,134,43,-341,43,-266,-269,-225,-223,-251,-267,2,2,2,-99,-274,-271,-383,-263,-256,-255,-248,-333,-332,-331,2,-323,-329,-330,-325,-250,43,2,-324,]),'INTNUMBER_BIN':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,229,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[45,45,-178,-186,-183,45,45,-179,45,45,45,-182,-184,-180,45,-181,-375,45,45,-185,45,45,45,45,-376,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-218,45,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,45,-230,45,45,45,45,45,45,45,-247,-281,45,45,45,45,-232,45,-381,-382,45,-277,45,45,45,45,-229,-228,45,-227,45,45,45,45,45,45,45,45,45,45,45,45,-246,-380,-231,-383,-383,45,-258,-257,45,45,45,45,45,-383,45,45,-383,45,45,45,45,-237,45,45,45,45,45,45,45,-226,45,45,45,45,45,45,45,45,-280,-278,-279,-265,-264,-270,45,-236,45,-249,-253,-254,45,45,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,45,]),'ID':([4,9,18,20,21,22,24,25,26,28,32,34,35,36,38,39,40,41,42,43,44,45,46,49,50,52,54,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,108,116,118,119,126,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,166,167,169,170,172,174,175,176,177,179,180,182,183,184,185,186,188,189,190,191,193,194,197,198,199,200,204,205,207,210,211,212,213,215,217,219,226,227,229,230,233,234,235,241,242,244,246,248,250,252,254,256,257,258,261,265,267,268,271,274,275,276,297,307,308,309,310,311,312,313,314,315,316,317,318,320,321,322,323,324,327,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,347,348,350,351,352,353,354,356,357,358,359,362,363,364,365,373,377,378,379,380,381,383,385,390,396,400,402,404,406,409,412,414,415,416,417,426,427,428,429,431,432,434,435,439,443,444,445,446,447,449,450,451,452,457,459,460,461,464,465,467,470,472,476,477,479,480,483,484,485,490,491,492,493,494,496,498,499,501,502,506,514,515,516,517,518,519,520,521,523,524,529,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,552,554,556,557,558,559,560,562,569,571,572,573,574,575,576,577,579,582,583,584,585,586,587,589,597,599,601,604,607,608,609,612,621,624,625,626,628,629,630,631,632,633,634,635,638,639,641,642,645,646,647,650,651,655,656,657,658,660,661,662,663,679,682,683,684,685,686,687,688,689,690,691,693,694,695,696,697,698,702,711,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,729,730,731,733,],[12,14,46,-27,93,109,46,-178,-186,-183,46,46,-179,46,46,46,-182,-184,-180,46,126,-181,-375,46,46,-185,131,46,46,46,-8,-56,165,-61,-59,-383,-37,-383,203,208,-57,-35,-54,-62,-32,-65,93,-66,-40,-41,-63,-58,221,-60,46,-53,-67,238,-38,-36,239,-33,-383,247,-55,-68,-34,-64,-39,-383,-52,208,-69,93,109,208,46,-378,-376,46,46,-377,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-383,-383,-218,46,-215,-210,-383,46,-219,-212,328,-208,-220,-230,-276,-211,-275,-213,-214,-209,46,-217,-221,-216,-383,-196,46,208,208,-322,-320,-317,93,-319,-321,221,46,-230,46,46,-31,374,238,388,46,-295,397,388,208,208,-51,109,-26,109,109,208,208,46,46,46,46,46,-7,165,-85,-383,-234,-235,-247,-281,46,-228,46,-229,-227,46,46,443,-383,-232,46,-381,-383,-382,-202,-199,-197,-206,46,-200,-201,46,-277,-222,-188,203,-312,208,-89,46,-318,-316,-383,46,221,-80,46,46,-229,-228,46,-227,46,487,-70,-76,46,46,-383,-288,503,46,-289,-92,-25,109,-24,208,46,46,46,-174,46,46,46,-173,46,46,-233,-246,-380,-383,-231,-383,-383,46,-258,46,-257,46,46,46,46,46,46,-90,-91,46,-81,-383,46,46,46,-383,-77,-71,-365,-366,487,-364,-383,-363,-282,388,46,46,606,-383,-346,-347,-345,-283,-93,-94,109,208,208,46,-383,-226,-383,46,-241,-245,-242,-244,-237,-383,-239,-243,-240,46,46,46,-383,-260,-198,46,46,-189,-207,-383,-383,93,46,46,46,-98,46,-226,46,46,46,46,46,487,46,-362,-360,46,46,-294,46,-293,-342,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-270,46,-236,-238,-383,46,46,-230,-259,-249,-253,-254,-49,-327,93,-328,-326,46,-341,-383,46,-383,-266,-269,-225,-223,-251,-267,-383,-383,93,723,93,93,-99,-274,-271,-383,-383,-263,-256,-255,-248,-333,-332,-331,93,-323,-329,-330,-325,-250,46,93,-324,]),'IF':([25,26,28,35,40,41,42,45,46,52,61,62,64,65,66,68,71,74,76,77,78,81,82,84,87,96,98,103,126,166,167,169,172,174,175,176,177,179,182,183,184,185,186,188,189,190,191,194,197,198,199,200,210,211,212,213,215,217,227,297,308,309,310,311,312,313,315,317,318,323,324,329,331,332,333,334,335,337,338,340,341,342,344,348,351,357,362,363,365,378,379,383,385,400,402,417,429,434,435,439,443,444,465,467,472,484,485,490,491,493,494,496,498,514,515,516,517,518,519,520,536,537,538,540,541,542,543,544,545,546,547,548,557,560,562,569,572,576,579,589,597,599,612,621,624,625,626,628,629,630,631,632,633,634,635,641,642,645,655,656,657,660,661,662,663,682,683,685,686,688,689,690,691,693,694,695,697,698,702,714,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-178,-186,-183,-179,-182,-184,-180,-181,-375,-185,-8,-56,-61,-59,195,-383,-57,-62,-65,216,-66,-63,-58,-60,-67,-68,-64,-69,-376,195,195,-218,-215,-210,195,326,-219,-212,-208,-220,-230,-276,-211,-275,-213,-214,-209,-217,-221,-216,195,-196,-322,-320,-317,216,-319,-321,-230,-7,-85,195,-234,-235,-247,-281,-228,-229,-227,195,-232,-381,-382,-202,-199,-197,-206,-200,-201,-277,-222,-188,-312,-89,-318,-80,-229,-228,-227,-70,-76,-383,-288,-289,-92,-174,-173,-233,-246,-380,195,-231,-90,-91,-81,-77,-71,-365,-366,-364,195,-363,-282,195,-346,-347,-345,-283,-93,-94,195,-226,195,-241,-245,-242,-244,-237,195,-239,-243,-240,-198,-189,-207,195,216,-98,-226,326,-362,-360,-342,-344,-170,-171,-172,-167,-168,-169,-280,-278,-279,-265,-264,-236,-238,195,-249,-253,-254,-327,216,-328,-326,-341,195,195,-266,-225,-223,-251,-267,195,195,216,216,216,-99,195,-263,-256,-255,-248,-333,-332,-331,216,-323,-329,-330,-325,-250,216,-324,]),'STRING_LITERAL':([18,24,25,26,28,32,34,35,36,38,39,40,41,42,43,45,46,49,50,52,56,59,60,118,126,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,169,170,172,174,177,179,182,183,186,189,190,191,194,197,198,204,227,242,268,271,274,275,276,312,313,314,316,320,321,324,327,329,331,339,340,350,354,358,359,362,363,364,365,373,380,381,396,414,415,416,426,427,428,431,432,435,439,444,445,446,447,449,451,452,460,461,464,470,476,477,479,483,501,502,529,539,544,549,550,552,573,574,575,577,579,582,583,584,585,586,601,604,608,631,632,633,634,635,638,639,641,646,655,656,657,679,684,686,687,688,689,690,691,711,713,715,716,717,718,719,729,730,],[48,48,-178,-186,-183,48,48,-179,48,48,48,-182,-184,-180,48,-181,-375,48,48,-185,48,48,48,48,-376,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-218,48,-215,-210,-219,-212,-208,-220,-211,-213,-214,-209,-217,-221,-216,48,-230,48,48,48,48,48,48,-247,-281,48,48,48,48,-232,48,-381,-382,48,-277,48,48,48,48,-229,-228,48,-227,48,48,48,48,48,48,48,48,48,48,48,48,-246,-380,-231,-383,-383,48,-258,-257,48,48,48,48,48,-383,48,48,-383,48,48,48,48,-237,48,48,48,48,48,48,48,-226,48,48,48,48,48,48,48,48,-280,-278,-279,-265,-264,-270,48,-236,48,-249,-253,-254,48,48,-266,-269,-225,-223,-251,-267,-274,-271,-383,-263,-256,-255,-248,-250,48,]),'ALWAYS':([20,21,61,62,64,65,71,73,74,76,77,78,81,82,84,86,87,95,96,98,101,103,104,169,172,174,177,179,182,183,185,186,188,189,190,191,194,197,198,210,211,212,213,215,217,254,257,297,308,312,313,324,329,331,340,341,342,344,348,351,352,357,378,379,385,400,402,404,409,435,439,444,465,467,472,484,485,498,518,519,520,544,572,576,599,612,631,632,633,634,635,641,655,656,657,660,661,662,663,682,686,688,689,690,691,695,697,698,702,716,717,718,719,720,721,722,723,724,725,726,727,729,731,733,],[-27,68,-8,-56,-61,-59,-57,-54,-62,-65,68,-66,-63,-58,-60,-53,-67,-55,-68,-64,-52,-69,68,-218,-215,-210,-219,-212,-208,-220,-276,-211,-275,-213,-214,-209,-217,-221,-216,-322,-320,-317,68,-319,-321,-51,-26,-7,-85,-247,-281,-232,-381,-382,-277,-222,-188,-312,-89,-318,-316,-80,-70,-76,-288,-289,-92,-25,-24,-246,-380,-231,-90,-91,-81,-77,-71,-282,-283,-93,-94,-237,68,-98,-360,-342,-280,-278,-279,-265,-264,-236,-249,-253,-254,-327,68,-328,-326,-341,-266,-225,-223,-251,-267,68,68,68,-99,-263,-256,-255,-248,-333,-332,-331,68,-323,-329,-330,-325,-250,68,-324,]),'NEGEDGE':([336,561,],[457,457,]),'RBRACKET':([25,26,27,28,29,30,31,33,35,37,40,41,42,45,46,47,48,51,52,53,55,57,117,120,121,122,123,124,126,127,131,132,161,162,269,270,272,277,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,417,419,429,430,474,482,525,526,527,528,530,531,532,533,535,567,568,570,578,580,624,625,626,628,629,630,664,665,666,668,669,670,672,],[-178,-186,-160,-183,-162,-156,-158,-157,-179,-175,-182,-184,-180,-181,-375,-155,-187,-176,-185,-177,-159,-161,-121,-119,-124,-120,-128,-127,-376,-123,-334,-122,-126,-125,417,-154,-163,429,-146,-136,-152,-135,-134,-141,-129,-144,-139,-133,-138,-149,-140,-148,-131,-130,-142,-151,-145,-143,-147,-137,-150,-132,-174,-166,-173,-356,417,429,624,625,626,-336,-335,628,629,630,-153,429,417,658,417,429,-170,-171,-172,-167,-168,-169,699,700,701,703,704,705,706,]),}
-
-_lr_action = { }
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = { }
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'decl':([21,77,104,213,383,398,443,494,512,514,545,572,661,695,697,698,723,731,],[62,62,62,62,490,515,540,490,515,515,540,62,62,62,62,62,62,62,]),'gif_false_item':([698,],[727,]),'ioport':([256,],[405,]),'genvarlist':([69,],[201,]),'parameterlist':([93,100,],[241,248,]),'forpre':([330,353,],[452,470,]),'pointer':([18,24,32,34,36,38,39,43,49,50,56,59,60,85,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,176,193,204,226,229,230,242,268,271,274,275,276,314,316,320,321,327,336,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,450,452,457,459,460,461,464,470,477,479,480,501,502,529,539,549,550,552,558,559,573,574,575,577,582,583,584,585,586,589,601,604,608,639,646,647,679,684,730,],[31,31,31,31,31,31,31,31,31,31,31,31,31,223,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,223,338,31,223,361,371,31,31,31,31,31,31,31,31,31,31,31,338,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,223,31,565,565,31,31,31,31,31,31,371,31,31,31,31,31,31,31,338,338,31,31,31,31,31,31,31,31,31,223,31,675,31,31,31,223,31,31,31,]),'declname':([88,235,377,492,587,],[232,232,486,232,232,]),'casex_statement':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[174,174,174,174,174,174,174,174,588,614,174,174,174,174,174,174,174,174,174,174,]),'genvardecl':([21,77,104,213,572,661,695,697,698,723,731,],[74,74,74,74,74,74,74,74,74,74,74,]),'param_arg':([396,610,],[507,681,]),'casecontent_statement':([539,552,639,646,],[638,638,687,687,]),'delays':([66,85,88,166,167,175,199,235,309,323,330,353,443,445,446,476,483,494,514,536,538,545,554,569,571,645,683,685,693,694,714,715,],[176,226,234,176,176,176,176,234,176,176,450,450,176,549,550,577,585,589,589,176,176,176,647,176,647,176,176,176,176,176,176,730,]),'instance_ports_arg':([242,501,601,],[391,391,391,]),'param':([23,112,],[113,262,]),'while_statement':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[179,179,179,179,179,179,179,179,591,616,179,179,179,179,179,179,179,179,179,179,]),'waitcontent_statement':([536,],[632,]),'realnamelist':([63,],[164,]),'instance_ports':([242,501,601,],[392,602,673,]),'lconcatlist':([230,],[372,]),'taskvardecls':([383,],[494,]),'for_statement':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[186,186,186,186,186,186,186,186,594,618,186,186,186,186,186,186,186,186,186,186,]),'realname':([63,307,],[163,433,]),'params_begin':([23,],[112,]),'source_text':([0,],[5,]),'paramlist':([10,],[15,]),'declassign_element':([88,235,],[237,375,]),'rvalue':([350,359,380,549,550,577,585,730,],[468,475,488,643,644,667,671,732,]),'genvar':([69,343,],[202,463,]),'namedblock':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[194,194,194,194,194,194,194,194,596,620,194,194,194,194,194,194,194,194,194,194,]),'else_statement':([694,714,],[719,729,]),'instance_body':([241,248,499,],[387,387,600,]),'always':([21,77,104,213,572,661,695,697,698,723,731,],[98,98,98,98,98,98,98,98,98,98,98,]),'generate_forcontent':([695,],[722,]),'stringliteral':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'item':([21,104,],[101,254,]),'param_args':([396,],[509,]),'always_statement':([199,],[342,]),'identifier':([18,24,32,34,36,38,39,43,49,50,56,59,60,85,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,176,193,204,226,229,230,242,268,271,274,275,276,314,316,320,321,327,336,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,450,452,457,459,460,461,464,470,477,479,480,501,502,529,539,549,550,552,558,559,573,574,575,577,582,583,584,585,586,589,601,604,608,639,646,647,679,684,730,],[57,57,57,57,57,57,57,57,57,57,57,57,57,231,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,318,231,337,57,231,365,370,57,57,57,57,57,57,57,57,57,57,57,337,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,231,57,564,564,57,57,57,57,57,57,370,57,57,57,57,57,57,57,337,337,57,57,57,57,57,57,57,57,57,231,57,677,57,57,57,231,57,57,57,]),'ports':([22,],[111,]),'single_statement':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,]),'levelsigs':([336,],[453,]),'function_calc':([514,],[613,]),'localparamdecl':([21,77,104,213,443,545,572,661,695,697,698,723,731,],[64,64,64,64,541,541,64,64,64,64,64,64,64,]),'param_args_noname':([396,],[508,]),'concatlist':([50,274,],[128,128,]),'true_statement':([569,645,],[655,690,]),'parallelblock':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,169,]),'levelsig':([193,336,558,559,],[334,458,652,653,]),'funcvardecls':([398,512,],[514,514,]),'edgesigs':([336,],[454,]),'forpost':([554,571,],[649,659,]),'integerdecl':([21,77,104,213,383,398,443,494,512,514,545,572,661,695,697,698,723,731,],[71,71,71,71,491,516,542,491,516,516,542,71,71,71,71,71,71,71,]),'forever_statement':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,]),'integername':([83,219,356,],[218,218,473,]),'standard_item':([21,77,104,213,572,661,695,697,698,723,731,],[73,211,73,211,211,211,211,211,211,211,211,]),'floatnumber':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,229,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,317,51,362,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'levelsig_base':([193,336,558,559,],[333,333,333,333,]),'blocking_substitution':([66,166,167,175,199,309,323,330,353,443,494,514,536,538,545,569,645,683,685,693,694,714,],[177,177,177,177,177,177,177,451,451,177,590,615,177,177,177,177,177,177,177,177,177,177,]),'sigtypes':([21,22,77,104,213,256,383,398,443,494,512,514,545,572,661,695,697,698,723,731,],[88,108,88,88,88,406,492,492,492,492,492,492,492,88,88,88,88,88,88,88,]),'portlist':([15,],[21,]),'parameterdecl':([21,77,104,213,443,545,572,661,695,697,698,723,731,],[84,84,84,84,543,543,84,84,84,84,84,84,84,]),'instance_bodylist':([241,248,],[386,399,]),'generate_items':([77,661,723,],[213,697,731,]),'task_statement':([383,],[495,]),'event_statement':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,]),'integernamelist':([83,219,],[220,355,]),'casecontent_condition':([539,552,639,646,],[637,637,637,637,]),'generate':([21,104,],[95,95,]),'case_statement':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[191,191,191,191,191,191,191,191,595,619,191,191,191,191,191,191,191,191,191,191,]),'items':([21,],[104,]),'instance_port_arg':([242,501,504,601,],[394,394,605,394,]),'lconcat_one':([230,480,],[368,581,]),'case_comp':([321,327,],[441,448,]),'declnamelist':([88,235,492,587,],[236,376,236,376,]),'namedblock_statements':([443,],[545,]),'definition':([0,7,],[1,13,]),'expression':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[58,117,120,121,122,123,124,125,127,129,132,161,162,269,277,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,298,299,300,301,302,303,304,305,306,319,345,395,298,418,420,424,424,437,438,437,442,442,437,469,437,474,469,478,482,469,489,511,525,526,527,531,532,533,534,535,437,437,567,568,570,437,578,580,395,395,424,640,469,469,640,664,665,666,469,668,669,670,469,672,395,678,511,640,640,710,712,469,]),'block':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[198,198,198,198,198,198,198,198,598,622,198,198,198,198,198,198,198,198,198,198,]),'declassign':([21,77,104,213,572,661,695,697,698,723,731,],[65,65,65,65,65,65,65,65,65,65,65,]),'generate_for':([77,213,572,661,695,697,698,723,731,],[210,210,210,210,210,210,210,210,210,]),'ioports':([22,],[106,]),'param_end':([23,112,],[114,263,]),'lpointer':([85,176,226,230,450,480,589,647,],[222,222,222,369,222,369,222,222,]),'namedblock_statement':([443,545,],[546,642,]),'initial':([21,77,104,213,572,661,695,697,698,723,731,],[76,76,76,76,76,76,76,76,76,76,76,]),'const_expression':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'block_statement':([166,175,309,323,],[310,310,434,434,]),'width':([70,88,94,102,108,116,388,406,492,],[205,235,246,250,258,265,500,521,587,]),'params':([23,],[115,]),'realdecl':([21,77,104,213,443,545,572,661,695,697,698,723,731,],[82,82,82,82,547,547,82,82,82,82,82,82,82,]),'scope':([18,24,32,34,36,38,39,43,49,50,56,59,60,85,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,176,193,204,226,229,230,242,268,271,274,275,276,314,316,320,321,327,336,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,450,452,457,459,460,461,464,470,477,479,480,501,502,529,539,549,550,552,558,559,573,574,575,577,582,583,584,585,586,589,601,604,608,639,646,647,679,684,730,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'intnumber':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,229,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,315,37,363,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'empty':([10,21,66,68,77,85,88,93,100,134,166,167,175,199,235,275,276,309,323,330,353,383,443,445,446,476,483,494,514,536,538,545,554,569,571,645,661,683,685,693,694,714,715,723,],[17,86,184,200,212,227,227,244,244,279,184,184,184,184,227,423,423,184,184,227,227,493,184,227,227,227,227,227,227,184,184,184,650,184,650,184,212,184,184,184,184,184,227,212,]),'basic_statement':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[185,311,313,311,341,311,311,548,633,634,548,656,656,711,713,716,656,656,]),'function':([21,77,104,213,572,661,695,697,698,723,731,],[87,87,87,87,87,87,87,87,87,87,87,]),'initial_statement':([66,],[188,]),'lconcat':([85,176,226,230,450,480,589,647,],[228,228,228,367,228,367,228,228,]),'whilecontent_statement':([538,],[635,]),'generate_block':([572,695,698,],[662,720,726,]),'pragma':([0,7,21,77,104,213,572,661,695,697,698,723,731,],[6,6,103,103,103,103,103,103,103,103,103,103,103,]),'blocking_substitution_base':([554,571,],[648,648,]),'sysarg':([275,276,529,],[421,421,627,]),'instance_body_noname':([93,100,384,],[243,243,497,]),'edgesig':([336,561,],[456,654,]),'gif_true_item':([572,],[663,]),'param_arg_noname':([396,608,],[510,680,]),'portname':([22,108,256,258,261,406,521,],[110,259,407,408,410,522,623,]),'casecontent_statements':([539,552,],[639,646,]),'function_statement':([398,512,],[513,611,]),'task_calc':([494,],[593,]),'ifcontent_statement':([569,645,694,714,],[657,657,718,718,]),'modulename':([4,],[10,]),'instance_ports_list':([242,501,601,],[389,389,389,]),'ioport_head':([22,],[105,]),'instance_bodylist_noname':([93,100,],[240,249,]),'systemcall':([18,24,32,34,36,38,39,43,49,50,56,59,60,66,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,166,167,170,175,199,204,242,268,271,274,275,276,309,314,316,320,321,323,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,443,447,452,460,461,464,470,477,479,501,502,529,536,538,539,545,549,550,552,569,573,574,575,577,582,583,584,585,586,601,604,608,639,645,646,679,683,684,685,693,694,714,730,],[27,27,27,27,27,27,27,27,27,27,27,27,27,181,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,181,181,27,181,181,27,27,27,27,27,27,27,181,27,27,27,27,181,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,181,27,27,27,27,27,27,27,27,27,27,27,181,181,27,181,27,27,27,181,27,27,27,27,27,27,27,27,27,27,27,27,27,181,27,27,181,27,181,181,181,181,27,]),'forcond':([452,470,],[554,571,]),'cond':([314,320,339,354,447,452,470,],[436,440,462,471,551,555,555,]),'moduledef':([0,7,],[8,8,]),'partselect':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,193,204,242,268,271,274,275,276,314,316,320,321,327,336,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,558,559,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,332,33,33,33,33,33,33,33,33,33,33,33,33,332,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,332,332,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'sigtype':([21,22,77,88,104,108,213,256,383,398,406,443,492,494,512,514,545,572,661,695,697,698,723,731,],[75,75,75,233,75,233,75,75,75,75,233,75,233,75,75,75,75,75,75,75,75,75,75,75,]),'lvalue':([85,176,226,450,589,647,],[225,325,360,553,553,692,]),'length':([238,487,],[382,382,]),'sysargs':([275,276,],[422,425,]),'instance':([21,77,104,213,572,661,695,697,698,723,731,],[78,78,78,78,78,78,78,78,78,78,78,]),'param_substitution_list':([70,102,116,205,207,250,252,265,267,],[206,251,266,346,349,401,403,411,413,]),'if_statement':([66,166,167,175,199,309,323,443,494,514,536,538,545,569,645,683,685,693,694,714,],[182,182,182,182,182,182,182,182,592,617,182,182,182,182,182,182,182,182,182,182,]),'nonblocking_substitution':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,]),'block_statements':([166,175,],[309,323,]),'repeat':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'description':([0,],[3,]),'assignment':([21,77,104,213,572,661,695,697,698,723,731,],[81,81,81,81,81,81,81,81,81,81,81,]),'edgesig_base':([457,459,],[563,566,]),'wait_statement':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,]),'instance_port_list':([242,501,502,601,],[393,393,603,393,]),'disable':([66,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,]),'forcontent_statement':([693,],[717,]),'generate_item':([77,213,572,661,695,697,698,723,731,],[215,351,660,215,721,351,725,215,351,]),'func_args':([134,],[278,]),'concat':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,129,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,273,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'param_substitution':([70,102,116,205,207,250,252,265,267,347,412,523,524,],[209,209,209,209,209,209,209,209,209,466,466,466,466,]),'taskvardecl':([383,494,],[496,597,]),'task':([21,77,104,213,572,661,695,697,698,723,731,],[96,96,96,96,96,96,96,96,96,96,96,]),'senslist':([66,68,166,167,175,199,309,323,443,536,538,545,569,645,683,685,693,694,714,],[196,199,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,]),'funcvardecl':([398,512,514,],[517,517,621,]),'lpartselect':([85,176,226,230,450,480,589,647,],[224,224,224,366,224,366,224,224,]),'functioncall':([18,24,32,34,36,38,39,43,49,50,56,59,60,118,133,134,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,170,204,242,268,271,274,275,276,314,316,320,321,327,339,350,354,358,359,364,373,380,381,396,414,415,416,426,427,428,431,432,447,452,460,461,464,470,477,479,501,502,529,539,549,550,552,573,574,575,577,582,583,584,585,586,601,604,608,639,646,679,684,730,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'generate_if':([77,213,572,661,695,697,698,723,731,],[217,217,217,217,217,217,217,217,217,]),'definitions':([0,],[7,]),}
-
-_lr_goto = { }
-for _k, _v in _lr_goto_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = { }
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> source_text","S'",1,None,None,None),
-  ('source_text -> description','source_text',1,'p_source_text','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',69),
-  ('description -> definitions','description',1,'p_description','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',74),
-  ('definitions -> definitions definition','definitions',2,'p_definitions','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',79),
-  ('definitions -> definition','definitions',1,'p_definitions_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',84),
-  ('definition -> moduledef','definition',1,'p_definition','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',89),
-  ('definition -> pragma','definition',1,'p_definition_pragma','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',94),
-  ('pragma -> LPAREN TIMES ID EQUALS expression TIMES RPAREN','pragma',7,'p_pragma_assign','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',100),
-  ('pragma -> LPAREN TIMES ID TIMES RPAREN','pragma',5,'p_pragma','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',105),
-  ('moduledef -> MODULE modulename paramlist portlist items ENDMODULE','moduledef',6,'p_moduledef','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',111),
-  ('modulename -> ID','modulename',1,'p_modulename','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',117),
-  ('modulename -> SENS_OR','modulename',1,'p_modulename_or','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',122),
-  ('paramlist -> DELAY LPAREN params RPAREN','paramlist',4,'p_paramlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',127),
-  ('paramlist -> empty','paramlist',1,'p_paramlist_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',132),
-  ('params -> params_begin param_end','params',2,'p_params','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',136),
-  ('params_begin -> params_begin param','params_begin',2,'p_params_begin','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',141),
-  ('params_begin -> param','params_begin',1,'p_params_begin_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',146),
-  ('params -> param_end','params',1,'p_params_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',151),
-  ('param -> PARAMETER param_substitution_list COMMA','param',3,'p_param','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',156),
-  ('param -> PARAMETER width param_substitution_list COMMA','param',4,'p_param_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',162),
-  ('param -> PARAMETER INTEGER param_substitution_list COMMA','param',4,'p_param_integer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',168),
-  ('param_end -> PARAMETER param_substitution_list','param_end',2,'p_param_end','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',174),
-  ('param_end -> PARAMETER width param_substitution_list','param_end',3,'p_param_end_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',180),
-  ('param_end -> PARAMETER INTEGER param_substitution_list','param_end',3,'p_param_end_integer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',186),
-  ('portlist -> LPAREN ports RPAREN SEMICOLON','portlist',4,'p_portlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',192),
-  ('portlist -> LPAREN ioports RPAREN SEMICOLON','portlist',4,'p_portlist_io','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',197),
-  ('portlist -> LPAREN RPAREN SEMICOLON','portlist',3,'p_portlist_paren_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',202),
-  ('portlist -> SEMICOLON','portlist',1,'p_portlist_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',207),
-  ('ports -> ports COMMA portname','ports',3,'p_ports','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',212),
-  ('ports -> portname','ports',1,'p_ports_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',219),
-  ('portname -> ID','portname',1,'p_portname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',226),
-  ('sigtypes -> sigtypes sigtype','sigtypes',2,'p_sigtypes','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',231),
-  ('sigtypes -> sigtype','sigtypes',1,'p_sigtypes_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',236),
-  ('sigtype -> INPUT','sigtype',1,'p_sigtype_input','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',241),
-  ('sigtype -> OUTPUT','sigtype',1,'p_sigtype_output','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',246),
-  ('sigtype -> INOUT','sigtype',1,'p_sigtype_inout','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',251),
-  ('sigtype -> TRI','sigtype',1,'p_sigtype_tri','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',256),
-  ('sigtype -> REG','sigtype',1,'p_sigtype_reg','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',261),
-  ('sigtype -> WIRE','sigtype',1,'p_sigtype_wire','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',266),
-  ('sigtype -> SIGNED','sigtype',1,'p_sigtype_signed','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',271),
-  ('sigtype -> SUPPLY0','sigtype',1,'p_sigtype_supply0','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',276),
-  ('sigtype -> SUPPLY1','sigtype',1,'p_sigtype_supply1','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',281),
-  ('ioports -> ioports COMMA ioport','ioports',3,'p_ioports','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',286),
-  ('ioports -> ioport_head','ioports',1,'p_ioports_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',313),
-  ('ioport -> sigtypes portname','ioport',2,'p_ioport','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',357),
-  ('ioport -> sigtypes width portname','ioport',3,'p_ioport_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',362),
-  ('ioport_head -> sigtypes portname','ioport_head',2,'p_ioport_head','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',367),
-  ('ioport_head -> sigtypes width portname','ioport_head',3,'p_ioport_head_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',372),
-  ('ioport -> portname','ioport',1,'p_ioport_portname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',377),
-  ('width -> LBRACKET expression COLON expression RBRACKET','width',5,'p_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',382),
-  ('length -> LBRACKET expression COLON expression RBRACKET','length',5,'p_length','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',387),
-  ('items -> items item','items',2,'p_items','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',392),
-  ('items -> item','items',1,'p_items_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',397),
-  ('items -> empty','items',1,'p_items_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',402),
-  ('item -> standard_item','item',1,'p_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',406),
-  ('item -> generate','item',1,'p_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',407),
-  ('standard_item -> decl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',413),
-  ('standard_item -> integerdecl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',414),
-  ('standard_item -> realdecl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',415),
-  ('standard_item -> declassign','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',416),
-  ('standard_item -> parameterdecl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',417),
-  ('standard_item -> localparamdecl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',418),
-  ('standard_item -> genvardecl','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',419),
-  ('standard_item -> assignment','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',420),
-  ('standard_item -> always','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',421),
-  ('standard_item -> initial','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',422),
-  ('standard_item -> instance','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',423),
-  ('standard_item -> function','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',424),
-  ('standard_item -> task','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',425),
-  ('standard_item -> pragma','standard_item',1,'p_standard_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',426),
-  ('decl -> sigtypes declnamelist SEMICOLON','decl',3,'p_decl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',491),
-  ('decl -> sigtypes width declnamelist SEMICOLON','decl',4,'p_decl_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',500),
-  ('declnamelist -> declnamelist COMMA declname','declnamelist',3,'p_declnamelist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',509),
-  ('declnamelist -> declname','declnamelist',1,'p_declnamelist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',514),
-  ('declname -> ID','declname',1,'p_declname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',519),
-  ('declname -> ID length','declname',2,'p_declarray','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',524),
-  ('declassign -> sigtypes declassign_element SEMICOLON','declassign',3,'p_declassign','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',569),
-  ('declassign -> sigtypes width declassign_element SEMICOLON','declassign',4,'p_declassign_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',575),
-  ('declassign_element -> ID EQUALS rvalue','declassign_element',3,'p_declassign_element','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',581),
-  ('declassign_element -> delays ID EQUALS delays rvalue','declassign_element',5,'p_declassign_element_delay','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',588),
-  ('integerdecl -> INTEGER integernamelist SEMICOLON','integerdecl',3,'p_integerdecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',596),
-  ('integerdecl -> INTEGER SIGNED integernamelist SEMICOLON','integerdecl',4,'p_integerdecl_signed','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',606),
-  ('integernamelist -> integernamelist COMMA integername','integernamelist',3,'p_integernamelist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',616),
-  ('integernamelist -> integername','integernamelist',1,'p_integernamelist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',621),
-  ('integername -> ID','integername',1,'p_integername','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',626),
-  ('realdecl -> REAL realnamelist SEMICOLON','realdecl',3,'p_realdecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',632),
-  ('realnamelist -> realnamelist COMMA realname','realnamelist',3,'p_realnamelist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',642),
-  ('realnamelist -> realname','realnamelist',1,'p_realnamelist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',647),
-  ('realname -> ID','realname',1,'p_realname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',652),
-  ('parameterdecl -> PARAMETER param_substitution_list SEMICOLON','parameterdecl',3,'p_parameterdecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',658),
-  ('parameterdecl -> PARAMETER width param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',664),
-  ('parameterdecl -> PARAMETER INTEGER param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_integer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',670),
-  ('localparamdecl -> LOCALPARAM param_substitution_list SEMICOLON','localparamdecl',3,'p_localparamdecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',676),
-  ('localparamdecl -> LOCALPARAM width param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_width','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',682),
-  ('localparamdecl -> LOCALPARAM INTEGER param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_integer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',688),
-  ('param_substitution_list -> param_substitution_list COMMA param_substitution','param_substitution_list',3,'p_param_substitution_list','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',694),
-  ('param_substitution_list -> param_substitution','param_substitution_list',1,'p_param_substitution_list_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',699),
-  ('param_substitution -> ID EQUALS rvalue','param_substitution',3,'p_param_substitution','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',704),
-  ('assignment -> ASSIGN lvalue EQUALS rvalue SEMICOLON','assignment',5,'p_assignment','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',709),
-  ('assignment -> ASSIGN delays lvalue EQUALS delays rvalue SEMICOLON','assignment',7,'p_assignment_delay','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',714),
-  ('lpartselect -> pointer LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',720),
-  ('lpartselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_plus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',725),
-  ('lpartselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_minus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',730),
-  ('lpartselect -> identifier LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',735),
-  ('lpartselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_plus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',740),
-  ('lpartselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_minus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',745),
-  ('lpointer -> pointer','lpointer',1,'p_lpointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',750),
-  ('lconcat -> LBRACE lconcatlist RBRACE','lconcat',3,'p_lconcat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',755),
-  ('lconcatlist -> lconcatlist COMMA lconcat_one','lconcatlist',3,'p_lconcatlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',760),
-  ('lconcatlist -> lconcat_one','lconcatlist',1,'p_lconcatlist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',765),
-  ('lconcat_one -> identifier','lconcat_one',1,'p_lconcat_one_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',770),
-  ('lconcat_one -> lpartselect','lconcat_one',1,'p_lconcat_one_lpartselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',775),
-  ('lconcat_one -> lpointer','lconcat_one',1,'p_lconcat_one_lpointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',780),
-  ('lconcat_one -> lconcat','lconcat_one',1,'p_lconcat_one_lconcat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',785),
-  ('lvalue -> lpartselect','lvalue',1,'p_lvalue_partselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',790),
-  ('lvalue -> lpointer','lvalue',1,'p_lvalue_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',795),
-  ('lvalue -> lconcat','lvalue',1,'p_lvalue_concat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',800),
-  ('lvalue -> identifier','lvalue',1,'p_lvalue_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',805),
-  ('rvalue -> expression','rvalue',1,'p_rvalue','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',810),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',817),
-  ('expression -> PLUS expression','expression',2,'p_expression_uplus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',822),
-  ('expression -> LNOT expression','expression',2,'p_expression_ulnot','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',827),
-  ('expression -> NOT expression','expression',2,'p_expression_unot','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',832),
-  ('expression -> AND expression','expression',2,'p_expression_uand','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',837),
-  ('expression -> NAND expression','expression',2,'p_expression_unand','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',842),
-  ('expression -> NOR expression','expression',2,'p_expression_unor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',847),
-  ('expression -> OR expression','expression',2,'p_expression_uor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',852),
-  ('expression -> XOR expression','expression',2,'p_expression_uxor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',857),
-  ('expression -> XNOR expression','expression',2,'p_expression_uxnor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',862),
-  ('expression -> expression POWER expression','expression',3,'p_expression_power','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',869),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_times','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',876),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_div','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',881),
-  ('expression -> expression MOD expression','expression',3,'p_expression_mod','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',886),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',893),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',898),
-  ('expression -> expression LSHIFT expression','expression',3,'p_expression_sll','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',905),
-  ('expression -> expression RSHIFT expression','expression',3,'p_expression_srl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',910),
-  ('expression -> expression LSHIFTA expression','expression',3,'p_expression_sla','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',915),
-  ('expression -> expression RSHIFTA expression','expression',3,'p_expression_sra','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',920),
-  ('expression -> expression LT expression','expression',3,'p_expression_lessthan','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',927),
-  ('expression -> expression GT expression','expression',3,'p_expression_greaterthan','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',932),
-  ('expression -> expression LE expression','expression',3,'p_expression_lesseq','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',937),
-  ('expression -> expression GE expression','expression',3,'p_expression_greatereq','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',942),
-  ('expression -> expression EQ expression','expression',3,'p_expression_eq','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',949),
-  ('expression -> expression NE expression','expression',3,'p_expression_noteq','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',954),
-  ('expression -> expression EQL expression','expression',3,'p_expression_eql','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',959),
-  ('expression -> expression NEL expression','expression',3,'p_expression_noteql','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',964),
-  ('expression -> expression AND expression','expression',3,'p_expression_And','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',971),
-  ('expression -> expression XOR expression','expression',3,'p_expression_Xor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',976),
-  ('expression -> expression XNOR expression','expression',3,'p_expression_Xnor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',981),
-  ('expression -> expression OR expression','expression',3,'p_expression_Or','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',988),
-  ('expression -> expression LAND expression','expression',3,'p_expression_land','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',995),
-  ('expression -> expression LOR expression','expression',3,'p_expression_lor','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1002),
-  ('expression -> expression COND expression COLON expression','expression',5,'p_expression_cond','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1009),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_expr','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1015),
-  ('expression -> concat','expression',1,'p_expression_concat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1021),
-  ('expression -> repeat','expression',1,'p_expression_repeat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1026),
-  ('expression -> partselect','expression',1,'p_expression_partselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1031),
-  ('expression -> pointer','expression',1,'p_expression_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1036),
-  ('expression -> functioncall','expression',1,'p_expression_functioncall','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1041),
-  ('expression -> systemcall','expression',1,'p_expression_systemcall','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1046),
-  ('expression -> identifier','expression',1,'p_expression_id','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1051),
-  ('expression -> const_expression','expression',1,'p_expression_const','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1056),
-  ('concat -> LBRACE concatlist RBRACE','concat',3,'p_concat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1061),
-  ('concatlist -> concatlist COMMA expression','concatlist',3,'p_concatlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1066),
-  ('concatlist -> expression','concatlist',1,'p_concatlist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1071),
-  ('repeat -> LBRACE expression concat RBRACE','repeat',4,'p_repeat','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1076),
-  ('partselect -> identifier LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1081),
-  ('partselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_plus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1086),
-  ('partselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_minus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1091),
-  ('partselect -> pointer LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1096),
-  ('partselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_plus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1101),
-  ('partselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_minus','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1106),
-  ('pointer -> identifier LBRACKET expression RBRACKET','pointer',4,'p_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1111),
-  ('pointer -> pointer LBRACKET expression RBRACKET','pointer',4,'p_pointer_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1116),
-  ('const_expression -> intnumber','const_expression',1,'p_const_expression_intnum','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1122),
-  ('const_expression -> floatnumber','const_expression',1,'p_const_expression_floatnum','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1127),
-  ('const_expression -> stringliteral','const_expression',1,'p_const_expression_stringliteral','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1132),
-  ('floatnumber -> FLOATNUMBER','floatnumber',1,'p_floatnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1137),
-  ('intnumber -> INTNUMBER_DEC','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1142),
-  ('intnumber -> SIGNED_INTNUMBER_DEC','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1143),
-  ('intnumber -> INTNUMBER_BIN','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1144),
-  ('intnumber -> SIGNED_INTNUMBER_BIN','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1145),
-  ('intnumber -> INTNUMBER_OCT','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1146),
-  ('intnumber -> SIGNED_INTNUMBER_OCT','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1147),
-  ('intnumber -> INTNUMBER_HEX','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1148),
-  ('intnumber -> SIGNED_INTNUMBER_HEX','intnumber',1,'p_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1149),
-  ('stringliteral -> STRING_LITERAL','stringliteral',1,'p_stringliteral','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1157),
-  ('always -> ALWAYS senslist always_statement','always',3,'p_always','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1164),
-  ('senslist -> AT LPAREN edgesigs RPAREN','senslist',4,'p_sens_egde_paren','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1169),
-  ('edgesig -> POSEDGE edgesig_base','edgesig',2,'p_posedgesig','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1174),
-  ('edgesig -> NEGEDGE edgesig_base','edgesig',2,'p_negedgesig','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1179),
-  ('edgesig_base -> identifier','edgesig_base',1,'p_edgesig_base_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1184),
-  ('edgesig_base -> pointer','edgesig_base',1,'p_edgesig_base_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1189),
-  ('edgesigs -> edgesigs SENS_OR edgesig','edgesigs',3,'p_edgesigs','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1194),
-  ('edgesigs -> edgesig','edgesigs',1,'p_edgesigs_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1199),
-  ('senslist -> empty','senslist',1,'p_sens_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1204),
-  ('senslist -> AT levelsig','senslist',2,'p_sens_level','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1209),
-  ('senslist -> AT LPAREN levelsigs RPAREN','senslist',4,'p_sens_level_paren','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1214),
-  ('levelsig -> levelsig_base','levelsig',1,'p_levelsig','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1219),
-  ('levelsig_base -> identifier','levelsig_base',1,'p_levelsig_base_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1224),
-  ('levelsig_base -> pointer','levelsig_base',1,'p_levelsig_base_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1229),
-  ('levelsig_base -> partselect','levelsig_base',1,'p_levelsig_base_partselect','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1234),
-  ('levelsigs -> levelsigs SENS_OR levelsig','levelsigs',3,'p_levelsigs','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1239),
-  ('levelsigs -> levelsigs COMMA levelsig','levelsigs',3,'p_levelsigs_comma','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1244),
-  ('levelsigs -> levelsig','levelsigs',1,'p_levelsigs_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1249),
-  ('senslist -> AT TIMES','senslist',2,'p_sens_all','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1254),
-  ('senslist -> AT LPAREN TIMES RPAREN','senslist',4,'p_sens_all_paren','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1259),
-  ('basic_statement -> if_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1264),
-  ('basic_statement -> case_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1265),
-  ('basic_statement -> casex_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1266),
-  ('basic_statement -> for_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1267),
-  ('basic_statement -> while_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1268),
-  ('basic_statement -> event_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1269),
-  ('basic_statement -> wait_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1270),
-  ('basic_statement -> forever_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1271),
-  ('basic_statement -> block','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1272),
-  ('basic_statement -> namedblock','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1273),
-  ('basic_statement -> parallelblock','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1274),
-  ('basic_statement -> blocking_substitution','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1275),
-  ('basic_statement -> nonblocking_substitution','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1276),
-  ('basic_statement -> single_statement','basic_statement',1,'p_basic_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1277),
-  ('always_statement -> basic_statement','always_statement',1,'p_always_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1283),
-  ('blocking_substitution -> delays lvalue EQUALS delays rvalue SEMICOLON','blocking_substitution',6,'p_blocking_substitution','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1289),
-  ('blocking_substitution_base -> delays lvalue EQUALS delays rvalue','blocking_substitution_base',5,'p_blocking_substitution_base','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1294),
-  ('nonblocking_substitution -> delays lvalue LE delays rvalue SEMICOLON','nonblocking_substitution',6,'p_nonblocking_substitution','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1299),
-  ('delays -> DELAY LPAREN expression RPAREN','delays',4,'p_delays','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1305),
-  ('delays -> DELAY identifier','delays',2,'p_delays_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1310),
-  ('delays -> DELAY intnumber','delays',2,'p_delays_intnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1315),
-  ('delays -> DELAY floatnumber','delays',2,'p_delays_floatnumber','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1320),
-  ('delays -> empty','delays',1,'p_delays_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1325),
-  ('block -> BEGIN block_statements END','block',3,'p_block','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1330),
-  ('block -> BEGIN END','block',2,'p_block_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1335),
-  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1340),
-  ('block_statements -> block_statement','block_statements',1,'p_block_statements_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1345),
-  ('block_statement -> basic_statement','block_statement',1,'p_block_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1350),
-  ('namedblock -> BEGIN COLON ID namedblock_statements END','namedblock',5,'p_namedblock','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1356),
-  ('namedblock -> BEGIN COLON ID END','namedblock',4,'p_namedblock_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1361),
-  ('namedblock_statements -> namedblock_statements namedblock_statement','namedblock_statements',2,'p_namedblock_statements','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1366),
-  ('namedblock_statements -> namedblock_statement','namedblock_statements',1,'p_namedblock_statements_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1371),
-  ('namedblock_statement -> basic_statement','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1376),
-  ('namedblock_statement -> decl','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1377),
-  ('namedblock_statement -> integerdecl','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1378),
-  ('namedblock_statement -> realdecl','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1379),
-  ('namedblock_statement -> parameterdecl','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1380),
-  ('namedblock_statement -> localparamdecl','namedblock_statement',1,'p_namedblock_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1381),
-  ('parallelblock -> FORK block_statements JOIN','parallelblock',3,'p_parallelblock','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1394),
-  ('parallelblock -> FORK JOIN','parallelblock',2,'p_parallelblock_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1399),
-  ('if_statement -> IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',7,'p_if_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1405),
-  ('if_statement -> IF LPAREN cond RPAREN true_statement','if_statement',5,'p_if_statement_woelse','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1410),
-  ('if_statement -> delays IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',8,'p_if_statement_delay','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1415),
-  ('if_statement -> delays IF LPAREN cond RPAREN true_statement','if_statement',6,'p_if_statement_woelse_delay','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1420),
-  ('cond -> expression','cond',1,'p_cond','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1425),
-  ('ifcontent_statement -> basic_statement','ifcontent_statement',1,'p_ifcontent_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1430),
-  ('true_statement -> ifcontent_statement','true_statement',1,'p_true_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1435),
-  ('else_statement -> ifcontent_statement','else_statement',1,'p_else_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1440),
-  ('for_statement -> FOR LPAREN forpre forcond forpost RPAREN forcontent_statement','for_statement',7,'p_for_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1446),
-  ('forpre -> blocking_substitution','forpre',1,'p_forpre','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1451),
-  ('forpre -> SEMICOLON','forpre',1,'p_forpre_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1456),
-  ('forcond -> cond SEMICOLON','forcond',2,'p_forcond','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1461),
-  ('forcond -> SEMICOLON','forcond',1,'p_forcond_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1466),
-  ('forpost -> blocking_substitution_base','forpost',1,'p_forpost','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1471),
-  ('forpost -> empty','forpost',1,'p_forpost_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1476),
-  ('forcontent_statement -> basic_statement','forcontent_statement',1,'p_forcontent_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1480),
-  ('while_statement -> WHILE LPAREN cond RPAREN whilecontent_statement','while_statement',5,'p_while_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1486),
-  ('whilecontent_statement -> basic_statement','whilecontent_statement',1,'p_whilecontent_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1491),
-  ('case_statement -> CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','case_statement',6,'p_case_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1497),
-  ('casex_statement -> CASEX LPAREN case_comp RPAREN casecontent_statements ENDCASE','casex_statement',6,'p_casex_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1502),
-  ('case_comp -> expression','case_comp',1,'p_case_comp','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1507),
-  ('casecontent_statements -> casecontent_statements casecontent_statement','casecontent_statements',2,'p_casecontent_statements','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1512),
-  ('casecontent_statements -> casecontent_statement','casecontent_statements',1,'p_casecontent_statements_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1517),
-  ('casecontent_statement -> casecontent_condition COLON basic_statement','casecontent_statement',3,'p_casecontent_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1522),
-  ('casecontent_condition -> casecontent_condition COMMA expression','casecontent_condition',3,'p_casecontent_condition_single','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1527),
-  ('casecontent_condition -> expression','casecontent_condition',1,'p_casecontent_condition_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1532),
-  ('casecontent_statement -> DEFAULT COLON basic_statement','casecontent_statement',3,'p_casecontent_statement_default','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1537),
-  ('initial -> INITIAL initial_statement','initial',2,'p_initial','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1543),
-  ('initial_statement -> basic_statement','initial_statement',1,'p_initial_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1548),
-  ('event_statement -> senslist SEMICOLON','event_statement',2,'p_event_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1554),
-  ('wait_statement -> WAIT LPAREN cond RPAREN waitcontent_statement','wait_statement',5,'p_wait_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1560),
-  ('waitcontent_statement -> basic_statement','waitcontent_statement',1,'p_waitcontent_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1565),
-  ('waitcontent_statement -> SEMICOLON','waitcontent_statement',1,'p_waitcontent_statement_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1570),
-  ('forever_statement -> FOREVER basic_statement','forever_statement',2,'p_forever_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1576),
-  ('instance -> ID parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1582),
-  ('instance -> SENS_OR parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance_or','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1591),
-  ('instance_bodylist -> instance_bodylist COMMA instance_body','instance_bodylist',3,'p_instance_bodylist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1600),
-  ('instance_bodylist -> instance_body','instance_bodylist',1,'p_instance_bodylist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1605),
-  ('instance_body -> ID LPAREN instance_ports RPAREN','instance_body',4,'p_instance_body','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1610),
-  ('instance_body -> ID width LPAREN instance_ports RPAREN','instance_body',5,'p_instance_body_array','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1615),
-  ('instance -> ID instance_bodylist_noname SEMICOLON','instance',3,'p_instance_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1620),
-  ('instance -> SENS_OR instance_bodylist_noname SEMICOLON','instance',3,'p_instance_or_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1629),
-  ('instance_bodylist_noname -> instance_bodylist_noname COMMA instance_body_noname','instance_bodylist_noname',3,'p_instance_bodylist_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1638),
-  ('instance_bodylist_noname -> instance_body_noname','instance_bodylist_noname',1,'p_instance_bodylist_one_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1643),
-  ('instance_body_noname -> LPAREN instance_ports RPAREN','instance_body_noname',3,'p_instance_body_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1648),
-  ('parameterlist -> DELAY LPAREN param_args RPAREN','parameterlist',4,'p_parameterlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1653),
-  ('parameterlist -> DELAY LPAREN param_args_noname RPAREN','parameterlist',4,'p_parameterlist_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1658),
-  ('parameterlist -> empty','parameterlist',1,'p_parameterlist_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1663),
-  ('param_args_noname -> param_args_noname COMMA param_arg_noname','param_args_noname',3,'p_param_args_noname','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1667),
-  ('param_args_noname -> param_arg_noname','param_args_noname',1,'p_param_args_noname_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1672),
-  ('param_args -> param_args COMMA param_arg','param_args',3,'p_param_args','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1677),
-  ('param_args -> param_arg','param_args',1,'p_param_args_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1682),
-  ('param_arg_noname -> expression','param_arg_noname',1,'p_param_arg_noname_exp','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1687),
-  ('param_arg -> DOT ID LPAREN expression RPAREN','param_arg',5,'p_param_arg_exp','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1692),
-  ('instance_ports -> instance_ports_list','instance_ports',1,'p_instance_ports','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1697),
-  ('instance_ports -> instance_ports_arg','instance_ports',1,'p_instance_ports','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1698),
-  ('instance_ports_list -> instance_ports_list COMMA instance_port_list','instance_ports_list',3,'p_instance_ports_list','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1704),
-  ('instance_ports_list -> instance_port_list','instance_ports_list',1,'p_instance_ports_list_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1709),
-  ('instance_port_list -> expression','instance_port_list',1,'p_instance_port_list','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1714),
-  ('instance_ports_arg -> instance_ports_arg COMMA instance_port_arg','instance_ports_arg',3,'p_instance_ports_arg','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1719),
-  ('instance_ports_arg -> instance_port_arg','instance_ports_arg',1,'p_instance_ports_arg_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1724),
-  ('instance_port_arg -> DOT ID LPAREN identifier RPAREN','instance_port_arg',5,'p_instance_port_arg','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1729),
-  ('instance_port_arg -> DOT ID LPAREN expression RPAREN','instance_port_arg',5,'p_instance_port_arg_exp','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1734),
-  ('instance_port_arg -> DOT ID LPAREN RPAREN','instance_port_arg',4,'p_instance_port_arg_none','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1739),
-  ('genvardecl -> GENVAR genvarlist SEMICOLON','genvardecl',3,'p_genvardecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1745),
-  ('genvarlist -> genvarlist COMMA genvar','genvarlist',3,'p_genvarlist','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1750),
-  ('genvarlist -> genvar','genvarlist',1,'p_genvarlist_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1755),
-  ('genvar -> ID','genvar',1,'p_genvar','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1760),
-  ('generate -> GENERATE generate_items ENDGENERATE','generate',3,'p_generate','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1769),
-  ('generate_items -> empty','generate_items',1,'p_generate_items_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1774),
-  ('generate_items -> generate_items generate_item','generate_items',2,'p_generate_items','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1779),
-  ('generate_items -> generate_item','generate_items',1,'p_generate_items_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1784),
-  ('generate_item -> standard_item','generate_item',1,'p_generate_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1789),
-  ('generate_item -> generate_if','generate_item',1,'p_generate_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1790),
-  ('generate_item -> generate_for','generate_item',1,'p_generate_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1791),
-  ('generate_block -> BEGIN generate_items END','generate_block',3,'p_generate_block','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1797),
-  ('generate_block -> BEGIN COLON ID generate_items END','generate_block',5,'p_generate_named_block','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1802),
-  ('generate_if -> IF LPAREN cond RPAREN gif_true_item ELSE gif_false_item','generate_if',7,'p_generate_if','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1807),
-  ('generate_if -> IF LPAREN cond RPAREN gif_true_item','generate_if',5,'p_generate_if_woelse','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1812),
-  ('gif_true_item -> generate_item','gif_true_item',1,'p_generate_if_true_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1817),
-  ('gif_true_item -> generate_block','gif_true_item',1,'p_generate_if_true_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1818),
-  ('gif_false_item -> generate_item','gif_false_item',1,'p_generate_if_false_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1824),
-  ('gif_false_item -> generate_block','gif_false_item',1,'p_generate_if_false_item','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1825),
-  ('generate_for -> FOR LPAREN forpre forcond forpost RPAREN generate_forcontent','generate_for',7,'p_generate_for','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1831),
-  ('generate_forcontent -> generate_item','generate_forcontent',1,'p_generate_forcontent','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1836),
-  ('generate_forcontent -> generate_block','generate_forcontent',1,'p_generate_forcontent','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1837),
-  ('systemcall -> DOLLER ID','systemcall',2,'p_systemcall_noargs','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1844),
-  ('systemcall -> DOLLER ID LPAREN sysargs RPAREN','systemcall',5,'p_systemcall','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1849),
-  ('systemcall -> DOLLER SIGNED LPAREN sysargs RPAREN','systemcall',5,'p_systemcall_signed','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1854),
-  ('sysargs -> sysargs COMMA sysarg','sysargs',3,'p_sysargs','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1859),
-  ('sysargs -> sysarg','sysargs',1,'p_sysargs_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1864),
-  ('sysargs -> empty','sysargs',1,'p_sysargs_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1869),
-  ('sysarg -> expression','sysarg',1,'p_sysarg','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1873),
-  ('function -> FUNCTION width ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1879),
-  ('function -> FUNCTION ID SEMICOLON function_statement ENDFUNCTION','function',5,'p_function_nowidth','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1884),
-  ('function_statement -> funcvardecls function_calc','function_statement',2,'p_function_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1893),
-  ('funcvardecls -> funcvardecls funcvardecl','funcvardecls',2,'p_funcvardecls','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1898),
-  ('funcvardecls -> funcvardecl','funcvardecls',1,'p_funcvardecls_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1903),
-  ('funcvardecl -> decl','funcvardecl',1,'p_funcvardecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1908),
-  ('funcvardecl -> integerdecl','funcvardecl',1,'p_funcvardecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1909),
-  ('function_calc -> blocking_substitution','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1920),
-  ('function_calc -> if_statement','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1921),
-  ('function_calc -> for_statement','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1922),
-  ('function_calc -> while_statement','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1923),
-  ('function_calc -> case_statement','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1924),
-  ('function_calc -> casex_statement','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1925),
-  ('function_calc -> block','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1926),
-  ('function_calc -> namedblock','function_calc',1,'p_function_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1927),
-  ('functioncall -> identifier LPAREN func_args RPAREN','functioncall',4,'p_functioncall','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1933),
-  ('func_args -> func_args COMMA expression','func_args',3,'p_func_args','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1938),
-  ('func_args -> expression','func_args',1,'p_func_args_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1943),
-  ('func_args -> empty','func_args',1,'p_func_args_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1948),
-  ('task -> TASK ID SEMICOLON task_statement ENDTASK','task',5,'p_task','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1953),
-  ('task_statement -> taskvardecls task_calc','task_statement',2,'p_task_statement','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1958),
-  ('taskvardecls -> taskvardecls taskvardecl','taskvardecls',2,'p_taskvardecls','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1963),
-  ('taskvardecls -> taskvardecl','taskvardecls',1,'p_taskvardecls_one','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1968),
-  ('taskvardecls -> empty','taskvardecls',1,'p_taskvardecls_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1973),
-  ('taskvardecl -> decl','taskvardecl',1,'p_taskvardecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1977),
-  ('taskvardecl -> integerdecl','taskvardecl',1,'p_taskvardecl','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1978),
-  ('task_calc -> blocking_substitution','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1989),
-  ('task_calc -> if_statement','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1990),
-  ('task_calc -> for_statement','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1991),
-  ('task_calc -> while_statement','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1992),
-  ('task_calc -> case_statement','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1993),
-  ('task_calc -> casex_statement','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1994),
-  ('task_calc -> block','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1995),
-  ('task_calc -> namedblock','task_calc',1,'p_task_calc','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',1996),
-  ('identifier -> ID','identifier',1,'p_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2003),
-  ('identifier -> scope ID','identifier',2,'p_scope_identifier','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2008),
-  ('scope -> identifier DOT','scope',2,'p_scope','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2014),
-  ('scope -> pointer DOT','scope',2,'p_scope_pointer','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2020),
-  ('disable -> DISABLE ID','disable',2,'p_disable','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2027),
-  ('single_statement -> DELAY expression SEMICOLON','single_statement',3,'p_single_statement_delays','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2033),
-  ('single_statement -> systemcall SEMICOLON','single_statement',2,'p_single_statement_systemcall','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2038),
-  ('single_statement -> disable SEMICOLON','single_statement',2,'p_single_statement_disable','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2043),
-  ('empty -> <empty>','empty',0,'p_empty','/usr/lib/python2.7/site-packages/pyverilog-1.0.5.dev0-py2.7.egg/pyverilog/vparser/parser.py',2065),
-]
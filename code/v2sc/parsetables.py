@@ -0,0 +1,109 @@
+#-------------------------------------------------------------------------------
+# parsetables.py
+#
+# Managed cache of the PLY parser tables
+#
+# pyverilog builds its parser with the tables of a 'parsetab' module found
+# on sys.path, and regenerates them (for more than a second) and writes
+# parsetab.py and parser.out into the working directory whenever that
+# module is missing or was made for another grammar. The parsers here keep
+# their tables as a pickle in the cache directory instead, named after the
+# PLY table version and a hash of the grammar, so that they are generated
+# once per grammar and then loaded in about ten milliseconds from wherever
+# v2sc runs.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import hashlib
+
+import pyverilog.vparser.ply.yacc as yacc
+from pyverilog.vparser.lexer import VerilogLexer
+import pyverilog.vparser.parser as vparser
+
+from templatecache import get_cache_dir
+
+def grammar_signature():
+    """ hash of the grammar rules and precedence, which the tables depend on """
+    h = hashlib.sha256()
+    h.update(('%s %s\n' % (yacc.__version__, yacc.__tabversion__)).encode('utf-8'))
+    with open(vparser.__file__.replace('.pyc', '.py'), 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+GRAMMAR_SIGNATURE = grammar_signature()
+
+def table_file(cache_dir=None):
+    """ file holding the tables of the current grammar, or None without a writable cache """
+    table_dir = get_cache_dir(cache_dir, 'parsetab')
+    if table_dir is None:
+        return None
+    return os.path.join(table_dir, 'parsetab-%s-%s.pickle' %
+                        (yacc.__tabversion__, GRAMMAR_SIGNATURE[:16]))
+
+def build_parser(module, cache_dir=None):
+    """ LALR parser of module, its tables loaded from the cache or generated into it """
+    filename = table_file(cache_dir)
+    if filename is None:
+        return yacc.yacc(module=module, method="LALR", debug=0, write_tables=0)
+    if os.path.exists(filename):
+        return yacc.yacc(module=module, method="LALR", debug=0, picklefile=filename)
+    # generated into a file of this process, so no parser reads a partial table
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    parser = yacc.yacc(module=module, method="LALR", debug=0, picklefile=tmpname)
+    try:
+        os.rename(tmpname, filename)
+    except OSError:
+        pass
+    return parser
+
+class VerilogParser(vparser.VerilogParser):
+    """ pyverilog's VerilogParser, with its tables in the cache directory """
+    def __init__(self, cache_dir=None):
+        self.lexer = VerilogLexer(error_func=self._lexer_error_func)
+        self.lexer.build()
+        self.tokens = self.lexer.tokens
+        self.parser = build_parser(self, cache_dir)
+
+    def parse(self, text, debug=0):
+        # the lexer keeps its line number and directives from one text to the next
+        self.lexer.reset_lineno()
+        self.lexer.directives = []
+        self.lexer.default_nettype = 'wire'
+        return vparser.VerilogParser.parse(self, text, debug)
+
+_parsers = {}
+
+def shared_parser(cache_dir=None):
+    """
+    VerilogParser of the process for cache_dir, built once: the daemon
+    builds it before forking, so each request parses with it right away
+    """
+    parser = _parsers.get(cache_dir)
+    if parser is None:
+        parser = VerilogParser(cache_dir)
+        _parsers[cache_dir] = parser
+    return parser
+
+class VerilogCodeParser(vparser.VerilogCodeParser):
+    """ pyverilog's VerilogCodeParser, parsing with the VerilogParser above """
+    def __init__(self, filelist, preprocess_output='preprocess.output',
+                 preprocess_include=None,
+                 preprocess_define=None, cache_dir=None):
+        self.preprocess_output = preprocess_output
+        self.directives = ()
+        self.lines = 0
+        self.preprocessor = vparser.VerilogPreprocessor(filelist, preprocess_output,
+                                                        preprocess_include,
+                                                        preprocess_define)
+        self.parser = shared_parser(cache_dir)
+
+    def preprocess(self):
+        text = vparser.VerilogCodeParser.preprocess(self)
+        # the files are joined by a line break of their own, so this is the
+        # number of lines they take in the stream of several files
+        self.lines = text.count('\n') + 1
+        return text
+
+    def get_lines(self):
+        return self.lines
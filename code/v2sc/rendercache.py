@@ -0,0 +1,52 @@
+#-------------------------------------------------------------------------------
+# rendercache.py
+#
+# Memoized rendering of structurally identical subtrees
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+
+class RenderCache(object):
+    """
+    Rendered text indexed by the structure of the node (Node.__eq__ and
+    Node.__hash__), so every repetition of a subtree after the first one
+    costs a single dict lookup. The structure includes the scope of an
+    Identifier, and the generator clears the cache at each module, so a
+    text is never reused where the same node could render differently.
+    The line number is not part of the structure: a text holding one is
+    reported by the generator with line_dependent() and is not kept.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.line_marks = 0
+
+    def get(self, node, render):
+        try:
+            rslt = self.entries[node]
+        except KeyError:
+            marks = self.line_marks
+            rslt = render(node)
+            # a node rendered inside node counts as well
+            if self.line_marks == marks:
+                self.entries[node] = rslt
+            self.misses += 1
+            return rslt
+        self.hits += 1
+        return rslt
+
+    def line_dependent(self):
+        """ the node being rendered puts its line number in its text """
+        self.line_marks += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else 0.0
+
+    def report(self):
+        return 'render cache: %d hits, %d misses, hit rate %.1f%%' % (
+            self.hits, self.misses, self.hit_rate() * 100)
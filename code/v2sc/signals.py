@@ -0,0 +1,510 @@
+#-------------------------------------------------------------------------------
+# signals.py
+#
+# Nets and variables declared in a module, and the C++ types they map to
+#
+# The generator builds a SignalTable for each ModuleDef before rendering its
+# items, so that the code of an item can depend on the declarations of the
+# module: the type chosen for a signal, whether it is used as a number or
+# only as a vector of bits, the width an expression can reach.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import re
+
+from pyverilog.vparser.ast import *
+
+# C++ integer types by the number of bits they hold
+NATIVE_TYPES = (
+    (8, 'uint8_t', 'int8_t'),
+    (16, 'uint16_t', 'int16_t'),
+    (32, 'uint32_t', 'int32_t'),
+    (64, 'uint64_t', 'int64_t'),
+    )
+
+def native_type(width, signed=False):
+    """ smallest C++ integer type holding width bits, or None if there is none """
+    if width == 1 and not signed:
+        return 'bool'
+    for bits, unsigned_type, signed_type in NATIVE_TYPES:
+        if width <= bits:
+            return signed_type if signed else unsigned_type
+    return None
+
+def native_bits(ctype):
+    """ number of bits of a type returned by native_type() """
+    if ctype == 'bool':
+        return 1
+    for bits, unsigned_type, signed_type in NATIVE_TYPES:
+        if ctype in (unsigned_type, signed_type):
+            return bits
+    return None
+
+def mask_literal(width, shift=0):
+    """ C++ literal of width set bits above the shift lower ones """
+    mask = '0x%x' % (((1 << width) - 1) << shift)
+    return mask + 'ULL' if width + shift > 31 else mask
+
+literal_pattern = re.compile(r"^\s*(\d*)\s*'\s*[sS]?\s*([bBoOdDhH])\s*([0-9a-fA-FxXzZ_?]+)\s*$")
+LITERAL_BASES = { 'b' : 2, 'o' : 8, 'd' : 10, 'h' : 16 }
+
+def constant_width(value):
+    """ number of bits of the value of an IntConst literal, or None """
+    if value.isdigit():
+        return max(int(value).bit_length(), 1)
+    m = literal_pattern.match(value)
+    if m is None:
+        return None
+    size, base, digits = m.groups()
+    if size:
+        return int(size)
+    try:
+        return max(int(digits.replace('_', ''), LITERAL_BASES[base.lower()]).bit_length(), 1)
+    except ValueError:
+        return None # x and z digits of an unsized literal
+
+def literal_value(value):
+    """ integer value of an IntConst literal, or None when it has x or z digits """
+    if value.isdigit():
+        return int(value)
+    m = literal_pattern.match(value)
+    if m is None:
+        return None
+    size, base, digits = m.groups()
+    try:
+        return int(digits.replace('_', ''), LITERAL_BASES[base.lower()])
+    except ValueError:
+        return None
+
+def literal_signed(value):
+    """ whether an IntConst literal is signed: unsized decimal, or based with an s """
+    return value.isdigit() or "'s" in value.replace(' ', '').lower()
+
+class Signal(object):
+    """ a net, variable or port of a module """
+    def __init__(self, name, kind, width=1, signed=False, length=None, offset=0):
+        self.name = name
+        self.kind = kind # class of the declaration: Input, Output, Inout, Wire, Reg, ...
+        self.width = width
+        self.signed = signed
+        self.length = length # number of words of an array, or None
+        self.offset = offset # index of the first word of an array, None when not constant
+        self.numeric = False # used as a number, not only as a vector of bits
+        self.partial = False # written a bit or a part at a time
+
+    def is_port(self):
+        return issubclass(self.kind, (Input, Output, Inout))
+
+    def is_array(self):
+        return self.length is not None
+
+    def is_vector(self):
+        """
+        whether the signal is wide and only copied, sliced, concatenated,
+        compared for equality or combined bit by bit, so that a bit vector
+        holds it better than an arbitrary precision integer
+        """
+        return self.width >= 64 and not self.numeric and not self.is_port()
+
+    def ctype(self):
+        """ native C++ type of a word of the signal, or None when it is wider than 64 bits """
+        return native_type(self.width, self.signed)
+
+# operators that need the value of their operands as a number
+NUMERIC_OPERATORS = (Plus, Minus, Times, Divide, Mod, Power, Sra,
+                     LessThan, GreaterThan, LessEq, GreaterEq,
+                     Uminus, Land, Lor, Ulnot)
+
+def contains_numeric(node):
+    found = []
+    def pre(n):
+        if isinstance(n, NUMERIC_OPERATORS):
+            found.append(n)
+        return not found
+    walk(node, pre=pre)
+    return bool(found)
+
+# declarations that make a signal, in the order a port declaration and its
+# net declaration are merged: the port kind wins
+SIGNAL_CLASSES = (Input, Output, Inout, Tri, Wire, Reg, WireArray, RegArray, Integer)
+
+class SignalTable(object):
+    """
+    The signals declared by the ports and the items of a module. get_width
+    gives the number of bits of a Width (or Length) node.
+    """
+    def __init__(self, module=None, get_width=None):
+        self.signals = {}
+        self.get_width = get_width
+        if module is not None:
+            self.collect(module)
+
+    def __contains__(self, name):
+        return name in self.signals
+
+    def get(self, name):
+        return self.signals.get(name)
+
+    def collect(self, module):
+        declarations = []
+        if module.portlist is not None:
+            for port in module.portlist.ports:
+                if isinstance(port, Ioport):
+                    declarations.append(port.first)
+                    if port.second is not None:
+                        declarations.append(port.second)
+        for item in module.items or ():
+            if isinstance(item, Decl):
+                declarations.extend(item.list)
+        for decl in declarations:
+            if isinstance(decl, SIGNAL_CLASSES):
+                self.declare(decl)
+        for item in module.items or ():
+            walk(item, pre=self.collect_usage)
+
+    def declare(self, decl):
+        if isinstance(decl, Integer):
+            width = 32
+        elif decl.width is None:
+            width = 1
+        else:
+            width = self.get_width(decl.width)
+        length = None
+        offset = 0
+        if isinstance(decl, (WireArray, RegArray)):
+            # [0:255] as well as [255:0]
+            length = abs(self.get_width(decl.length) - 1) + 1
+            msb = constant_width_value(decl.length.msb)
+            lsb = constant_width_value(decl.length.lsb)
+            offset = None if msb is None or lsb is None else min(msb, lsb)
+        signal = self.signals.get(decl.name)
+        if signal is None:
+            self.signals[decl.name] = Signal(decl.name, decl.__class__, width, bool(decl.signed),
+                                             length, offset)
+            return
+        # 'output [7:0] q;' and 'reg [7:0] q;' declare the same signal
+        if decl.width is not None:
+            signal.width = width
+        signal.signed = signal.signed or bool(decl.signed)
+        if length is not None:
+            signal.length = length
+            signal.offset = offset
+        if not signal.is_port():
+            signal.kind = decl.__class__
+
+    def mark_numeric(self, node):
+        """ mark the signals read or written by node as used as numbers """
+        def pre(n):
+            if isinstance(n, Identifier) and n.scope is None and n.name in self.signals:
+                self.signals[n.name].numeric = True
+        walk(node, pre=pre)
+
+    def mark_partial(self, node):
+        """ mark the vectors of which the target node writes a bit or a part """
+        if isinstance(node, LConcat):
+            for item in node.list:
+                self.mark_partial(item)
+        elif (isinstance(node, (Pointer, Partselect)) and isinstance(node.var, Identifier) and
+              node.var.scope is None):
+            signal = self.signals.get(node.var.name)
+            if signal is not None and not signal.is_array() and signal.width > 1:
+                signal.partial = True
+
+    def collect_usage(self, node):
+        if isinstance(node, NUMERIC_OPERATORS):
+            self.mark_numeric(node)
+            return False
+        if isinstance(node, (IfStatement, WhileStatement, ForStatement, Cond)):
+            # tested for truth, unless it already is a comparison
+            if not isinstance(node.cond, (Eq, NotEq, Eql, NotEql)):
+                self.mark_numeric(node.cond)
+        elif isinstance(node, Pointer):
+            self.mark_numeric(node.ptr)
+        elif isinstance(node, (Assign, Substitution)):
+            # takes the number computed on the right
+            if contains_numeric(node.right):
+                self.mark_numeric(node.left)
+            self.mark_partial(node.left.var)
+        elif isinstance(node, FunctionCall):
+            for arg in node.args:
+                self.mark_numeric(arg)
+        elif isinstance(node, PortArg):
+            # the type must match the port of the instantiated module
+            if node.argname is not None:
+                self.mark_numeric(node.argname)
+
+    def value_width(self, node):
+        """
+        Upper bound of the number of bits of the unsigned value of an
+        expression, or None when it is unbounded or unknown (wrapping
+        subtractions, inversions, parameters, function calls).
+        """
+        return bottom_up(node, self.node_value_width)
+
+    def node_value_width(self, node, width):
+        """ value_width of node, width giving the one of each child """
+        if isinstance(node, (Rvalue, Lvalue)):
+            return width(node.var)
+        if isinstance(node, Identifier):
+            signal = self.signals.get(node.name)
+            return signal.width if signal is not None and node.scope is None else None
+        if isinstance(node, IntConst):
+            return constant_width(node.value)
+        if isinstance(node, (Eq, NotEq, Eql, NotEql, LessThan, GreaterThan, LessEq, GreaterEq,
+                             Land, Lor, Ulnot, Uand, Unand, Uor, Unor, Uxor, Uxnor)):
+            return 1
+        if isinstance(node, Uplus):
+            return width(node.right)
+        if isinstance(node, Partselect):
+            msb = constant_width_value(node.msb)
+            lsb = constant_width_value(node.lsb)
+            if msb is None or lsb is None:
+                return width(node.var)
+            return abs(msb - lsb) + 1
+        if isinstance(node, Pointer):
+            if isinstance(node.var, Identifier):
+                signal = self.signals.get(node.var.name)
+                if signal is not None and signal.is_array():
+                    return signal.width
+            return 1
+        if isinstance(node, Concat):
+            items = [ width(item) for item in node.list ]
+            return None if None in items else sum(items)
+        if isinstance(node, Repeat):
+            value = width(node.value)
+            times = constant_width_value(node.times)
+            return None if value is None or times is None else value * times
+        if isinstance(node, Cond):
+            return max_width(width(node.true_value), width(node.false_value))
+        if isinstance(node, UnaryOperator):
+            return None # inverted or negated, the bits above the width are set
+        if isinstance(node, Operator):
+            left = width(node.left)
+            right = width(node.right)
+            if isinstance(node, Plus):
+                return None if left is None or right is None else max(left, right) + 1
+            if isinstance(node, Times):
+                return None if left is None or right is None else left + right
+            if isinstance(node, Divide):
+                return left
+            if isinstance(node, Mod):
+                return right if left is None else (left if right is None else min(left, right))
+            if isinstance(node, And):
+                return right if left is None else (left if right is None else min(left, right))
+            if isinstance(node, (Or, Xor)):
+                return max_width(left, right)
+            if isinstance(node, Sll):
+                shift = constant_width_value(node.right)
+                return None if left is None or shift is None else left + shift
+            if isinstance(node, Srl):
+                return left
+        return None
+
+    def expression_width(self, node):
+        """
+        Number of bits Verilog gives an expression by itself, before it is
+        extended to the width of the expression around it, or None when it
+        is unknown (parameters, function calls).
+        """
+        return bottom_up(node, self.node_expression_width)
+
+    def node_expression_width(self, node, width):
+        """ expression_width of node, width giving the one of each child """
+        if isinstance(node, (Rvalue, Lvalue)):
+            return width(node.var)
+        if isinstance(node, Identifier):
+            signal = self.signals.get(node.name)
+            return signal.width if signal is not None and node.scope is None else None
+        if isinstance(node, IntConst):
+            m = literal_pattern.match(node.value)
+            return int(m.group(1)) if m is not None and m.group(1) else 32
+        if isinstance(node, (Eq, NotEq, Eql, NotEql, LessThan, GreaterThan, LessEq, GreaterEq,
+                             Land, Lor, Ulnot, Uand, Unand, Uor, Unor, Uxor, Uxnor)):
+            return 1
+        if isinstance(node, (Partselect, Pointer, Concat, Repeat)):
+            return self.node_value_width(node, width)
+        if isinstance(node, Cond):
+            return max_width(width(node.true_value), width(node.false_value))
+        if isinstance(node, UnaryOperator):
+            return width(node.right)
+        if isinstance(node, (Sll, Srl, Sra, Power)):
+            return width(node.left)
+        if isinstance(node, Operator):
+            return max_width(width(node.left), width(node.right))
+        return None
+
+    def expression_signed(self, node):
+        """ whether Verilog evaluates an expression as signed """
+        return bottom_up(node, self.node_expression_signed)
+
+    def node_expression_signed(self, node, signed):
+        """ expression_signed of node, signed giving the one of each child """
+        if isinstance(node, (Rvalue, Lvalue)):
+            return signed(node.var)
+        if isinstance(node, Identifier):
+            signal = self.signals.get(node.name)
+            return signal is not None and node.scope is None and signal.signed
+        if isinstance(node, IntConst):
+            return literal_signed(node.value)
+        if isinstance(node, Pointer):
+            signal = self.signals.get(node.var.name) if isinstance(node.var, Identifier) else None
+            return signal is not None and signal.is_array() and signal.signed
+        if isinstance(node, Cond):
+            return signed(node.true_value) and signed(node.false_value)
+        if isinstance(node, (Uplus, Uminus, Unot)):
+            return signed(node.right)
+        if isinstance(node, (Sll, Srl, Sra, Power)):
+            return signed(node.left)
+        if isinstance(node, (Plus, Minus, Times, Divide, Mod, And, Or, Xor, Xnor)):
+            return signed(node.left) and signed(node.right)
+        return False # selects, concatenations, comparisons and reductions
+
+def bottom_up(node, function):
+    """
+    function(n, value) of node, worked out for each node n of its subtree
+    from the leaves up, value(child) giving the result for a child of n
+    """
+    values = {}
+    def value(child):
+        return values.get(id(child))
+    def post(n):
+        values[id(n)] = function(n, value)
+    walk(node, post=post)
+    return values[id(node)]
+
+def constant_width_value(node):
+    """ integer value of a decimal constant, or None """
+    if isinstance(node, IntConst) and node.value.isdigit():
+        return int(node.value)
+    return None
+
+def max_width(a, b):
+    return None if a is None or b is None else max(a, b)
+
+#-------------------------------------------------------------------------------
+# Signals read and written by the items of a module
+#-------------------------------------------------------------------------------
+def target_names(node, names):
+    """ add the names of the signals an Lvalue (or a part of it) writes to names """
+    if isinstance(node, Lvalue):
+        target_names(node.var, names)
+    elif isinstance(node, (Pointer, Partselect)):
+        target_names(node.var, names)
+    elif isinstance(node, LConcat):
+        for item in node.list:
+            target_names(item, names)
+    elif isinstance(node, Identifier) and node.scope is None:
+        names.append(node.name)
+
+def writes(item):
+    """ names of the signals written by a module item, in order """
+    names = []
+    if isinstance(item, Assign):
+        target_names(item.left, names)
+        return names
+    def pre(node):
+        if isinstance(node, Substitution):
+            target_names(node.left, names)
+    walk(item, pre=pre)
+    return names
+
+def reads(item):
+    """ names of the signals read by a module item, in order of their first read """
+    names = []
+    def pre(node):
+        if isinstance(node, Identifier):
+            if node.scope is None:
+                names.append(node.name)
+        elif isinstance(node, SensList):
+            return False
+        elif isinstance(node, Lvalue):
+            # the target is written, only its indices and bounds are read
+            var = node.var
+            while isinstance(var, (Pointer, Partselect)):
+                for child in var.children()[1:]:
+                    walk(child, pre=pre)
+                var = var.var
+            if isinstance(var, LConcat):
+                for child in var.list:
+                    pre(Lvalue(child))
+            return False
+    walk(item, pre=pre)
+    return names
+
+def instance_signals(module):
+    """ names of the signals connected to the ports of instances """
+    names = set()
+    def pre(node):
+        if isinstance(node, PortArg) and node.argname is not None:
+            names.update(reads(node.argname))
+            return False
+    for item in module.items or ():
+        walk(item, pre=pre)
+    return names
+
+def local_signals(module, signals):
+    """
+    names of the internal signals written by the blocking assignments of a
+    single module item and read by no other, which no other process can
+    observe and so need no signal. signals is the SignalTable of the module.
+    """
+    writers = {}
+    readers = {}
+    shared = set() # touched by an instance, a generate block, an assign or a sensitivity list
+    nonblocking = set()
+    def pre(node):
+        if isinstance(node, SensList):
+            for sens in node.list:
+                if sens.sig is not None:
+                    shared.update(reads(sens.sig))
+            return False
+        if isinstance(node, NonblockingSubstitution):
+            nonblocking.update(writes(node))
+    for index, item in enumerate(module.items or ()):
+        if isinstance(item, Decl):
+            continue
+        if isinstance(item, (InstanceList, Instance, GenerateStatement)):
+            shared.update(reads(item))
+            shared.update(writes(item))
+            continue
+        if isinstance(item, Assign):
+            shared.update(writes(item)) # driven continuously, not by a process
+        else:
+            for name in writes(item):
+                writers.setdefault(name, set()).add(index)
+        for name in reads(item):
+            readers.setdefault(name, set()).add(index)
+        walk(item, pre=pre)
+
+    names = set()
+    for name, items in writers.items():
+        signal = signals.get(name)
+        if (signal is None or signal.is_port() or name in shared or name in nonblocking or
+            len(items) > 1 or readers.get(name, set()) - items):
+            continue
+        names.add(name)
+    return names
+
+def flat_memories(module, signals):
+    """
+    names of the arrays of module only written a whole word at a time, at
+    an index whose first word is known, which flat storage can hold
+    """
+    names = set([ name for name, signal in signals.signals.items()
+                  if signal.is_array() and signal.offset is not None ])
+    def word(node):
+        return (isinstance(node, Pointer) and isinstance(node.var, Identifier) and
+                node.var.scope is None)
+    def pre(node):
+        if isinstance(node, Lvalue):
+            if not word(node.var):
+                targets = []
+                target_names(node, targets)
+                names.difference_update(targets)
+            return False
+        if isinstance(node, PortArg) and node.argname is not None:
+            names.difference_update(reads(node.argname))
+            return False
+    for item in module.items or ():
+        walk(item, pre=pre)
+    return names
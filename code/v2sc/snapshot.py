@@ -0,0 +1,188 @@
+#-------------------------------------------------------------------------------
+# snapshot.py
+#
+# Binary AST snapshots, reloaded without running the parser
+#
+# A snapshot is the ColumnarAST of a design written to a file:
+#   magic 'V2SCAST\0', format version (uint32), header length (uint32),
+#   header (JSON), then the arrays of the store and the string table as raw
+#   bytes, each aligned to 8 bytes, and the pickled objects if there are any.
+# The header records the node classes and their fields, so a snapshot made
+# with another ast.py is refused instead of being decoded wrongly. load()
+# maps the file into memory and the arrays are used in place, nodes being
+# decoded only when they are materialized. A snapshot may come from a shared
+# cache directory, so its objects are unpickled into nothing but ast nodes
+# and plain values.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+import os
+import io
+import mmap
+import json
+import struct
+import pickle
+from array import array
+
+from pyverilog.vparser.ast import Node
+from columnar import ColumnarAST, NODE_CLASSES, CLASS_FIELDS
+
+SNAPSHOT_MAGIC = b'V2SCAST\x00'
+SNAPSHOT_VERSION = 1
+
+ARRAYS = ('kinds', 'linenos', 'first', 'offsets', 'tags', 'values',
+          'seqs', 'seq_items', 'string_offsets')
+
+_prefix = struct.Struct('<8sII')
+
+class SnapshotError(ValueError):
+    pass
+
+# the constructors a pickle of ast nodes and field values refers to
+SAFE_BUILTINS = ('list', 'tuple', 'set', 'frozenset', 'dict',
+                 'int', 'float', 'complex', 'str', 'bytes', 'bool')
+
+NODE_CLASS_NAMES = dict([ (cls.__name__, cls) for cls in NODE_CLASSES ])
+
+class ObjectUnpickler(pickle.Unpickler):
+    """ unpickler of the objects section, refusing any class but the node classes """
+    def find_class(self, module, name):
+        if module in ('builtins', '__builtin__') and name in SAFE_BUILTINS:
+            return pickle.Unpickler.find_class(self, module, name)
+        cls = NODE_CLASS_NAMES.get(name)
+        if cls is not None and cls.__module__ == module:
+            return cls
+        raise SnapshotError('snapshot object of class %s.%s refused' % (module, name))
+
+def load_objects(data):
+    try:
+        return ObjectUnpickler(io.BytesIO(data)).load()
+    except SnapshotError:
+        raise
+    except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError) as e:
+        raise SnapshotError('snapshot objects unreadable: %s' % e)
+
+def schema():
+    """ node classes and their fields, as recorded in the header """
+    return [ [ cls.__name__, list(names) ] for cls, names in zip(NODE_CLASSES, CLASS_FIELDS) ]
+
+SCHEMA = schema()
+
+def save(tree, filename, directives=(), lines=None):
+    """
+    write a Node tree, or a ColumnarAST, to filename, with the number of
+    lines of the preprocessed text it was parsed from if known
+    """
+    store = ColumnarAST.from_node(tree) if isinstance(tree, Node) else tree
+    sections = []
+    for name in ARRAYS:
+        a = getattr(store, name)
+        sections.append( (name, a.tobytes(), a.itemsize, len(a)) )
+    sections.append( ('strings', bytes(store.strings), 1, len(store.strings)) )
+    if store.objects:
+        data = pickle.dumps(store.objects, pickle.HIGHEST_PROTOCOL)
+        sections.append( ('objects', data, 1, len(data)) )
+
+    header = {
+        'byteorder' : sys.byteorder,
+        'classes' : SCHEMA,
+        'directives' : [ list(d) for d in directives ],
+        'lines' : lines,
+        'sections' : {},
+        }
+    # the offsets depend on the length of the header, which depends on them
+    position = 0
+    for name, data, itemsize, count in sections:
+        header['sections'][name] = [ position, itemsize, count ]
+        position += (len(data) + 7) & ~7
+    body = json.dumps(header, sort_keys=True).encode('utf-8')
+    start = (_prefix.size + len(body) + 7) & ~7
+
+    # each writer has its own temporary file, several may save the same snapshot
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    with open(tmpname, 'wb') as f:
+        f.write(_prefix.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(body)))
+        f.write(body)
+        f.write(b'\x00' * (start - _prefix.size - len(body)))
+        for name, data, itemsize, count in sections:
+            f.write(data)
+            f.write(b'\x00' * (((len(data) + 7) & ~7) - len(data)))
+    # a reader never sees a partial snapshot
+    os.rename(tmpname, filename)
+
+def read_header(f):
+    prefix = f.read(_prefix.size)
+    if len(prefix) != _prefix.size:
+        raise SnapshotError('not a snapshot: %s' % f.name)
+    magic, version, length = _prefix.unpack(prefix)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError('not a snapshot: %s' % f.name)
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError('snapshot format %d, expected %d: %s' %
+                            (version, SNAPSHOT_VERSION, f.name))
+    header = json.loads(f.read(length).decode('utf-8'))
+    if header['classes'] != SCHEMA:
+        raise SnapshotError('snapshot made with other node classes: %s' % f.name)
+    start = (_prefix.size + length + 7) & ~7
+    return header, start
+
+def load_store(filename):
+    """ ColumnarAST of a snapshot, its arrays mapped from the file (read only) """
+    with open(filename, 'rb') as f:
+        header, start = read_header(f)
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(buf)
+    swap = header['byteorder'] != sys.byteorder
+
+    store = ColumnarAST()
+    store.mmap = buf
+    for name in ARRAYS + ('strings', 'objects'):
+        if name not in header['sections']:
+            continue
+        position, itemsize, count = header['sections'][name]
+        begin = start + position
+        data = view[begin:begin + itemsize * count]
+        if name == 'strings':
+            store.strings = data
+        elif name == 'objects':
+            store.objects = load_objects(data.tobytes())
+        else:
+            typecode = getattr(store, name).typecode
+            if array(typecode).itemsize != itemsize:
+                raise SnapshotError('snapshot made on another platform: %s' % filename)
+            if swap:
+                values = array(typecode, data.tobytes())
+                values.byteswap()
+                setattr(store, name, values)
+            else:
+                setattr(store, name, data.cast(typecode))
+    store.directives = tuple([ tuple(d) for d in header['directives'] ])
+    store.lines = header.get('lines')
+    return store
+
+def load(filename, lazy=True):
+    """
+    (ast, directives) of a snapshot. With lazy, node lists are materialized
+    as they are accessed, otherwise the whole tree is built at once.
+    """
+    store = load_store(filename)
+    ast = store.root() if lazy else store.tree()
+    return ast, store.directives
+
+def use_snapshot(codeparser, load_from=None, save_to=None):
+    """
+    Make a VerilogCodeParser, or an analyzer derived from it, read its
+    design from a snapshot instead of parsing, or save what it parses.
+    """
+    parse = codeparser.parse
+    def parse_snapshot(*args, **kwargs):
+        if load_from is not None:
+            ast, codeparser.directives = load(load_from, lazy=False)
+            return ast
+        ast = parse(*args, **kwargs)
+        if save_to is not None:
+            save(ast, save_to, codeparser.get_directives())
+        return ast
+    codeparser.parse = parse_snapshot
+    return codeparser
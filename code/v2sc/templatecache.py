@@ -0,0 +1,53 @@
+#-------------------------------------------------------------------------------
+# templatecache.py
+#
+# Persistent compiled-template cache shared by the code generators
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+DEFAULT_TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__)) + '/template/'
+DEFAULT_CACHE_DIR = os.environ.get('V2SC_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'v2sc'))
+
+def get_cache_dir(cache_dir=None, subdir='template'):
+    """ directory holding the compiled templates (or other subdir), or None if it is not writable """
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+    cache_dir = os.path.join(cache_dir, subdir)
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+    except OSError:
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return cache_dir
+
+_environments = {}
+
+def create_environment(template_dir=DEFAULT_TEMPLATE_DIR, cache_dir=None, use_cache=True):
+    """
+    Jinja environment whose compiled templates persist across runs.
+    Cache entries are keyed by template path and checked against a hash of
+    the template source, so an edited template is recompiled automatically.
+    Generators created with the same arguments share the environment, and so
+    the templates already loaded, which Jinja reloads when they are edited.
+    """
+    key = (template_dir, cache_dir, use_cache)
+    env = _environments.get(key)
+    if env is None:
+        env = new_environment(template_dir, cache_dir, use_cache)
+        _environments[key] = env
+    return env
+
+def new_environment(template_dir, cache_dir, use_cache):
+    bytecode_cache = None
+    if use_cache:
+        cache_dir = get_cache_dir(cache_dir)
+        if cache_dir is not None:
+            bytecode_cache = FileSystemBytecodeCache(cache_dir, '%s.cache')
+    return Environment(loader=FileSystemLoader(template_dir),
+                       bytecode_cache=bytecode_cache)
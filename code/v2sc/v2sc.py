@@ -12,21 +12,37 @@ import sys
 import os
 import math
 import re
-import functools
-from jinja2 import Environment, FileSystemLoader
+import time
 from optparse import OptionParser
 
+# start of the imports, for --profile-startup
+IMPORT_START = time.time()
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pyverilog.utils.version
-from pyverilog.vparser.parser import VerilogCodeParser
+from parsetables import VerilogParser, shared_parser, table_file
 #from pyverilog.ast_code_generator.codegen import ASTCodeGenerator
 
 from pyverilog.vparser.ast import *
 from pyverilog.utils.op2mark import op2mark
 from pyverilog.utils.op2mark import op2order
 
+from templatecache import create_environment
+from indentation import indent_block, resolve_indent
+from dispatch import dispatch
+from rendercache import RenderCache
+from incremental import ModuleManifest, source_digest, template_digest
+import snapshot
+from parsecache import ParseCache, DEFAULT_MAX_SIZE
+import parallelparse
+import daemon
+from signals import SignalTable, native_type, native_bits, mask_literal, local_signals, reads
+from signals import flat_memories, literal_value, max_width, bottom_up
+from levelize import levelize, is_combinational, is_wildcard, has_wildcard
+
 DEFAULT_TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__)) + '/template/'
+IMPORT_TIME = time.time() - IMPORT_START
 
 #-------------------------------------------------------------------------------
 try:
@@ -44,10 +60,10 @@ except:
         return ''.join(ret[:-1])
 
 def indent_multiline_assign(text):
+    if '\n' not in text:
+        return text
     ret = []
     texts = text.split('\n')
-    if len(texts) <= 1:
-        return text
     try:
         p = texts[0].index('=')
     except:
@@ -59,20 +75,90 @@ def indent_multiline_assign(text):
 
 
 #-------------------------------------------------------------------------------
+class VisitFailure(object):
+    def __init__(self, error):
+        self.error = error
+
 class ConvertVisitor(object):
+    visit_table = dispatch('visit_table', 'visit_', default='visit_default')
+    visit_cache = None
+    visit_depth = 0
+    max_visit_depth = 100 # deeper subtrees are visited by visit_tree
     def visit(self, node):
-        method = 'visit_' + node.__class__.__name__
-        visitor = getattr(self, method, self.visit_default)
-        return visitor(node)
+        cache = self.visit_cache
+        if cache is not None:
+            rslt = cache.pop(id(node), None)
+            if rslt is None:
+                rslt = self.visit_table[node.__class__](self, node)
+            elif isinstance(rslt, VisitFailure):
+                raise rslt.error
+            return rslt
+        if self.visit_depth >= self.max_visit_depth:
+            return self.visit_tree(node)
+        self.visit_depth += 1
+        try:
+            rslt = self.visit_table[node.__class__](self, node)
+        finally:
+            self.visit_depth -= 1
+        if self.visit_depth == 0:
+            # the blocks are indented once the outermost node is rendered
+            rslt = resolve_indent(rslt, self.indentprefix)
+        return rslt
+    def visit_tree(self, node, visit=None):
+        """
+        Visit the subtree bottom-up with an explicit stack, so that each
+        visitor finds the results of its children already computed and the
+        recursion depth does not grow with the depth of the tree.
+        """
+        self.visit_cache = {}
+        try:
+            walk(node, post=self.prepare)
+            return (visit or self.visit)(node)
+        finally:
+            self.visit_cache = None
+    def prepare(self, node):
+        try:
+            self.visit_cache[id(node)] = self.visit_table[node.__class__](self, node)
+        except Exception as e:
+            # raised again only if a parent really uses this node
+            self.visit_cache[id(node)] = VisitFailure(e)
     def visit_default(self, node):
         ret = []
         for c in node.children():
             ret.append(self.visit(c))
         return ''.join(ret)
 
+TEMPLATE_SUFFIXES = ('', '_process', '_declaration', '_argument', '_parameter')
+
+class StreamSlot(object):
+    """ placeholder rendered by a template as a marker, replaced by the streamed code of node """
+    def __init__(self, node, slots):
+        self.node = node
+        self.marker = '\x00slot%d\x00' % id(self)
+        slots[self.marker] = self
+    def __str__(self):
+        return self.marker
+
 def getfilename(node, suffix=''):
     return node.__class__.__name__.lower() + suffix + '.txt'
 
+def nodeclasses(cls=Node):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for c in nodeclasses(subclass):
+            yield c
+
+def load_templates(env, template_dir=DEFAULT_TEMPLATE_DIR, suffixes=TEMPLATE_SUFFIXES):
+    """ compile every template file once, indexed by (node class, suffix) """
+    filenames = set(os.listdir(template_dir))
+    templates = {}
+    for cls in nodeclasses():
+        for suffix in suffixes:
+            filename = cls.__name__.lower() + suffix + '.txt'
+            if filename in filenames:
+                templates[(cls, suffix)] = env.get_template(filename)
+    return templates
+
 def escape(s):
     if s.startswith('\\'):
         return s + ' '
@@ -86,48 +172,353 @@ def del_paren(s):
 def del_space(s):
     return s.replace(' ', '')
 
+def constant_value(node):
+    """ integer value of a plain decimal constant expression, or None """
+    if isinstance(node, IntConst):
+        value = node.value
+        if value.isdigit() and (value == '0' or not value.startswith('0')):
+            return int(value)
+        return None
+    if isinstance(node, (Plus, Minus, Times)):
+        left = constant_value(node.left)
+        right = constant_value(node.right) if left is not None else None
+        if right is None:
+            return None
+        if isinstance(node, Plus):
+            return left + right
+        if isinstance(node, Minus):
+            return left - right
+        return left * right
+    return None
+
+SENS_RESET_LEVEL = {
+    'posedge' : ', true',
+    'negedge' : ', false',
+    }
+
+def paren(text, wrapped):
+    if wrapped:
+        return '(' + text + ')'
+    return text
+
+def template_source(env, filename):
+    source = env.loader.get_source(env, filename)[0]
+    if source.endswith('\n'):
+        return source[:-1]
+    return source
+
+#-------------------------------------------------------------------------------
+# Expression nodes whose template file still has one of these default sources
+# are emitted by plain string building instead of rendering the template.
+BINARY_OPERATOR_TEMPLATE = '({{ left }} {{ op }} {{ right }})'
+UNARY_OPERATOR_TEMPLATE = '({{ op }}{{ right }})'
+
+DEFAULT_EXPRESSION_TEMPLATES = {
+    Identifier : '{{ scope }}{{ name }}',
+    IntConst : '{{ value }}',
+    Partselect : '{{ var }}.range( {{ msb }}, {{ lsb }} )',
+    Pointer : '{{ var }}[{{ ptr }}]',
+    Concat : '( {% for item in items %}{{ item }}{% if loop.index < len_items %}, {% endif %}{% endfor %} )',
+    Uplus : '({{ right }})',
+    }
+for cls in (Power, Times, Divide, Mod, Plus, Minus, Sll, Srl, Sra,
+            LessThan, GreaterThan, LessEq, GreaterEq, Eq, NotEq, Eql, NotEql,
+            And, Xor, Xnor, Or, Land, Lor):
+    DEFAULT_EXPRESSION_TEMPLATES[cls] = BINARY_OPERATOR_TEMPLATE
+for cls in (Uminus, Ulnot, Unot, Uand, Unand, Uor, Unor, Uxor, Uxnor):
+    DEFAULT_EXPRESSION_TEMPLATES[cls] = UNARY_OPERATOR_TEMPLATE
+
+# operands of these operators always keep their parentheses
+KEEP_PAREN_OPERATORS = (Sll, Srl, Sra,
+                        LessThan, GreaterThan, LessEq, GreaterEq,
+                        Eq, NotEq, Eql, NotEql)
+
+COMPARISON_OPERATORS = (LessThan, GreaterThan, LessEq, GreaterEq, Eq, NotEq, Eql, NotEql)
+EQUALITY_OPERATORS = (Eq, NotEq, Eql, NotEql)
+# operators the value of which is a bit vector when one of their operands is
+BITWISE_OPERATORS = (And, Or, Xor, Xnor)
+
+# expressions worth memoizing when the render cache is enabled, leaves are
+# cheaper to render than to look up
+CACHED_EXPRESSIONS = (Operator, UnaryOperator, Partselect, Pointer, Concat, Repeat)
+
 class ASTCodeGenerator(ConvertVisitor):
-    def __init__(self, indentsize=4, clock_name='CLK', reset_name='RSTX'):
-        self.env = Environment(loader=FileSystemLoader(DEFAULT_TEMPLATE_DIR))
-        self.indent = functools.partial(indent, prefix=' '*indentsize)
+    def __init__(self, indentsize=4, clock_name='CLK', reset_name='RSTX',
+                 cache_dir=None, use_cache=True, native_expression=True,
+                 render_cache=False, manifest=None, native_types=False, wide_types=False,
+                 levelize=False, demote_signals=False, infer_sensitivity=False,
+                 clocked_methods=False, flat_memories=False):
+        self.env = create_environment(DEFAULT_TEMPLATE_DIR, cache_dir, use_cache)
+        self.templates = load_templates(self.env)
+        self.indent = indent_block
+        self.indentprefix = ' '*indentsize
         self.clock_name = clock_name
         self.reset_name = reset_name
+        self.expression_emitters = self.get_expression_emitters() if native_expression else {}
+        self.expression_cache = {}
+        self.render_cache = RenderCache() if render_cache else None
+        self.native_types = native_types
+        self.wide_types = wide_types
+        self.levelize = levelize
+        self.demote_signals = demote_signals
+        self.infer_sensitivity = infer_sensitivity
+        self.clocked_methods = clocked_methods
+        self.flat_memories = flat_memories
+        self.signals = None # of the module being rendered, with any of the options above
+        self.members = () # signals of the module being rendered held by plain members
+        self.memories = () # arrays of the module being rendered held by flat memories
+        self.manifest = ModuleManifest(manifest, self.signature()) if manifest is not None else None
+
+    def signature(self):
+        """ everything besides the AST the code of a module depends on """
+        options = repr((self.__class__.__name__, self.indentprefix, self.clock_name, self.reset_name,
+                        self.native_types, self.wide_types, self.levelize, self.demote_signals,
+                        self.infer_sensitivity, self.clocked_methods, self.flat_memories))
+        return options + source_digest(self.__class__) + template_digest(self.env)
+
+    def get_expression_emitters(self):
+        emitters = {}
+        for cls, source in DEFAULT_EXPRESSION_TEMPLATES.items():
+            if template_source(self.env, cls.__name__.lower() + '.txt') != source:
+                continue # overridden by the user, keep rendering the template
+            if cls in (Identifier, IntConst, Partselect, Pointer, Concat, Uplus):
+                methods = ('visit_' + cls.__name__,)
+                emitter = getattr(self, 'emit_' + cls.__name__)
+            elif issubclass(cls, UnaryOperator):
+                methods = ('visit_' + cls.__name__, 'visit_UnaryOperator')
+                emitter = self.emit_UnaryOperator
+            else:
+                methods = ('visit_' + cls.__name__, 'visit_Operator')
+                emitter = self.emit_Operator
+            if self.overrides(*methods):
+                continue # a subclass visitor takes precedence
+            emitters[cls] = emitter
+        return emitters
+
+    def overrides(self, *methods):
+        for method in methods:
+            if getattr(self.__class__, method) != getattr(ASTCodeGenerator, method):
+                return True
+        return False
+
+    def get_template(self, node, suffix=''):
+        key = (node.__class__, suffix)
+        template = self.templates.get(key)
+        if template is None:
+            template = self.env.get_template(getfilename(node, suffix))
+            self.templates[key] = template
+        return template
+
+    process_table = dispatch('process_table', 'visit_', '_process', 'visit_none')
+    declaration_table = dispatch('declaration_table', 'visit_', '_declaration', 'visit_none')
+    argument_table = dispatch('argument_table', 'visit_', '_argument', 'visit_none')
+    parameter_table = dispatch('parameter_table', 'visit_', '_parameter', 'visit_none')
+    generate_table = dispatch('generate_table', 'generate_', default='generate_default')
 
     def visit_process(self, node):
-        method = 'visit_' + node.__class__.__name__ + '_process'
-        visitor = getattr(self, method, self.visit_none)
-        return visitor(node)
+        return self.process_table[node.__class__](self, node)
 
     def visit_declaration(self, node):
-        method = 'visit_' + node.__class__.__name__ + '_declaration'
-        visitor = getattr(self, method, self.visit_none)
-        return visitor(node)
+        return self.declaration_table[node.__class__](self, node)
 
     def visit_argument(self, node):
-        method = 'visit_' + node.__class__.__name__ + '_argument'
-        visitor = getattr(self, method, self.visit_none)
-        return visitor(node)
+        return self.argument_table[node.__class__](self, node)
 
     def visit_parameter(self, node):
-        method = 'visit_' + node.__class__.__name__ + '_parameter'
-        visitor = getattr(self, method, self.visit_none)
-        return visitor(node)
+        return self.parameter_table[node.__class__](self, node)
 
     def visit_none(self, node):
         return ''
 
+    def write(self, node, out):
+        """ write the code of node to the file-like object out, one piece at a time """
+        for chunk in self.generate(node):
+            out.write(chunk)
+
+    def generate(self, node):
+        return self.generate_table[node.__class__](self, node)
+
+    def generate_default(self, node):
+        return iter((resolve_indent(self.visit(node), self.indentprefix),))
+
+    def generate_template(self, template, template_dict, slots):
+        for chunk in template.generate(template_dict):
+            slot = slots.pop(chunk, None)
+            if slot is not None:
+                for c in self.generate(slot.node):
+                    yield c
+            elif '\x00slot' in chunk:
+                # the template did more than print the slot, fall back to its text
+                for marker in [ m for m in slots if m in chunk ]:
+                    chunk = chunk.replace(marker, self.visit(slots.pop(marker).node))
+                yield chunk
+            else:
+                yield chunk
+
+    def visit_tree(self, node, visit=None):
+        try:
+            return ConvertVisitor.visit_tree(self, node, visit)
+        finally:
+            self.expression_cache.clear()
+
+    def prepare(self, node):
+        emitter = self.expression_emitters.get(node.__class__)
+        if emitter is None:
+            return ConvertVisitor.prepare(self, node)
+        try:
+            self.expression_cache[id(node)] = emitter(node)
+        except Exception as e:
+            self.expression_cache[id(node)] = VisitFailure(e)
+
+    def visit_expression(self, node):
+        """ (text without the outer parentheses, whether it had them) """
+        # a subtree visited bottom-up has rendered its nodes before they are
+        # looked up, too early for the cache to see the line numbers they hold
+        if (self.render_cache is not None and self.visit_cache is None and
+            isinstance(node, CACHED_EXPRESSIONS)):
+            return self.render_cache.get(node, self.render_expression)
+        return self.render_expression(node)
+
+    def render_expression(self, node):
+        emitter = self.expression_emitters.get(node.__class__)
+        if emitter is not None:
+            rslt = self.expression_cache.pop(id(node), None)
+            if rslt is None:
+                if self.visit_cache is not None:
+                    return emitter(node)
+                if self.visit_depth >= self.max_visit_depth:
+                    return self.visit_tree(node, self.visit_expression)
+                self.visit_depth += 1
+                try:
+                    return emitter(node)
+                finally:
+                    self.visit_depth -= 1
+            elif isinstance(rslt, VisitFailure):
+                raise rslt.error
+            return rslt
+        text = self.visit(node)
+        if text.startswith('(') and text.endswith(')'):
+            return text[1:-1], True
+        return text, False
+
+    def visit_noparen(self, node):
+        return self.visit_expression(node)[0]
+
+    def emit(self, node):
+        return paren(*self.visit_expression(node))
+
+    def visit_operands(self, node):
+        order = op2order(node.__class__.__name__)
+        lorder = op2order(node.left.__class__.__name__)
+        rorder = op2order(node.right.__class__.__name__)
+        left, lwrapped = self.visit_expression(node.left)
+        right, rwrapped = self.visit_expression(node.right)
+        if (lwrapped and
+            (isinstance(node.left, KEEP_PAREN_OPERATORS) or lorder is None or lorder > order)):
+            left = '(' + left + ')'
+        if (rwrapped and
+            (isinstance(node.right, KEEP_PAREN_OPERATORS) or rorder is None or order <= rorder)):
+            right = '(' + right + ')'
+        return left, right
+
+    def emit_Operator(self, node):
+        if self.native_types and isinstance(node, COMPARISON_OPERATORS):
+            left, right = self.compared_operands(node)
+        else:
+            left, right = self.visit_operands(node)
+        if self.wide_types and isinstance(node, EQUALITY_OPERATORS):
+            left, right = self.common_operands(node.left, node.right, left, right)
+        return left + ' ' + op2mark(node.__class__.__name__) + ' ' + right, True
+
+    def emit_UnaryOperator(self, node):
+        return op2mark(node.__class__.__name__) + self.visit(node.right), True
+
+    def emit_Uplus(self, node):
+        return self.visit(node.right), True
+
+    def emit_Identifier(self, node):
+        scope = '' if node.scope is None else self.visit(node.scope).replace('.', '::')
+        return scope + escape(node.name), False
+
+    def emit_IntConst(self, node):
+        return str(node.value), False
+
+    def emit_Partselect(self, node):
+        if self.native_types:
+            rslt = self.native_select(node)
+            if rslt is not None:
+                return rslt
+        var = self.visit(node.var)
+        text = (var + '.range( ' + del_space(self.visit_noparen(node.msb)) + ', ' +
+                del_space(self.visit_noparen(node.lsb)) + ' )')
+        if var.startswith('('):
+            return text[1:-1], True
+        return text, False
+
+    def emit_Pointer(self, node):
+        if self.memories and self.memory_word(node):
+            return self.visit(node.var) + '[' + self.memory_address(node) + ']', False
+        if self.native_types:
+            rslt = self.native_select(node)
+            if rslt is not None:
+                return rslt
+        return self.visit(node.var) + '[' + self.visit_noparen(node.ptr) + ']', False
+
+    def emit_Concat(self, node):
+        if self.native_types:
+            rslt = self.native_concat(node)
+            if rslt is not None:
+                return rslt
+            # kept in parentheses even where an expression drops its own,
+            # without them the items would be operands of the comma operator
+            items = [ self.concat_item(item) for item in node.list ]
+            return '( ' + ', '.join(items) + ' )', False
+        items = [ self.visit_noparen(item) for item in node.list ]
+        return ' ' + ', '.join(items) + ' ', True
+
     def visit_Source(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'description' : self.visit(node.description),
+            'prelude' : self.visit_prelude(node),
             }
         rslt = template.render(template_dict)
+        rslt = resolve_indent(rslt, self.indentprefix)
         return rslt
 
+    def generate_Source(self, node):
+        template = self.get_template(node)
+        slots = {}
+        template_dict = {
+            'description' : StreamSlot(node.description, slots),
+            'prelude' : self.visit_prelude(node),
+            }
+        return self.generate_template(template, template_dict, slots)
+
+    def visit_prelude(self, node):
+        """ definitions the generated code of the modules of node relies on """
+        if not self.flat_memories:
+            return ''
+        arrays = []
+        def pre(n):
+            if isinstance(n, (RegArray, WireArray)):
+                arrays.append(n)
+            return not arrays
+        walk(node, pre=pre)
+        if not arrays:
+            return ''
+        return self.env.get_template('flatmemory.txt').render({})
+
+    def generate_Description(self, node):
+        template = self.get_template(node)
+        slots = {}
+        template_dict = {
+            'definitions' : ( StreamSlot(definition, slots) for definition in node.definitions ),
+            }
+        return self.generate_template(template, template_dict, slots)
+
     def visit_Description(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'definitions' : [ self.visit(definition) for definition in node.definitions ],
             }
@@ -135,26 +526,97 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ModuleDef(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.manifest is not None:
+            key = self.manifest.key(node)
+            rslt = self.manifest.get(key)
+            if rslt is None:
+                rslt = self.render_ModuleDef(node)
+            self.manifest.put(node.name, key, rslt)
+            return rslt
+        return self.render_ModuleDef(node)
+
+    def render_ModuleDef(self, node):
+        template = self.get_template(node)
+        template_dict = self.get_ModuleDef_dict(node)
+        rslt = template.render(template_dict)
+        rslt = resolve_indent(rslt, self.indentprefix)
+        return rslt
+
+    def generate_ModuleDef(self, node):
+        if self.manifest is not None:
+            key = self.manifest.key(node)
+            rslt = self.manifest.get(key)
+            if rslt is not None:
+                self.manifest.put(node.name, key, rslt)
+                yield rslt
+                return
+            chunks = []
+            for chunk in self.stream_ModuleDef(node):
+                chunks.append(chunk)
+                yield chunk
+            self.manifest.put(node.name, key, ''.join(chunks))
+            return
+        for chunk in self.stream_ModuleDef(node):
+            yield chunk
+
+    def stream_ModuleDef(self, node):
+        template = self.get_template(node)
+        template_dict = self.get_ModuleDef_dict(node, stream=True)
+        for chunk in template.generate(template_dict):
+            yield resolve_indent(chunk, self.indentprefix)
+
+    def get_ModuleDef_dict(self, node, stream=False):
+        """
+        Classify and render the module items in a single pass. When streaming,
+        the item bodies are left to a lazy sequence rendered one at a time.
+        """
+        if self.render_cache is not None:
+            # the tree may have been edited since it was last hashed
+            self.render_cache.clear()
+            invalidate_hashes()
+        if (self.native_types or self.wide_types or self.levelize or self.demote_signals or
+            self.infer_sensitivity or self.flat_memories or has_wildcard(node)):
+            self.signals = SignalTable(node, self.get_width)
         portlist = self.indent(self.visit(node.portlist)) if node.portlist is not None else ''
-        paramlist = [ self.visit(node.paramlist) ] if node.paramlist is not None else ()
-        parameters = [ self.visit_parameter(item) for item in node.items ] if node.items else ()
-        parameters += paramlist
+        moduleitems = node.items if node.items else ()
+        self.members = ()
+        if self.levelize:
+            evaluation = levelize(node, self.signals)
+            if evaluation is not None:
+                moduleitems = evaluation.replace(moduleitems)
+                self.members = evaluation.members
+        if self.demote_signals:
+            self.members = set(self.members) | local_signals(node, self.signals)
+        self.memories = ()
+        if self.flat_memories:
+            self.memories = flat_memories(node, self.signals) - set(self.members)
+        parameters = []
+        declarationlist = []
+        processlist = []
+        items = []
+        for item in moduleitems:
+            cls = item.__class__
+            parameters.append(self.parameter_table[cls](self, item))
+            declarationlist.append(self.declaration_table[cls](self, item))
+            processlist.append(self.process_table[cls](self, item))
+            if not stream:
+                items.append(self.indent(self.visit(item)))
+        if stream:
+            items = ( self.indent(self.visit(item)) for item in moduleitems )
+        if node.paramlist is not None:
+            parameters.append(self.visit(node.paramlist))
         template_dict = {
             'modulename' : escape(node.name),
             'portlist' :  portlist,
             'parameters' : parameters,
-            'declarationlist' : [ self.visit_declaration(item) for item in node.items ] if node.items else (),
-            'processlist' : [ self.visit_process(item) for item in node.items ] if node.items else (),
-            'items' : [ self.indent(self.visit(item)) for item in node.items ] if node.items else (),
+            'declarationlist' : declarationlist,
+            'processlist' : processlist,
+            'items' : items,
             }
-        rslt = template.render(template_dict)
-        return rslt
+        return template_dict
 
     def visit_Paramlist(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         params = [ self.visit_parameter(param).replace(';','') for param in node.params ]
         template_dict = {
             'params' : params,
@@ -164,8 +626,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Paramlist_parameter(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         params = [ self.visit_parameter(param).replace(';','') for param in node.params ]
         template_dict = {
             'params' : params,
@@ -175,8 +636,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Portlist(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         ports = [ self.visit(port) for port in node.ports ]
         template_dict = {
             'ports' : ports,
@@ -186,8 +646,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Port(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -195,30 +654,323 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Width(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        msb = del_space(del_paren(self.visit(node.msb)))
-        lsb = del_space(del_paren(self.visit(node.lsb)))
+        template = self.get_template(node)
         template_dict = {
-            'width': eval( msb + '-' + lsb + '+1' ),
+            'width': self.get_width(node),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Length(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        msb = del_space(del_paren(self.visit(node.msb)))
-        lsb = del_space(del_paren(self.visit(node.lsb)))
+        template = self.get_template(node)
+        template_dict = {
+            'width': self.get_width(node),
+            }
+        rslt = template.render(template_dict)
+        return rslt
+
+    def get_width(self, node):
+        msb = constant_value(node.msb)
+        lsb = constant_value(node.lsb)
+        if msb is not None and lsb is not None:
+            return msb - lsb + 1
+        msb = del_space(self.visit_noparen(node.msb))
+        lsb = del_space(self.visit_noparen(node.lsb))
+        return eval( msb + '-' + lsb + '+1' )
+
+    def declared_type(self, node, width):
+        """
+        type of a declared signal chosen from its width and usage, or None
+        to keep the SystemC integer type
+        """
+        if self.signals is None:
+            return None
+        if self.native_types and not self.partial_signal(node.name):
+            ctype = native_type(int(width), bool(node.signed))
+            if ctype is not None:
+                return ctype
+        if self.wide_types:
+            signal = self.signals.get(node.name)
+            if signal is not None and signal.kind is node.__class__ and signal.is_vector():
+                return 'sc_bv<' + str(width) + '>'
+        return None
+
+    def is_member(self, node):
+        """ whether a declared net or variable is held by a plain member instead of a signal """
+        if node.name not in self.members:
+            return False
+        signal = self.signals.get(node.name)
+        return signal is not None and signal.kind is node.__class__
+
+    def is_memory(self, node):
+        """ number of words of a declared array held by a flat memory, or None """
+        if node.name not in self.memories:
+            return None
+        return self.signals.get(node.name).length
+
+    def memory_word(self, node):
+        """ whether node is a word of a flat memory """
+        return (isinstance(node, Pointer) and isinstance(node.var, Identifier) and
+                node.var.scope is None and node.var.name in self.memories)
+
+    def memory_address(self, node):
+        """ text of the index of the word of a flat memory node in its storage """
+        offset = self.signals.get(node.var.name).offset
+        if offset == 0:
+            return self.visit_noparen(node.ptr)
+        return paren(*self.visit_expression(node.ptr)) + ' - ' + str(offset)
+
+    def visit_memory_write(self, node):
+        """
+        code of an assignment to a word of a flat memory: a nonblocking one
+        is queued until the update phase, any other one stored at once
+        """
+        template = self.env.get_template('flatmemory_write.txt')
+        word = node.left.var
+        signal = self.signals.get(word.var.name)
+        if self.native_types and signal.ctype() is not None:
+            wraps = signal.width == native_bits(signal.ctype()) and signal.ctype() != 'bool'
+            value = self.fit_value(node.right.var, signal.width, signal.signed, wraps)[0]
+        else:
+            value = self.visit(node.right)
         template_dict = {
-            'width': eval( msb + '-' + lsb + '+1' ),
+            'name' : self.visit(word.var),
+            'method' : 'write' if isinstance(node, NonblockingSubstitution) else 'store',
+            'address' : self.memory_address(word),
+            'value' : value,
             }
         rslt = template.render(template_dict)
         return rslt
 
+    def native_signal(self, node):
+        """ signal of the module a word of which is held by a native integer, or None """
+        if not self.native_types or not isinstance(node, Identifier) or node.scope is not None:
+            return None
+        signal = self.signals.get(node.name)
+        if signal is None or signal.ctype() is None or self.partial_signal(node.name):
+            return None
+        return signal
+
+    def partial_signal(self, name):
+        """
+        whether name is a signal written a part at a time, which keeps its
+        SystemC integer type: the parts are read back from the signal, so a
+        native integer would drop all but the last one written in a delta
+        cycle. A plain member takes each part at once.
+        """
+        signal = self.signals.get(name)
+        return signal is not None and signal.partial and name not in self.members
+
+    def native_select(self, node):
+        """
+        (text, wrapped) of a part or bit select of a native integer, which
+        has no range() nor bit operator, or None
+        """
+        signal = self.native_signal(node.var)
+        if signal is None or signal.is_array():
+            return None
+        var = self.visit(node.var)
+        if isinstance(node, Pointer):
+            lsb = self.visit_noparen(node.ptr)
+            width = 1
+        else:
+            msb = constant_value(node.msb)
+            lsb = constant_value(node.lsb)
+            if msb is None or lsb is None:
+                return None
+            width = msb - lsb + 1
+            lsb = str(lsb)
+        if lsb == '0':
+            return var + ' & ' + mask_literal(width), True
+        return '(' + var + ' >> ' + lsb + ') & ' + mask_literal(width), True
+
+    def native_operand(self, node):
+        """ whether node is a native integer, a select of one or a constant, within its width """
+        if isinstance(node, IntConst):
+            return literal_value(node.value) is not None
+        if isinstance(node, Identifier):
+            signal = self.native_signal(node)
+            return signal is not None and not signal.is_array()
+        if isinstance(node, (Pointer, Partselect)):
+            return self.native_signal(node.var) is not None
+        if isinstance(node, Concat):
+            return all([ self.native_operand(item) for item in node.list ])
+        return False
+
+    def native_concat(self, node):
+        """
+        (text, wrapped) of a concatenation of native integers, their bits
+        shifted into place and or'ed, or None when it does not fit one
+        """
+        widths = [ self.signals.expression_width(item) for item in node.list ]
+        if None in widths or sum(widths) > 64:
+            return None
+        if not all([ self.native_operand(item) for item in node.list ]):
+            return None
+        total = sum(widths)
+        # operands are promoted to int, which would lose the bits above 31
+        cast = '(' + native_type(total) + ')' if total > 31 else ''
+        parts = []
+        shift = total
+        for item, width in zip(node.list, widths):
+            shift -= width
+            if isinstance(item, IntConst):
+                part, wrapped = '0x%x' % (literal_value(item.value) & ((1 << width) - 1)), False
+            else:
+                part, wrapped = self.visit_expression(item)
+                if self.signals.expression_signed(item):
+                    # sign extended in its integer
+                    part, wrapped = paren(part, wrapped) + ' & ' + mask_literal(width), True
+            if shift == 0:
+                parts.append(paren(part, wrapped))
+            else:
+                parts.append('(' + cast + paren(part, wrapped) + ' << ' + str(shift) + ')')
+        if len(parts) == 1:
+            return part, wrapped
+        return ' | '.join(parts), True
+
+    def concat_item(self, item):
+        """ text of an item of a concatenation of SystemC integers """
+        width = self.signals.expression_width(item)
+        if width is not None and width <= 64 and self.native_operand(item):
+            # a native integer takes no part in the concatenation operator of sc_dt
+            return 'sc_uint<' + str(width) + '>( ' + self.visit_noparen(item) + ' )'
+        return self.visit_noparen(item)
+
+    def compared_operands(self, node):
+        """
+        (left, right) texts of the operands of a comparison, brought to the
+        width Verilog compares them in when their value can exceed it
+        """
+        width = max_width(self.signals.expression_width(node.left),
+                          self.signals.expression_width(node.right))
+        if width is None or width > 64:
+            return self.visit_operands(node)
+        fits = [ vwidth is not None and vwidth <= width
+                 for vwidth in (self.signals.value_width(node.left),
+                                self.signals.value_width(node.right)) ]
+        if all(fits):
+            return self.visit_operands(node)
+        signed = (self.signals.expression_signed(node.left) and
+                  self.signals.expression_signed(node.right))
+        operands = []
+        for operand, fit in zip((node.left, node.right), fits):
+            if fit:
+                operands.append(paren(*self.visit_expression(operand)))
+            else:
+                operands.append('(' + self.fit_value(operand, width, signed)[0] + ')')
+        return tuple(operands)
+
+    def vector_signal(self, name):
+        """ whether the signal name is declared as a sc_bv """
+        signal = self.signals.get(name)
+        if signal is None or not signal.is_vector():
+            return False
+        return not (self.native_types and signal.ctype() is not None and
+                    not self.partial_signal(name))
+
+    def is_bit_vector(self, node):
+        """ whether the value of the expression node is a sc_bv (or a part of one) """
+        if self.signals is None:
+            return False
+        def vector(n, value):
+            if isinstance(n, (Rvalue, Lvalue)):
+                return value(n.var)
+            if isinstance(n, Identifier):
+                return n.scope is None and self.vector_signal(n.name)
+            if isinstance(n, (Partselect, Pointer)):
+                return value(n.var)
+            if isinstance(n, BITWISE_OPERATORS):
+                return value(n.left) or value(n.right)
+            if isinstance(n, Unot):
+                return value(n.right)
+            if isinstance(n, Concat):
+                return all([ value(item) for item in n.list ])
+            if isinstance(n, Repeat):
+                return value(n.value)
+            if isinstance(n, Cond):
+                return value(n.true_value) and value(n.false_value)
+            return False
+        return bottom_up(node, vector)
+
+    def common_operands(self, left_node, right_node, left, right):
+        """
+        (left, right) texts of two operands brought to a common type: sc_bv
+        and sc_biguint convert to each other, so a comparison or a ternary
+        mixing them is ambiguous, and the bit vector is taken as a number
+        """
+        lvector = self.is_bit_vector(left_node)
+        rvector = self.is_bit_vector(right_node)
+        if lvector == rvector:
+            return left, right
+        operands = []
+        for node, text, vector in ((left_node, left, lvector), (right_node, right, rvector)):
+            width = self.signals.expression_width(node) if vector else None
+            if width is not None:
+                text = 'sc_biguint<' + str(width) + '>( ' + text + ' )'
+            operands.append(text)
+        return tuple(operands)
+
+    def fit_value(self, node, width, signed=False, wraps=False):
+        """
+        (text, wrapped) of the expression node assigned to width bits of a
+        native integer, masked (or sign extended) only when its value can
+        overflow them. wraps tells the conversion to the integer type
+        truncates it.
+        """
+        text, wrapped = self.visit_expression(node)
+        if wraps:
+            return text, wrapped
+        vwidth = self.signals.value_width(node)
+        if not signed and vwidth is not None and vwidth <= width:
+            return text, wrapped
+        masked = paren(text, wrapped) + ' & ' + mask_literal(width)
+        if not signed:
+            return masked, True
+        sign = mask_literal(1, width - 1)
+        return '((' + masked + ') ^ ' + sign + ') - ' + sign, True
+
+    def assignment_operands(self, node):
+        """ (left, right) texts of an assignment """
+        if not self.native_types:
+            return self.visit(node.left), self.visit(node.right)
+        var = node.left.var
+        if isinstance(var, (Pointer, Partselect)):
+            signal = self.native_signal(var.var)
+        else:
+            signal = self.native_signal(var)
+        if signal is None:
+            return self.visit(node.left), self.visit(node.right)
+        ctype = signal.ctype()
+        bits = native_bits(ctype)
+        if isinstance(var, Identifier) or signal.is_array() or signal.width == 1:
+            # the whole signal, or a word of an array
+            wraps = signal.width == bits and ctype != 'bool'
+            return (self.visit(node.left),
+                    self.fit_value(node.right.var, signal.width, signal.signed, wraps)[0])
+        # a part of the word, read, modified and written back
+        name = self.visit(var.var)
+        if isinstance(var, Pointer):
+            width = 1
+            shift = self.visit_noparen(var.ptr)
+            clear = '~((' + ctype + ')1 << ' + shift + ')'
+        else:
+            msb = constant_value(var.msb)
+            lsb = constant_value(var.lsb)
+            if msb is None or lsb is None:
+                return self.visit(node.left), self.visit(node.right)
+            width = msb - lsb + 1
+            shift = str(lsb)
+            clear = '~' + mask_literal(width, lsb)
+        value = paren(*self.fit_value(node.right.var, width))
+        if bits >= 32:
+            value = '(' + ctype + ')' + value
+        return name, '(' + name + ' & ' + clear + ') | (' + value + ' << ' + shift + ')'
+
     def visit_Identifier(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'scope' : '' if node.scope is None else self.visit(node.scope).replace('.', '::'),
@@ -227,8 +979,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Value(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -236,8 +987,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Constant(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -245,8 +995,9 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IntConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -254,8 +1005,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_FloatConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -263,8 +1013,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_StringConst(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'value' : node.value,
             }
@@ -272,8 +1021,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Variable(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -290,8 +1038,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Input(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -303,13 +1050,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Input_argument(self, node):
-        filename = getfilename(node, '_argument')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_argument')
         if node.width is None:
             width = '1'
             big = False
@@ -321,13 +1068,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Output(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -339,13 +1086,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Output_argument(self, node):
-        filename = getfilename(node, '_argument')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_argument')
         if node.width is None:
             width = '1'
             big = False
@@ -357,13 +1104,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Inout(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -375,13 +1122,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Inout_argument(self, node):
-        filename = getfilename(node, '_argument')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_argument')
         if node.width is None:
             width = '1'
             big = False
@@ -393,13 +1140,13 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Tri(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -416,8 +1163,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Wire(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -429,13 +1175,14 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
+            'member' : self.is_member(node),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Reg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -447,13 +1194,14 @@ class ASTCodeGenerator(ConvertVisitor):
             'width' : width,
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
+            'member' : self.is_member(node),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_WireArray(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -466,13 +1214,15 @@ class ASTCodeGenerator(ConvertVisitor):
             'length' : self.visit(node.length),
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
+            'member' : self.is_member(node),
+            'memory' : self.is_memory(node),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_RegArray(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         if node.width is None:
             width = '1'
             big = False
@@ -485,23 +1235,25 @@ class ASTCodeGenerator(ConvertVisitor):
             'length' : self.visit(node.length),
             'signed' : node.signed,
             'big' : big,
+            'ctype' : self.declared_type(node, width),
+            'member' : self.is_member(node),
+            'memory' : self.is_memory(node),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Integer(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'signed' : node.signed,
+            'ctype' : self.declared_type(node, 32),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Real(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -509,8 +1261,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Genvar(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             }
@@ -518,8 +1269,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Ioport(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'first' : self.visit(node.first),
             'second' : '' if node.second is None else self.visit(node.second),
@@ -528,8 +1278,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Parameter(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         value = self.visit(node.value)
         if node.width is None:
             width = '1'
@@ -548,8 +1297,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Localparam(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         value = self.visit(node.value)
         template_dict = {
             'name' : escape(node.name),
@@ -561,8 +1309,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Decl(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'items' : [ self.visit(item) for item in node.list if item.__class__.__name__ != 'Parameter'],
             }
@@ -570,8 +1317,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Decl_argument(self, node):
-        filename = getfilename(node, '_argument')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_argument')
         items = [ self.visit_argument(item) for item in node.list if item.__class__.__name__ == 'Input' or item.__class__.__name__ == 'Output' or item.__class__.__name__ == 'Inout' ]
         template_dict = {
             'items' : items,
@@ -581,8 +1327,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Decl_parameter(self, node):
-        filename = getfilename(node, '_parameter')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_parameter')
         items = [ self.visit(item) for item in node.list if item.__class__.__name__ == 'Parameter' ]
         template_dict = {
             'items' : items,
@@ -592,9 +1337,10 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Concat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        items = [ del_paren(self.visit(item)) for item in node.list ]
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        template = self.get_template(node)
+        items = [ self.visit_noparen(item) for item in node.list ]
         template_dict = {
             'items' : items,
             'len_items' : len(items),
@@ -603,9 +1349,8 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_LConcat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        items = [ del_paren(self.visit(item)) for item in node.list ]
+        template = self.get_template(node)
+        items = [ self.visit_noparen(item) for item in node.list ]
         template_dict = {
             'items' : items,
             'len_items' : len(items),
@@ -614,72 +1359,68 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Repeat(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'value' : del_paren(self.visit(node.value)),
-            'times' : del_paren(self.visit(node.times)),
+            'value' : self.visit_noparen(node.value),
+            'times' : self.visit_noparen(node.times),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Partselect(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        if self.native_types:
+            rslt = self.native_select(node)
+            if rslt is not None:
+                return paren(*rslt)
+        template = self.get_template(node)
         template_dict = {
             'var' : self.visit(node.var),
-            'msb' : del_space(del_paren(self.visit(node.msb))),
-            'lsb' : del_space(del_paren(self.visit(node.lsb))),
+            'msb' : del_space(self.visit_noparen(node.msb)),
+            'lsb' : del_space(self.visit_noparen(node.lsb)),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Pointer(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        if self.memories and self.memory_word(node):
+            return self.visit(node.var) + '[' + self.memory_address(node) + ']'
+        if self.native_types:
+            rslt = self.native_select(node)
+            if rslt is not None:
+                return paren(*rslt)
+        template = self.get_template(node)
         template_dict = {
             'var' : self.visit(node.var),
-            'ptr' : del_paren(self.visit(node.ptr)),
+            'ptr' : self.visit_noparen(node.ptr),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Lvalue(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'var' : del_paren(self.visit(node.var)),
+            'var' : self.visit_noparen(node.var),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Rvalue(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'var' : del_paren(self.visit(node.var)),
+            'var' : self.visit_noparen(node.var),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Operator(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        order = op2order(node.__class__.__name__)
-        lorder = op2order(node.left.__class__.__name__)
-        rorder = op2order(node.right.__class__.__name__)
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        if ((not isinstance(node.left, (Sll, Srl, Sra,
-                                        LessThan, GreaterThan, LessEq, GreaterEq,
-                                        Eq, NotEq, Eql, NotEql))) and
-            (lorder is not None and lorder <= order)):
-            left = del_paren(left)
-        if ((not isinstance(node.right, (Sll, Srl, Sra,
-                                         LessThan, GreaterThan, LessEq, GreaterEq,
-                                         Eq, NotEq, Eql, NotEql))) and
-            (rorder is not None and order > rorder)):
-            right = del_paren(right)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        template = self.get_template(node)
+        left, right = self.visit_operands(node)
         template_dict = {
             'left' : left,
             'right' : right,
@@ -689,8 +1430,9 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_UnaryOperator(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if node.__class__ in self.expression_emitters:
+            return self.emit(node)
+        template = self.get_template(node)
         right = self.visit(node.right)
         template_dict = {
             'right' : right,
@@ -799,14 +1541,16 @@ class ASTCodeGenerator(ConvertVisitor):
         return self.visit_Operator(node)
 
     def visit_Cond(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        true_value = del_paren(self.visit(node.true_value))
-        false_value = del_paren(self.visit(node.false_value))
+        template = self.get_template(node)
+        true_value = self.visit_noparen(node.true_value)
+        false_value = self.visit_noparen(node.false_value)
+        if self.wide_types:
+            true_value, false_value = self.common_operands(node.true_value, node.false_value,
+                                                           true_value, false_value)
         if isinstance(node.false_value, Cond):
             false_value = ''.join( ['\n', false_value] )
         template_dict = {
-            'cond' : del_paren(self.visit(node.cond)),
+            'cond' : self.visit_noparen(node.cond),
             'true_value' : true_value,
             'false_value' : false_value,
             }
@@ -814,19 +1558,20 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Assign(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.memories and self.memory_word(node.left.var):
+            return self.visit_memory_write(node)
+        template = self.get_template(node)
+        left, right = self.assignment_operands(node)
         template_dict = {
-            'left' : self.visit(node.left),
-            'right' : self.visit(node.right),
+            'left' : left,
+            'right' : right,
             }
         rslt = template.render(template_dict)
         rslt = indent_multiline_assign(rslt)
         return rslt
 
     def visit_Always(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'lineno' : str(node.lineno),
             'statement' : self.visit(node.statement),
@@ -835,39 +1580,114 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Always_process(self, node):
-        filename = getfilename(node, '_process')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_process')
         clock_sens = ''
         reset_sens = ''
         for sens in node.sens_list.list:
+            if sens.sig is None:
+                continue # @*
             if sens.sig.name == self.clock_name:
                 clock_sens = self.visit(sens)
             if sens.sig.name == self.reset_name:
-                reset_sens = self.visit(sens)
-                reset_sens = reset_sens.replace('.pos()', ', true')
-                reset_sens = reset_sens.replace('.neg()', ', false')
+                reset_sens = '*' if sens.type == 'all' else self.visit(sens.sig)
+                reset_sens += SENS_RESET_LEVEL.get(sens.type, '')
+        method = self.clocked_methods and clock_sens != ''
+        if method:
+            # woken by the clock and reset edges, the reset branch of the
+            # statement runs on each call instead of restarting a thread
+            sens_list = self.visit_sensitivity([ self.visit(sens) for sens in node.sens_list.list ],
+                                               escaped=True)
+        elif is_combinational(node) and (self.infer_sensitivity or is_wildcard(node)):
+            # @* has no list of its own to emit
+            sens_list = self.visit_sensitivity(self.sensitivity(node.statement))
+        else:
+            sens_list = self.visit(node.sens_list)
         template_dict = {
             'lineno' : str(node.lineno),
             'clock_sens' : clock_sens,
             'reset_sens' : reset_sens,
-            'sens_list' : self.visit(node.sens_list),
+            'sens_list' : sens_list,
+            'method' : method,
+            }
+        rslt = template.render(template_dict)
+        return rslt
+
+    def sensitivity(self, node):
+        """
+        signals of the module a combinational statement reads, in order. A
+        signal it writes itself stays in the list: its new value is only
+        read once the process runs again. Plain members and flat memories
+        are not signals and are left out.
+        """
+        names = []
+        for name in reads(node):
+            if (name in self.signals and name not in self.members and name not in self.memories and
+                name not in names):
+                names.append(name)
+        return names
+
+    def visit_sensitivity(self, names, escaped=False):
+        template = self.templates[(SensList, '')]
+        items = names if escaped else [ escape(name) for name in names ]
+        template_dict = {
+            'items' : items,
+            'len_items' : len(items),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Always_declaration(self, node):
-        filename = getfilename(node, '_declaration')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_declaration')
         template_dict = {
             'lineno' : str(node.lineno),
             }
         rslt = template.render(template_dict)
         return rslt
 
+    def visit_Evaluation(self, node):
+        template = self.get_template(node)
+        template_dict = {
+            'statements' : [ self.indent(self.visit_evaluated(item)) for item in node.items ],
+            }
+        rslt = template.render(template_dict)
+        return rslt
+
+    def visit_evaluated(self, node):
+        """ code of a combinational item inside the evaluation method """
+        if isinstance(node, Always):
+            return self.visit(node.statement)
+        # a continuous assignment becomes a blocking one
+        template = self.templates[(BlockingSubstitution, '')]
+        left, right = self.assignment_operands(node)
+        template_dict = {
+            'left' : left,
+            'right' : right,
+            'ldelay' : '',
+            'rdelay' : '',
+            }
+        rslt = template.render(template_dict)
+        rslt = indent_multiline_assign(rslt)
+        return rslt
+
+    def visit_Evaluation_process(self, node):
+        template = self.get_template(node, '_process')
+        template_dict = {
+            'sens' : [ escape(name) for name in node.sensitivity ],
+            'len_sens' : len(node.sensitivity),
+            }
+        rslt = template.render(template_dict)
+        return rslt
+
+    def visit_Evaluation_declaration(self, node):
+        template = self.get_template(node, '_declaration')
+        template_dict = {}
+        rslt = template.render(template_dict)
+        return rslt
+
     def visit_SensList(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        items = [ self.visit(item) for item in node.list if item.sig.name != self.clock_name and item.sig.name != self.reset_name]
+        template = self.get_template(node)
+        items = [ self.visit(item) for item in node.list
+                  if item.sig is not None and item.sig.name != self.clock_name and item.sig.name != self.reset_name ]
         template_dict = {
             'items' : items,
             'len_items' : len(items),
@@ -876,8 +1696,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Sens(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'sig' : '*' if node.type == 'all' else self.visit(node.sig),
             'type' : node.type[0:3] if node.type == 'posedge' or node.type == 'negedge' else ''
@@ -886,11 +1705,13 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Substitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.memories and self.memory_word(node.left.var):
+            return self.visit_memory_write(node)
+        template = self.get_template(node)
+        left, right = self.assignment_operands(node)
         template_dict = {
-            'left' : self.visit(node.left),
-            'right' : self.visit(node.right),
+            'left' : left,
+            'right' : right,
             'ldelay' : '' if node.ldelay is None else self.visit(node.ldelay),
             'rdelay' : '' if node.rdelay is None else self.visit(node.rdelay),
             }
@@ -899,11 +1720,13 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_BlockingSubstitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.memories and self.memory_word(node.left.var):
+            return self.visit_memory_write(node)
+        template = self.get_template(node)
+        left, right = self.assignment_operands(node)
         template_dict = {
-            'left' : self.visit(node.left),
-            'right' : self.visit(node.right),
+            'left' : left,
+            'right' : right,
             'ldelay' : '' if node.ldelay is None else self.visit(node.ldelay),
             'rdelay' : '' if node.rdelay is None else self.visit(node.rdelay),
             }
@@ -912,11 +1735,13 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_NonblockingSubstitution(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.memories and self.memory_word(node.left.var):
+            return self.visit_memory_write(node)
+        template = self.get_template(node)
+        left, right = self.assignment_operands(node)
         template_dict = {
-            'left' : self.visit(node.left),
-            'right' : self.visit(node.right),
+            'left' : left,
+            'right' : right,
             'ldelay' : '' if node.ldelay is None else self.visit(node.ldelay),
             'rdelay' : '' if node.rdelay is None else self.visit(node.rdelay),
             }
@@ -925,12 +1750,11 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IfStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         true_statement = '' if node.true_statement is None else self.visit(node.true_statement)
         false_statement = '' if node.false_statement is None else self.visit(node.false_statement)
         template_dict = {
-            'cond' : del_paren(self.visit(node.cond)),
+            'cond' : self.visit_noparen(node.cond),
             'true_statement' : true_statement,
             'false_statement' : false_statement,
             }
@@ -938,11 +1762,10 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ForStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'pre' : '' if node.pre is None else self.visit(node.pre),
-            'cond' : '' if node.cond is None else del_paren(self.visit(node.cond)),
+            'cond' : '' if node.cond is None else self.visit_noparen(node.cond),
             'post' : '' if node.post is None else self.visit(node.post).replace(';', ''),
             'statement' : '' if node.statement is None else self.visit(node.statement),
             }
@@ -950,39 +1773,35 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_WhileStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'cond' : '' if node.cond is None else del_paren(self.visit(node.cond)),
+            'cond' : '' if node.cond is None else self.visit_noparen(node.cond),
             'statement' : '' if node.statement is None else self.visit(node.statement),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_CaseStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'comp' : del_paren(self.visit(node.comp)),
+            'comp' : self.visit_noparen(node.comp),
             'caselist' : [ self.indent(self.visit(case)) for case in node.caselist ],
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_CasexStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'comp' : del_paren(self.visit(node.comp)),
+            'comp' : self.visit_noparen(node.comp),
             'caselist' : [ self.indent(self.visit(case)) for case in node.caselist ],
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Case(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
-        condlist = [ 'default' ] if node.cond is None else [ del_paren(self.visit(c)) for c in node.cond ]
+        template = self.get_template(node)
+        condlist = [ 'default' ] if node.cond is None else [ self.visit_noparen(c) for c in node.cond ]
         template_dict = {
             'condlist' : condlist,
             'statement' : self.visit(node.statement),
@@ -991,8 +1810,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Block(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'scope' : '' if node.scope is None else escape(node.scope),
             'statements' : [ self.indent(self.visit(statement)) for statement in node.statements ],
@@ -1001,8 +1819,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Initial(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : 'initial_at_line_' + str(node.lineno),
             'statement' : self.visit(node.statement),
@@ -1011,8 +1828,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Initial_process(self, node):
-        filename = getfilename(node, '_process')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_process')
         template_dict = {
             'name' : 'initial_at_line_' + str(node.lineno),
             }
@@ -1020,8 +1836,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Initial_declaration(self, node):
-        filename = getfilename(node, '_declaration')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_declaration')
         template_dict = {
             'name' : 'initial_at_line_' + str(node.lineno),
             }
@@ -1029,27 +1844,24 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_EventStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'senslist': del_paren(self.visit(node.senslist)),
+            'senslist': self.visit_noparen(node.senslist),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_WaitStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
-            'cond': del_paren(self.visit(node.cond)),
+            'cond': self.visit_noparen(node.cond),
             'statement' : self.visit(node.statement) if node.statement else '',
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_ForeverStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'statement' : self.visit(node.statement),
             }
@@ -1057,8 +1869,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_DelayStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'delay' : self.visit(node.delay),
             }
@@ -1066,8 +1877,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_InstanceList(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         parameterlist = [ self.indent(self.visit(param)) for param in node.parameterlist ]
         instances = [ self.visit(instance) for instance in node.instances ]
         template_dict = {
@@ -1081,8 +1891,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Instance(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         array = '' if node.array is None else self.visit(node.array)
         portlist = [ self.indent(self.visit(port)) for port in node.portlist ]
         template_dict = {
@@ -1095,28 +1904,25 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ParamArg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'paramname' : '' if node.paramname is None else escape(node.paramname),
-            'argname' : '' if node.argname is None else del_paren(self.visit(node.argname)),
+            'argname' : '' if node.argname is None else self.visit_noparen(node.argname),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_PortArg(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'portname' : '' if node.portname is None else escape(node.portname),
-            'argname' : '' if node.argname is None else del_paren(self.visit(node.argname)),
+            'argname' : '' if node.argname is None else self.visit_noparen(node.argname),
             }
         rslt = template.render(template_dict)
         return rslt
 
     def visit_Function(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         arguments = [ self.visit_argument(s) for s in node.statement ]
         statements = [ self.visit(s) for s in node.statement ]
         statements = [ statement for statement in statements if not statement.startswith('sc_in<') and not statement.startswith('sc_out<') and not statement.startswith('sc_inout<') ]
@@ -1131,8 +1937,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Function_declaration(self, node):
-        filename = getfilename(node, '_declaration')
-        template = self.env.get_template(filename)
+        template = self.get_template(node, '_declaration')
         arguments = [ self.visit_argument(s) for s in node.statement ]
         statements = [ self.indent(self.visit(s)) for s in node.statement ]
         template_dict = {
@@ -1146,8 +1951,9 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_FunctionCall(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        if self.render_cache is not None:
+            self.render_cache.line_dependent()
+        template = self.get_template(node)
         args = [ self.visit(arg) for arg in node.args ]
         template_dict = {
             'name' : self.visit(node.name),
@@ -1159,8 +1965,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Task(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         statement = [ self.indent(self.visit(s)) for s in node.statement ]
         template_dict = {
             'name' : escape(node.name),
@@ -1170,8 +1975,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     #def visit_TaskCall(self, node):
-    #    filename = getfilename(node)
-    #    template = self.env.get_template(filename)
+    #    template = self.get_template(node)
     #    args = [ self.visit(arg) for arg in node.args ]
     #    template_dict = {
     #        'name' : self.visit(node.name),
@@ -1182,8 +1986,7 @@ class ASTCodeGenerator(ConvertVisitor):
     #    return rslt
 
     def visit_GenerateStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'items' : [ self.visit(item) for item in node.items ]
             }
@@ -1191,8 +1994,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_SystemCall(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         args = [ self.visit(arg) for arg in node.args ]
         template_dict = {
             'syscall' : escape(node.syscall),
@@ -1203,8 +2005,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IdentifierScopeLabel(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'loop' : '' if node.loop is None else self.visit(node.loop),
@@ -1213,8 +2014,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_IdentifierScope(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         scopes = [ self.visit(scope) for scope in node.labellist ]
         template_dict = {
             'scopes' : scopes,
@@ -1223,8 +2023,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Pragma(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'entry' : self.visit(node.entry),
             }
@@ -1232,8 +2031,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_PragmaEntry(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.name),
             'value' : '' if node.value is None else self.visit(node.value),
@@ -1242,8 +2040,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_Disable(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'name' : escape(node.dest),
             }
@@ -1251,8 +2048,7 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_ParallelBlock(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'scope' : '' if node.scope is None else escape(node.scope),
             'statements' : [ self.indent(self.visit(statement)) for statement in node.statements ],
@@ -1261,15 +2057,35 @@ class ASTCodeGenerator(ConvertVisitor):
         return rslt
 
     def visit_SingleStatement(self, node):
-        filename = getfilename(node)
-        template = self.env.get_template(filename)
+        template = self.get_template(node)
         template_dict = {
             'statement' : self.visit(node.statement),
             }
         rslt = template.render(template_dict)
         return rslt
 
-def main():
+def warmup(cache_dir=None):
+    """ build the parser and compile the templates, for the daemon to share them """
+    shared_parser(cache_dir)
+    ASTCodeGenerator(cache_dir=cache_dir)
+
+def profile_startup(cache_dir=None, use_cache=True):
+    """ time spent before any conversion, once per process """
+    start = time.time()
+    VerilogParser(cache_dir)
+    tables = time.time() - start
+    start = time.time()
+    ASTCodeGenerator(cache_dir=cache_dir, use_cache=use_cache)
+    templates = time.time() - start
+    report = [
+        'import          : %8.1f ms' % (IMPORT_TIME * 1e3),
+        'parser tables   : %8.1f ms (%s)' % (tables * 1e3, table_file(cache_dir) or 'not cached'),
+        'templates       : %8.1f ms' % (templates * 1e3),
+        'total           : %8.1f ms' % ((IMPORT_TIME + tables + templates) * 1e3),
+        ]
+    return '\n'.join(report)
+
+def main(args=None):
     INFO = "Code converter from AST"
     VERSION = pyverilog.utils.version.VERSION
     USAGE = "Usage: python example_codegen.py file ..."
@@ -1287,30 +2103,106 @@ def main():
                          default=[],help="Include path")
     optparser.add_option("-D",dest="define",action="append",
                          default=[],help="Macro Definition")
-    (options, args) = optparser.parse_args()
+    optparser.add_option("--cache-dir",dest="cache_dir",
+                         default=None,help="Template and parse cache directory, default=$V2SC_CACHE_DIR or ~/.cache/v2sc")
+    optparser.add_option("--no-template-cache",action="store_false",dest="use_cache",
+                         default=True,help="Do not use the compiled template cache")
+    optparser.add_option("--no-parse-cache",action="store_false",dest="use_parse_cache",
+                         default=True,help="Do not use the parse cache")
+    optparser.add_option("--parse-cache-size",dest="parse_cache_size",type="int",
+                         default=DEFAULT_MAX_SIZE // (1024 * 1024),help="Size limit of the parse cache in MB, default=%default")
+    optparser.add_option("-j","--jobs",dest="jobs",type="int",
+                         default=1,help="Number of processes parsing the files, default=%default")
+    optparser.add_option("-o","--output",dest="output",
+                         default=None,help="Output file, default=stdout")
+    optparser.add_option("--stream",action="store_true",dest="stream",
+                         default=False,help="Write the output incrementally, one module item at a time")
+    optparser.add_option("--render-cache",action="store_true",dest="render_cache",
+                         default=False,help="Render repeated expressions once and report the hit rate")
+    optparser.add_option("--native-types",action="store_true",dest="native_types",
+                         default=False,help="Declare signals of up to 64 bits with C++ integer types, masked where they can overflow")
+    optparser.add_option("--wide-types",action="store_true",dest="wide_types",
+                         default=False,help="Declare wide signals never used as numbers as sc_bv instead of sc_biguint")
+    optparser.add_option("--levelize",action="store_true",dest="levelize",
+                         default=False,help="Evaluate the combinational logic of each module in one method, in dependency order")
+    optparser.add_option("--demote-signals",action="store_true",dest="demote_signals",
+                         default=False,help="Hold the internal signals only one process uses in plain members")
+    optparser.add_option("--infer-sensitivity",action="store_true",dest="infer_sensitivity",
+                         default=False,help="Make combinational processes sensitive to the signals they read, instead of their Verilog list")
+    optparser.add_option("--clocked-methods",action="store_true",dest="clocked_methods",
+                         default=False,help="Emit clocked always blocks as SC_METHODs sensitive to their edges instead of SC_CTHREADs")
+    optparser.add_option("--flat-memories",action="store_true",dest="flat_memories",
+                         default=False,help="Hold memories in flat arrays with queued writes instead of one signal per word")
+    optparser.add_option("--manifest",dest="manifest",
+                         default=None,help="Reuse the code of the modules unchanged since the run that wrote this manifest, and update it")
+    optparser.add_option("--daemon",action="store_true",dest="daemon",
+                         default=False,help="Serve conversions to v2sc_client.py on a Unix socket")
+    optparser.add_option("--socket",dest="socket",
+                         default=daemon.DEFAULT_SOCKET,help="Socket of the daemon, default=$V2SC_SOCKET or <cache dir>/daemon.sock")
+    optparser.add_option("--profile-startup",action="store_true",dest="profile_startup",
+                         default=False,help="Report the time spent on imports, parser tables and templates")
+    optparser.add_option("--snapshot",dest="snapshot",
+                         default=None,help="Read the design from a snapshot instead of the source files")
+    optparser.add_option("--save-snapshot",dest="save_snapshot",
+                         default=None,help="Save the parsed design as a snapshot")
+    (options, args) = optparser.parse_args(args)
 
     filelist = args
     if options.showversion:
         showVersion()
 
+    if options.daemon:
+        daemon.serve(main, options.socket, lambda: warmup(options.cache_dir))
+        return
+
+    if options.profile_startup:
+        print(profile_startup(options.cache_dir, options.use_cache), file=sys.stderr)
+        if len(filelist) == 0 and options.snapshot is None:
+            return
+
     for f in filelist:
         if not os.path.exists(f): raise IOError("file not found: " + f)
 
-    if len(filelist) == 0:
+    if len(filelist) == 0 and options.snapshot is None:
         showVersion()
 
-    codeparser = VerilogCodeParser(filelist,
-                                   preprocess_include=options.include,
-                                   preprocess_define=options.define)
-
-    ast = codeparser.parse()
-    directives = codeparser.get_directives()
-
-    ast.show();
-
-    codegen = ASTCodeGenerator()
-    rslt = codegen.visit(ast)
-    print(rslt)
+    if options.snapshot is not None:
+        ast, directives = snapshot.load(options.snapshot)
+    else:
+        parsecache = None
+        if options.use_parse_cache:
+            parsecache = ParseCache(options.cache_dir, options.parse_cache_size * 1024 * 1024)
+        ast, directives = parallelparse.parse(filelist, options.jobs,
+                                              preprocess_include=options.include,
+                                              preprocess_define=options.define,
+                                              parsecache=parsecache,
+                                              cache_dir=options.cache_dir)
+    if options.save_snapshot is not None:
+        snapshot.save(ast, options.save_snapshot, directives)
+
+    ast.show(buf=sys.stdout);
+
+    codegen = ASTCodeGenerator(cache_dir=options.cache_dir, use_cache=options.use_cache,
+                               render_cache=options.render_cache, manifest=options.manifest,
+                               native_types=options.native_types, wide_types=options.wide_types,
+                               levelize=options.levelize, demote_signals=options.demote_signals,
+                               infer_sensitivity=options.infer_sensitivity,
+                               clocked_methods=options.clocked_methods,
+                               flat_memories=options.flat_memories)
+    out = sys.stdout if options.output is None else open(options.output, 'w')
+    if options.stream:
+        codegen.write(ast, out)
+        out.write('\n')
+    else:
+        rslt = codegen.visit(ast)
+        out.write(rslt + '\n')
+    if out is not sys.stdout:
+        out.close()
+    if codegen.render_cache is not None:
+        print(codegen.render_cache.report(), file=sys.stderr)
+    if codegen.manifest is not None:
+        codegen.manifest.save()
+        print(codegen.manifest.report(), file=sys.stderr)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,27 @@
+#-------------------------------------------------------------------------------
+# v2sc_client.py
+#
+# Drop-in replacement of the v2sc.py command line, converting through the
+# daemon started with 'v2sc.py --daemon'. Without a daemon listening, the
+# conversion runs in this process as v2sc.py would.
+#-------------------------------------------------------------------------------
+from __future__ import absolute_import
+from __future__ import print_function
+import sys
+
+import daemon
+
+def main():
+    path = daemon.DEFAULT_SOCKET
+    try:
+        status, stdout, stderr = daemon.request(sys.argv[1:], path)
+    except (IOError, OSError, EOFError):
+        import v2sc
+        v2sc.main()
+        return
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    sys.exit(status)
+
+if __name__ == '__main__':
+    main()